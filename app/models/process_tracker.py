@@ -1,4 +1,5 @@
 # models/process_tracker.py
+import json
 import logging
 import os
 import re
@@ -77,11 +78,12 @@ class ProcessTracker:
         # Regex patterns for extracting information from the process output
         article_found_pattern = re.compile(r'Processing article (\d+)/(\d+)')
         total_pattern = re.compile(r'Processing complete\. (\d+) articles processed')
-        processed_pattern = re.compile(r'Version saved to: (.*?)\.json')
+        processed_pattern = re.compile(r'Version saved: (\S+)')
         results_found_pattern = re.compile(r'Found (\d+) total results for query .*, processing up to (\d+)')
         date_range_pattern = re.compile(r'Searching for period: (\d{4})-(\d{4}|\d{4})')
         scope_pattern = re.compile(r'SEARCH_SCOPE: total_years=(\d+)')
         year_progress_pattern = re.compile(r'YEAR_PROGRESS: current_year=(\d+) total_years=(\d+)')
+        plan_pattern = re.compile(r'SEARCH_PLAN: (\{.*\})')
         total_years = 1
         current_year = 0
 
@@ -140,6 +142,19 @@ class ProcessTracker:
                     })
                     continue
 
+                # Plan of the search (hit count per period), shown before the crawl
+                plan_match = plan_pattern.search(line)
+                if plan_match:
+                    try:
+                        plan = json.loads(plan_match.group(1))
+                    except json.JSONDecodeError as e:
+                        logger.error(f"Could not parse search plan: {str(e)}")
+                        continue
+                    queue.put(f"Plan: {plan['planned_articles']} articles planned over "
+                              f"{len(plan['periods']) - len(plan['empty_periods'])} periods with results")
+                    self.emit_socketio_event('search_plan', plan)
+                    continue
+
                 # Check if line contains information about the date range being searched
                 date_range_match = date_range_pattern.search(line)
                 if date_range_match:
@@ -161,29 +176,30 @@ class ProcessTracker:
                         'period': current_period
                     })
 
-                # When an article is saved, extract path and add to queue
+                # When an article is saved, extract its version id and add to queue
                 processed_match = processed_pattern.search(line)
                 if processed_match:
-                    json_path = processed_match.group(1) + '.json'
+                    version_id = processed_match.group(1)
                     # Send this message to queue to display in web app
-                    queue.put(f"Article saved to: {json_path}")
+                    queue.put(f"Article saved: {version_id}")
 
                     # Also emit using socketio for immediate display
                     self.emit_socketio_event('article_saved', {
-                        'path': json_path,
+                        'version_id': version_id,
                         'period': current_period
                     })
 
                     try:
-                        with open(json_path, 'r', encoding='utf-8') as f:
-                            import json
-                            article_data = json.load(f)
-                            queue.put(f"Article: {article_data.get('title', 'No title')}")
-                            queue.put(f"Source: {article_data.get('newspaper', 'Unknown')} ({article_data.get('date', 'Unknown')})")
-                            queue.put(f"URL: {article_data.get('url', 'No URL')}")
-                            queue.put("---")
+                        from newspapers_scrap.data_manager.storage import get_storage
+                        article_data = get_storage().get_version(version_id)
                     except Exception as e:
+                        article_data = None
                         queue.put(f"Error reading article data: {str(e)}")
+                    if article_data:
+                        queue.put(f"Article: {article_data.get('title', 'No title')}")
+                        queue.put(f"Source: {article_data.get('newspaper', 'Unknown')} ({article_data.get('date', 'Unknown')})")
+                        queue.put(f"URL: {article_data.get('url', 'No URL')}")
+                        queue.put("---")
 
                 # Process progress information
                 progress_match = article_found_pattern.search(line)
@@ -1,8 +1,5 @@
 # routes/article_routes.py
 import logging
-import os
-import glob
-import json
 import yaml
 from pathlib import Path
 from flask import jsonify, request, render_template, current_app
@@ -22,10 +19,12 @@ def correct_file(topic, filename):
     Accepte la méthode de correction via JSON et traite l'article
     en utilisant le service de correction approprié.
     """
-    file_path = os.path.join('data', 'by_topic', topic, filename)
+    from newspapers_scrap.data_manager.storage import get_storage
 
-    # Vérification de l'existence du fichier
-    if not os.path.exists(file_path) or not file_path.endswith('.json'):
+    base_id = Path(filename).stem
+
+    # Vérification de l'existence de l'article
+    if not filename.endswith('.json') or get_storage().get_article(base_id) is None:
         return jsonify({'error': 'Fichier introuvable'}), 404
 
     try:
@@ -34,7 +33,7 @@ def correct_file(topic, filename):
         correction_method = data.get('correction_method', 'symspell')
 
         # Traitement de la correction via le service dédié
-        success, error_message, result = process_article_correction(file_path, correction_method)
+        success, error_message, result = process_article_correction(base_id, correction_method)
 
         if not success:
             return jsonify({'error': error_message}), 500
@@ -42,7 +41,7 @@ def correct_file(topic, filename):
         return jsonify(result)
 
     except Exception as e:
-        logger.error(f"Erreur lors de la correction du fichier {file_path}: {str(e)}")
+        logger.error(f"Erreur lors de la correction de l'article {base_id}: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 
@@ -63,6 +62,8 @@ def mongodb_page():
 @article_bp.route('/api/mongodb/push', methods=['POST'])
 def push_to_mongodb():
     """Push processed articles to MongoDB"""
+    from newspapers_scrap.data_manager.storage import get_storage
+
     # Get request parameters
     data = request.get_json(silent=True) or {}
     only_new = data.get('onlyNew', False)
@@ -75,12 +76,9 @@ def push_to_mongodb():
     db = client[mongo_conf.get("database", "articles")]
     collection = db[mongo_conf.get("collection", "press_processed")]
     
-    # Directory with processed articles
-    data_dir = Path(__file__).resolve().parent.parent.parent / "data" / "processed"
-    
-    # Find all JSON files in processed directory
-    json_files = glob.glob(str(data_dir / "*.json"))
-    total_files = len(json_files)
+    # Stored articles (main records, i.e. the latest version of each article)
+    storage = get_storage()
+    total_files = storage.count_articles()
     
     # Initialize counters
     inserted = 0
@@ -115,34 +113,32 @@ def push_to_mongodb():
             'skipped': 0
         })
     
-    # Process each file
-    for i, file_path in enumerate(json_files):
+    # Process each article
+    for i, article in enumerate(storage.iter_articles()):
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                article = json.load(f)
-                article_id = article['id']
-                
-                # Check if article exists in MongoDB
-                if only_new and article_id in existing_ids:
-                    skipped += 1
-                else:
-                    # Insert into MongoDB (upsert by 'id' if needed)
-                    collection.update_one({'id': article_id}, {'$set': article}, upsert=True)
-                    inserted += 1
-                
-                # Update progress every 10 files or at the end
-                if i % 10 == 0 or i == total_files - 1:
-                    progress = {
-                        'status': 'Processing articles...',
-                        'current': i + 1,
-                        'total': total_files,
-                        'percentage': round((i + 1) / total_files * 100, 1),
-                        'inserted': inserted,
-                        'skipped': skipped
-                    }
-                    current_app.socketio.emit('mongodb_progress', progress)
+            article_id = article['id']
+
+            # Check if article exists in MongoDB
+            if only_new and article_id in existing_ids:
+                skipped += 1
+            else:
+                # Insert into MongoDB (upsert by 'id' if needed)
+                collection.update_one({'id': article_id}, {'$set': article}, upsert=True)
+                inserted += 1
+
+            # Update progress every 10 articles or at the end
+            if i % 10 == 0 or i == total_files - 1:
+                progress = {
+                    'status': 'Processing articles...',
+                    'current': i + 1,
+                    'total': total_files,
+                    'percentage': round((i + 1) / total_files * 100, 1),
+                    'inserted': inserted,
+                    'skipped': skipped
+                }
+                current_app.socketio.emit('mongodb_progress', progress)
         except Exception as e:
-            current_app.logger.error(f"Error processing file {file_path}: {str(e)}")
+            current_app.logger.error(f"Error processing article {article.get('base_id')}: {str(e)}")
     
     # Return final result
     result = {
@@ -1,6 +1,3 @@
-import os
-import glob
-import json
 import yaml
 from pathlib import Path
 from flask import Blueprint, jsonify, current_app, request, render_template
@@ -25,6 +22,8 @@ def mongodb_page():
 @mongodb_bp.route('/api/mongodb/push', methods=['POST'])
 def push_to_mongodb():
     """Push processed articles to MongoDB"""
+    from newspapers_scrap.data_manager.storage import get_storage
+
     # Get MongoDB configuration
     mongo_conf = get_mongo_config()
     
@@ -33,36 +32,31 @@ def push_to_mongodb():
     db = client[mongo_conf.get("database", "articles")]
     collection = db[mongo_conf.get("collection", "press_processed")]
     
-    # Directory with processed articles
-    data_dir = Path(__file__).resolve().parent.parent.parent / "data" / "processed"
-    
-    # Find all JSON files in processed directory
-    json_files = glob.glob(str(data_dir / "*.json"))
-    total_files = len(json_files)
+    # Stored articles (main records, i.e. the latest version of each article)
+    storage = get_storage()
+    total_files = storage.count_articles()
     
     # Initialize counters
     inserted = 0
     
-    # Process each file
-    for i, file_path in enumerate(json_files):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            try:
-                article = json.load(f)
-                # Insert into MongoDB (upsert by 'id' if needed)
-                collection.update_one({'id': article['id']}, {'$set': article}, upsert=True)
-                inserted += 1
-                
-                # Update progress every 10 files or at the end
-                if i % 10 == 0 or i == total_files - 1:
-                    progress = {
-                        'current': i + 1,
-                        'total': total_files,
-                        'percentage': round((i + 1) / total_files * 100, 1),
-                        'inserted': inserted
-                    }
-                    current_app.socketio.emit('mongodb_progress', progress)
-            except Exception as e:
-                current_app.logger.error(f"Error processing file {file_path}: {str(e)}")
+    # Process each article
+    for i, article in enumerate(storage.iter_articles()):
+        try:
+            # Insert into MongoDB (upsert by 'id' if needed)
+            collection.update_one({'id': article['id']}, {'$set': article}, upsert=True)
+            inserted += 1
+
+            # Update progress every 10 articles or at the end
+            if i % 10 == 0 or i == total_files - 1:
+                progress = {
+                    'current': i + 1,
+                    'total': total_files,
+                    'percentage': round((i + 1) / total_files * 100, 1),
+                    'inserted': inserted
+                }
+                current_app.socketio.emit('mongodb_progress', progress)
+        except Exception as e:
+            current_app.logger.error(f"Error processing article {article.get('base_id')}: {str(e)}")
     
     # Return final result
     result = {
@@ -8,7 +8,7 @@ from flask import jsonify, request, current_app
 from threading import Thread
 
 from . import search_bp
-from services.search import start_search
+from services.search import list_interrupted_searches, start_search
 
 logger = logging.getLogger(__name__)
 
@@ -132,4 +132,19 @@ def search_status():
     else:
         status['overall_progress'] = 0
 
-    return jsonify(status)
\ No newline at end of file
+    return jsonify(status)
+
+
+@search_bp.route('/api/search/interrupted', methods=['GET'])
+def interrupted_searches():
+    """
+    Liste les recherches interrompues qui peuvent être reprises depuis leurs points de reprise
+    """
+    try:
+        return jsonify({'jobs': list_interrupted_searches()})
+    except Exception as e:
+        logger.error(f"Erreur lors de la lecture des recherches interrompues: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'error': str(e)
+        }), 500
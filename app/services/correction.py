@@ -1,12 +1,8 @@
 # services/correction.py
-import json
 import logging
 import os
 import tempfile
 from datetime import datetime
-from pathlib import Path
-
-from utils.file import read_json_file, write_json_file, ensure_directory
 
 logger = logging.getLogger(__name__)
 
@@ -73,12 +69,11 @@ def correct_article_content(article_data, correction_method):
     return corrected_text, success
 
 
-def save_corrected_article(file_path, article_data, corrected_text, correction_method):
+def save_corrected_article(article_data, corrected_text, correction_method):
     """
     Sauvegarde l'article corrigé et crée une nouvelle version.
 
     Args:
-        file_path: Chemin du fichier de l'article
         article_data: Dictionnaire contenant les données de l'article
         corrected_text: Texte corrigé à sauvegarder
         correction_method: Méthode de correction utilisée
@@ -86,7 +81,11 @@ def save_corrected_article(file_path, article_data, corrected_text, correction_m
     Returns:
         Tuple contenant (booléen de succès, nombre de mots, dictionnaire de la version)
     """
+    from newspapers_scrap.data_manager.storage import get_storage
+
     try:
+        storage = get_storage()
+
         # Mettre à jour les données de l'article
         article_data.update({
             'content': corrected_text,
@@ -94,32 +93,20 @@ def save_corrected_article(file_path, article_data, corrected_text, correction_m
             'correction_method': correction_method,
             'word_count': len(corrected_text.split())
         })
-
-        # Sauvegarder le fichier mis à jour en utilisant notre fonction utilitaire
-        if not write_json_file(file_path, article_data):
-            return False, 0, None
+        base_id = article_data.setdefault('base_id', article_data.get('id'))
 
         # Créer une nouvelle version de l'article
         version_id = f"{article_data['id']}_{correction_method}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        base_id = article_data.get('base_id') or article_data.get('id')
-        versions_dir = Path('data') / 'processed' / 'versions' / base_id
-
-        # Assurer que le répertoire existe
-        ensure_directory(versions_dir)
-
         version_data = article_data.copy()
         version_data.update({
             'id': version_id,
             'base_id': base_id,
             'created_at': datetime.now().isoformat()
         })
+        # Sauvegarder la version et l'enregistrement principal mis à jour ensemble
+        storage.save_article_version(version_data, article_data)
 
-        version_path = versions_dir / f"{version_id}.json"
-        # Utilisation de la fonction utilitaire pour écrire le fichier
-        if not write_json_file(version_path, version_data):
-            return False, 0, None
-
-        logger.info(f"Version sauvegardée: {version_path}")
+        logger.info(f"Version sauvegardée: {version_id}")
 
         return True, article_data['word_count'], version_data
 
@@ -138,48 +125,33 @@ def get_article_versions(base_id):
     Returns:
         Liste de dictionnaires contenant les métadonnées des versions
     """
-    versions_dir = Path('data') / 'processed' / 'versions' / base_id
-    if not versions_dir.exists():
-        return []
-
-    versions = []
-    for version_file in versions_dir.glob('*.json'):
-        try:
-            # Utilisation de notre fonction utilitaire pour lire le fichier JSON
-            version_data = read_json_file(version_file)
-            versions.append({
-                'id': version_data['id'],
-                'correction_method': version_data.get('correction_method', 'none'),
-                'language': version_data.get('language', 'fr'),
-                'word_count': version_data.get('word_count', 0),
-                'created_at': version_data.get('created_at', ''),
-                'path': str(version_file)
-            })
-        except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
-            logger.warning(f"Erreur lors de la lecture du fichier de version {version_file}: {str(e)}")
+    from newspapers_scrap.data_manager.storage import get_storage
+
+    versions = get_storage().list_versions(base_id)
 
     # Trier les versions par date de création (plus récentes en premier)
     versions.sort(key=lambda x: x.get('created_at', ''), reverse=True)
     return versions
 
 
-def process_article_correction(file_path, correction_method):
+def process_article_correction(base_id, correction_method):
     """
     Traite une demande de correction d'article complète.
 
     Args:
-        file_path: Chemin du fichier de l'article
+        base_id: L'identifiant de base de l'article
         correction_method: Méthode de correction à utiliser
 
     Returns:
         Tuple contenant (succès, message d'erreur, données de résultat)
     """
-    if not os.path.exists(file_path) or not file_path.endswith('.json'):
-        return False, "Fichier non trouvé", None
+    from newspapers_scrap.data_manager.storage import get_storage
 
     try:
-        # Charger les données de l'article avec notre fonction utilitaire
-        article_data = read_json_file(file_path)
+        # Charger les données de l'article depuis le stockage
+        article_data = get_storage().get_article(base_id)
+        if article_data is None:
+            return False, "Fichier non trouvé", None
 
         # Appliquer la correction
         corrected_text, success = correct_article_content(article_data, correction_method)
@@ -188,7 +160,7 @@ def process_article_correction(file_path, correction_method):
 
         # Sauvegarder l'article corrigé
         success, word_count, version_data = save_corrected_article(
-            file_path, article_data, corrected_text, correction_method
+            article_data, corrected_text, correction_method
         )
 
         if not success:
@@ -201,5 +173,5 @@ def process_article_correction(file_path, correction_method):
         }
 
     except Exception as e:
-        logger.error(f"Erreur lors de la correction du fichier {file_path}: {str(e)}")
-        return False, str(e), None
\ No newline at end of file
+        logger.error(f"Erreur lors de la correction de l'article {base_id}: {str(e)}")
+        return False, str(e), None
@@ -3,13 +3,19 @@ import json
 import logging
 import os
 import sys
+import time
 import traceback
+from pathlib import Path
 from threading import Thread
 from queue import Empty
 from flask import current_app, copy_current_request_context
 
 logger = logging.getLogger(__name__)
 
+# Search form fields identifying a job (resume and start_from only change how it is run)
+JOB_FIELDS = ('query', 'newspapers', 'cantons', 'searches', 'search_by', 'correction_method',
+              'start_year', 'end_year')
+
 
 def create_search_tasks(query_data):
     """
@@ -36,6 +42,8 @@ def create_search_tasks(query_data):
         base_cmd.extend(['--cantons'] + query_data['cantons'].split())
     if query_data.get('searches') and query_data.get('searches') != 'all':
         base_cmd.extend(['--max_articles', str(query_data['searches'])])
+    if query_data.get('resume'):
+        base_cmd.append('--resume')
 
     # Get start_from parameter value (UI value is 1-based, code uses 0-based)
     start_from = query_data.get('start_from', '0')
@@ -56,7 +64,33 @@ def create_search_tasks(query_data):
     start_year = query_data.get('start_year')
     end_year = query_data.get('end_year')
 
-    if start_year and end_year:
+    # Years searched concurrently by a single run_search process
+    try:
+        parallel_periods = int(query_data.get('parallel_periods') or 1)
+    except ValueError:
+        logger.warning(f"Invalid parallel_periods value: {query_data.get('parallel_periods')}, defaulting to 1")
+        parallel_periods = 1
+
+    # Planning probes the whole range at once, so it needs a single task too
+    plan_only = query_data.get('plan_only')
+    plan = query_data.get('plan')
+
+    if start_year and end_year and (parallel_periods > 1 or plan or plan_only):
+        logger.info(f"Creating one search task for {start_year}-{end_year}, "
+                    f"{parallel_periods} years at a time")
+        range_cmd = base_cmd.copy()
+        range_cmd.extend(['--date_range', f"{start_year}-{end_year}",
+                          '--parallel_periods', str(parallel_periods)])
+        if plan_only:
+            range_cmd.append('--plan_only')
+        elif plan:
+            range_cmd.append('--plan')
+        if start_from_value > 0:
+            range_cmd.extend(['--start_from', str(start_from_value - 1)])  # Convert to 0-based
+
+        search_tasks.append(range_cmd)
+        search_periods.append(f"{start_year}-{end_year}")
+    elif start_year and end_year:
         start_year = int(start_year)
         end_year = int(end_year)
         logger.info(f"Creating year-by-year search tasks from {start_year} to {end_year}")
@@ -85,6 +119,99 @@ def create_search_tasks(query_data):
     return search_tasks, search_periods
 
 
+def _job_periods(query_data):
+    """Periods (years, or None for a search without dates) of the tasks of a search"""
+    if query_data.get('start_year') and query_data.get('end_year'):
+        return [str(year) for year in range(int(query_data['start_year']), int(query_data['end_year']) + 1)]
+    return [None]
+
+
+def _job_searches(query_data):
+    """Checkpoint identities of the tasks of a search, matching what run_search.py passes to the scraper"""
+    from newspapers_scrap.checkpoint import search_identity
+
+    newspapers = query_data['newspapers'].split() if query_data.get('newspapers') else None
+    cantons = query_data['cantons'].split() if query_data.get('cantons') else None
+    return [search_identity(query_data['query'], newspapers, cantons, year=period)
+            for period in _job_periods(query_data)]
+
+
+def _jobs_dir():
+    from newspapers_scrap.config.config import env
+
+    # Next to the checkpoints, in a subdirectory so CheckpointStore.list does not read them
+    return Path(env.storage.paths.checkpoints_dir) / 'jobs'
+
+
+def record_search_job(query_data):
+    """
+    Remember the parameters of a search started from the UI, so it can be resumed
+
+    Args:
+        query_data: Dictionary containing search parameters
+
+    Returns:
+        Identifier of the job
+    """
+    from newspapers_scrap.checkpoint import CheckpointStore
+
+    job = {key: query_data.get(key) for key in JOB_FIELDS}
+    job_id = CheckpointStore.key(job)
+    jobs_dir = _jobs_dir()
+    jobs_dir.mkdir(parents=True, exist_ok=True)
+    with open(jobs_dir / f"{job_id}.json", 'w', encoding='utf-8') as f:
+        json.dump({'id': job_id, 'query_data': job, 'started_at': time.time()}, f, ensure_ascii=False)
+    return job_id
+
+
+def list_interrupted_searches():
+    """
+    List the searches started from the UI that did not complete
+
+    A search is interrupted when at least one of its periods was started and
+    some are not completed (stopped, crashed, or never reached).
+
+    Returns:
+        List of jobs with their parameters and per-period progress, most recent first
+    """
+    from newspapers_scrap.checkpoint import COMPLETED, CheckpointStore
+    from newspapers_scrap.config.config import env
+
+    store = CheckpointStore(env.storage.paths.checkpoints_dir)
+    interrupted = []
+    for path in _jobs_dir().glob('*.json'):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                job = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Skipping unreadable search job {path}: {e}")
+            continue
+
+        periods = []
+        for period, search in zip(_job_periods(job['query_data']), _job_searches(job['query_data'])):
+            checkpoint = store.load(search)
+            periods.append({
+                'period': period or 'Default',
+                'status': checkpoint.status if checkpoint else 'pending',
+                'collected': checkpoint.collected if checkpoint else 0,
+                'next_index': checkpoint.next_index if checkpoint else 0,
+            })
+
+        started = [period for period in periods if period['status'] != 'pending']
+        if started and any(period['status'] != COMPLETED for period in periods):
+            interrupted.append({
+                'id': job['id'],
+                'query_data': job['query_data'],
+                'started_at': job.get('started_at'),
+                'completed_periods': sum(period['status'] == COMPLETED for period in periods),
+                'collected': sum(period['collected'] for period in periods),
+                'periods': periods,
+            })
+
+    interrupted.sort(key=lambda job: job['started_at'] or 0, reverse=True)
+    return interrupted
+
+
 def emit_search_output(process_tracker, app):
     """
     Background task to emit search progress via socketio
@@ -202,6 +329,11 @@ def start_search(process_tracker, query_data):
 
     # Create search tasks
     search_tasks, search_periods = create_search_tasks(query_data)
+    if not query_data.get('plan_only'):
+        try:
+            record_search_job(query_data)
+        except Exception as e:
+            logger.error(f"Error recording search job: {str(e)}")
 
     # Update the process tracker
     process_tracker.search_tasks = search_tasks
@@ -3,6 +3,8 @@ let currentTaskIndex = 0;
 let totalTasks = 1;
 let completedTasks = 0;
 let searchPeriods = [];
+// 'search', 'plan_only' (probe the hit counts) or 'plan' (crawl the non-empty periods of the plan)
+let searchMode = 'search';
 
 console.log("Connecting to Socket.IO server...");
 // Create a Socket.IO connection with explicit URL and options
@@ -136,6 +138,11 @@ socket.on('search_stopped', function(data) {
     handleSearchStopped(data);
 });
 
+socket.on('search_plan', function(data) {
+    console.log("Received search_plan event:", data);
+    handleSearchPlan(data);
+});
+
 socket.on('task_change', function(data) {
     console.log("Received task_change event:", data);
     handleTaskChange(data);
@@ -270,6 +277,53 @@ function handleSearchComplete(data) {
     logContainer.scrollTop = logContainer.scrollHeight;
 }
 
+function formatDuration(seconds) {
+    const hours = Math.floor(seconds / 3600);
+    const minutes = Math.round((seconds % 3600) / 60);
+    return hours > 0 ? `${hours}h ${minutes}min` : `${minutes}min`;
+}
+
+function handleSearchPlan(plan) {
+    const planCard = document.getElementById('planCard');
+    const planTable = document.getElementById('planTable');
+    if (!planCard || !planTable) {
+        return;
+    }
+
+    planTable.innerHTML = '';
+    plan.periods.forEach(entry => {
+        const row = document.createElement('tr');
+        if (entry.total_results === 0) {
+            row.className = 'text-muted';
+        }
+        row.innerHTML = `<td>${entry.period}</td><td>${entry.total_results}</td><td>${entry.planned}</td>
+            <td>${entry.truncated ? '<span class="badge bg-warning text-dark">truncated</span>' : ''}
+                ${entry.sharded ? '<span class="badge bg-info text-dark">sharded</span>' : ''}</td>`;
+        planTable.appendChild(row);
+    });
+
+    const withResults = plan.periods.length - plan.empty_periods.length;
+    document.getElementById('planSummary').textContent =
+        `${withResults}/${plan.periods.length} periods with results, ${plan.planned_articles} articles planned ` +
+        `(${plan.total_results} hits, ${plan.sharded_periods.length} periods sharded and ` +
+        `${plan.truncated_periods.length} truncated above ${plan.max_results_per_search}). ` +
+        `Estimated duration: ${formatDuration(plan.eta_seconds)}.`;
+    planCard.style.display = 'block';
+}
+
+// Probe the hit count of every year before committing to the crawl
+function planSearch() {
+    searchMode = 'plan_only';
+    document.getElementById('searchForm').requestSubmit();
+}
+
+// Crawl the years of the plan that have results
+function startPlannedSearch() {
+    searchMode = 'plan';
+    document.getElementById('planCard').style.display = 'none';
+    document.getElementById('searchForm').requestSubmit();
+}
+
 function handleSearchStopped(data) {
     console.log("Handling search stopped:", data);
     if (!logContainer) {
@@ -364,6 +418,56 @@ let totalYears = 1;
 let currentYear = 0;
 
 // Update form submission handler to process the appropriate date inputs
+// Fill the search form with the parameters of an interrupted search and resume it
+function resumeSearch(queryData) {
+    document.getElementById('query').value = queryData.query || '';
+    document.getElementById('cantons').value = queryData.cantons || '';
+    document.getElementById('searches').value = queryData.searches || 'all';
+    document.getElementById('correction_method').value = queryData.correction_method || 'none';
+    document.getElementById('start_from').value = 0;
+    document.getElementById('search_by').value = 'year';
+    document.getElementById('search_by').dispatchEvent(new Event('change'));
+    document.getElementById('start_year').value = queryData.start_year || '';
+    document.getElementById('end_year').value = queryData.end_year || '';
+    document.getElementById('resume').checked = true;
+    document.getElementById('interruptedCard').style.display = 'none';
+    document.getElementById('searchForm').requestSubmit();
+}
+
+// List the interrupted searches that can be resumed
+function loadInterruptedSearches() {
+    fetch('/api/search/interrupted')
+        .then(response => response.json())
+        .then(data => {
+            const card = document.getElementById('interruptedCard');
+            const list = document.getElementById('interruptedList');
+            if (!card || !list || !data.jobs || data.jobs.length === 0) {
+                return;
+            }
+            list.innerHTML = '';
+            data.jobs.forEach(job => {
+                const queryData = job.query_data;
+                const period = queryData.start_year ? `${queryData.start_year}-${queryData.end_year}` : 'all dates';
+                const item = document.createElement('li');
+                item.className = 'list-group-item d-flex justify-content-between align-items-center';
+                item.innerHTML = `<span><strong></strong> (${period}${queryData.cantons ? ', ' + queryData.cantons : ''}):
+                    ${job.completed_periods}/${job.periods.length} periods done, ${job.collected} articles</span>`;
+                item.querySelector('strong').textContent = queryData.query;
+                const button = document.createElement('button');
+                button.type = 'button';
+                button.className = 'btn btn-sm btn-outline-primary';
+                button.textContent = 'Resume';
+                button.addEventListener('click', () => resumeSearch(queryData));
+                item.appendChild(button);
+                list.appendChild(item);
+            });
+            card.style.display = 'block';
+        })
+        .catch(error => console.error('Error loading interrupted searches:', error));
+}
+
+document.addEventListener('DOMContentLoaded', loadInterruptedSearches);
+
 document.getElementById('searchForm').addEventListener('submit', function (e) {
     e.preventDefault();
     console.log("Search form submitted");
@@ -387,6 +491,8 @@ document.getElementById('searchForm').addEventListener('submit', function (e) {
     const maxArticles = document.getElementById('searches') ? document.getElementById('searches').value : 'all';
     const searchBy = document.getElementById('search_by').value;
     const correctionMethod = document.getElementById('correction_method').value;
+    const resume = document.getElementById('resume') ? document.getElementById('resume').checked : false;
+    const parallelPeriods = document.getElementById('parallel_periods') ? document.getElementById('parallel_periods').value : '1';
 
     // Get date range values based on the selected search method
     let startYear, endYear, decade;
@@ -404,8 +510,16 @@ document.getElementById('searchForm').addEventListener('submit', function (e) {
         start_from: parseInt(startFrom) || 0,
         searches: maxArticles,
         search_by: searchBy,
-        correction_method: correctionMethod
+        correction_method: correctionMethod,
+        resume: resume,
+        parallel_periods: parseInt(parallelPeriods) || 1
     };
+    if (searchMode === 'plan_only') {
+        data.plan_only = true;
+    } else if (searchMode === 'plan') {
+        data.plan = true;
+    }
+    searchMode = 'search';
 
     // Add date range or decade based on the search method
     if (searchBy === 'year' && startYear) {
@@ -434,6 +548,9 @@ document.getElementById('searchForm').addEventListener('submit', function (e) {
     logContainer.innerHTML += `<p class="log-entry">Max articles: ${maxArticles}</p>`;
     logContainer.innerHTML += `<p class="log-entry">Starting from result #${startFrom}</p>`;
     logContainer.innerHTML += `<p class="log-entry">Correction method: ${correctionMethod}</p>`;
+    if (resume) {
+        logContainer.innerHTML += `<p class="log-entry">Resuming from checkpoints</p>`;
+    }
     
     // Scroll to the bottom of the log container
     logContainer.scrollTop = logContainer.scrollHeight;
@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+import logging
+import random
+from typing import Dict, Optional
+
+from aiohttp import web
+
+from newspapers_scrap.config.config import env
+from newspapers_scrap.fixtures import FixtureStore, fixture_key
+from newspapers_scrap.html_parser import HtmlParser
+
+logger = logging.getLogger(__name__)
+
+# Two-word names: the scraper reads the newspaper from the first two words of a result
+NEWSPAPERS = ('La Liberté', 'Le Confédéré', 'La Gruyère', 'Le Temps', 'Feuille d’Avis')
+MONTHS = ('Januar', 'Februar', 'März', 'April', 'Mai', 'Juni', 'Juli', 'August', 'September',
+          'Oktober', 'November', 'Dezember')
+WORDS = ('le', 'la', 'les', 'de', 'du', 'des', 'et', 'conseil', 'commune', 'canton', 'séance',
+         'assemblée', 'journal', 'marché', 'prix', 'gare', 'école', 'fête', 'lac', 'route',
+         'incendie', 'récolte', 'vote', 'projet', 'société', 'semaine', 'hier', 'demain')
+
+
+class ArchiveServer:
+    """
+    Local stand-in for the newspaper archive, for offline benchmarks.
+
+    Requests are answered from recorded fixtures (see fixtures.FixtureStore)
+    or, when ``synthetic_results`` is set, with generated search and article
+    pages shaped like the archive's (the markup selectors.yaml expects).
+    Latency, jitter and an error rate are injected on every page request.
+    Every search (query and filters) of the synthetic archive has
+    ``synthetic_results`` hits, and its article pages are deterministic.
+    """
+
+    def __init__(self, fixtures: Optional[FixtureStore] = None, synthetic_results: int = 0,
+                 article_words: int = 300, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, error_status: int = 503, seed: Optional[int] = None,
+                 config=None):
+        """
+        Initialize the server
+
+        Args:
+            fixtures: Recorded pages served first (None = synthetic pages only)
+            synthetic_results: Hits of every synthetic search (0 = unknown pages get a 404)
+            article_words: Length of the synthetic articles
+            latency: Mean delay before each response in seconds
+            jitter: Delays are drawn uniformly within latency ± jitter
+            error_rate: Share of page requests answered with error_status
+            error_status: HTTP status of the injected errors
+            seed: Seed of the latency and error draws
+            config: Configuration providing the selectors and search page size (default: env)
+        """
+        self.config = config or env
+        self.fixtures = fixtures
+        self.synthetic_results = synthetic_results
+        self.article_words = article_words
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.stats = {'requests': 0, 'fixtures': 0, 'synthetic': 0, 'errors': 0, 'not_found': 0}
+        self.url = None
+        self._runner = None
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """
+        Start serving
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 = any free port)
+
+        Returns:
+            Base URL of the server
+        """
+        if self.synthetic_results:
+            self._check_selectors()
+        app = web.Application()
+        app.router.add_get('/robots.txt', self._robots)
+        app.router.add_get('/', self._page)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        self.url = f"http://{host}:{self._runner.addresses[0][1]}"
+        logger.info(f"Archive stand-in listening on {self.url}")
+        return self.url
+
+    async def stop(self):
+        """Stop serving"""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _robots(self, request: web.Request) -> web.Response:
+        # Without a crawl delay the scraper would wait its 1s default between requests
+        return web.Response(text="User-agent: *\nCrawl-delay: 0\nAllow: /\n")
+
+    async def _page(self, request: web.Request) -> web.Response:
+        self.stats['requests'] += 1
+        delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+        if delay:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self.random.random() < self.error_rate:
+            self.stats['errors'] += 1
+            return web.Response(status=self.error_status, text='Injected error')
+
+        html = self.fixtures.get(str(request.rel_url)) if self.fixtures else None
+        if html is not None:
+            self.stats['fixtures'] += 1
+            return web.Response(text=html, content_type='text/html')
+
+        if self.synthetic_results:
+            action = request.query.get('a')
+            if action == 'q':
+                html = self.search_page(request.query)
+            elif action == 'd' and request.query.get('d'):
+                html = self.article_page(request.query['d'])
+        if html is None:
+            self.stats['not_found'] += 1
+            logger.debug(f"No page for {request.rel_url} (fixture key {fixture_key(str(request.rel_url))})")
+            return web.Response(status=404, text='Not found')
+
+        self.stats['synthetic'] += 1
+        return web.Response(text=html, content_type='text/html')
+
+    def search_page(self, query: Dict[str, str]) -> str:
+        """Synthetic result page for the search arguments of a request"""
+        search_config = self.config.urls.search
+        start = max(1, int(query.get('r', 1)))
+        page_size = search_config.page_size
+        if search_config.page_size_param and query.get(search_config.page_size_param):
+            page_size = int(query[search_config.page_size_param])
+        total = self.synthetic_results
+        end = min(start + page_size - 1, total)
+
+        # Results of a search are identified by its query and filters
+        search_id = hashlib.sha1('|'.join(
+            query.get(arg, '') for arg in ('txq', 'puq', 'ccq', 'deq', 'yeq', 'laq')).encode('utf-8')).hexdigest()[:8]
+        items = []
+        for index in range(start, end + 1):
+            article_id = f"SYN{search_id}-{index}"
+            year = query.get('yeq') or (f"{query['deq']}{index % 10}" if query.get('deq') else str(1850 + index % 150))
+            rng = random.Random(article_id)
+            date = f"{rng.randint(1, 28)}. {rng.choice(MONTHS)} {year}"
+            items.append(
+                f'<li><div class="vlistentrymaincell">'
+                f'<div><a href="/?a=d&amp;d={article_id}">{self._title(article_id)}</a></div>'
+                f'<div>{rng.choice(NEWSPAPERS)} {date}</div>'
+                f'<div class="imgsearchsnippet">{query.get("txq", "")}</div>'
+                f'</div></li>')
+        summary = f"Ergebnisse {start} - {end} von {total} für {query.get('txq', '')}" if items else "Keine Ergebnisse"
+        return (f'<html><body><div id="searchresultsheader"><div id="searchresultssummary">{summary}</div></div>'
+                f'<ol class="searchresults">{"".join(items)}</ol></body></html>')
+
+    def article_page(self, article_id: str) -> str:
+        """Synthetic article page (the same text on every request)"""
+        rng = random.Random(article_id)
+        text = ' '.join(rng.choice(WORDS) for _ in range(self.article_words))
+        return (f'<html><body><div id="sectionleveltabtitlearea"><h2><span>{self._title(article_id)}</span></h2></div>'
+                f'<div id="documentdisplayleftpanesectionleveltabcontent">'
+                f'<div id="documentdisplayleftpanesectiontextcontainer">'
+                f'<p class="documentdisplayleftpanesectiontextheader">{self._title(article_id)}</p>'
+                f'<p>{text}</p></div></div></body></html>')
+
+    @staticmethod
+    def _title(article_id: str) -> str:
+        return f"Article {article_id.rsplit('-', 1)[-1]}"
+
+    def _check_selectors(self):
+        """Warn when selectors.yaml no longer matches the synthetic markup"""
+        parser = HtmlParser(backend=self.config.scraping.parser.backend, partial=False)
+        search_selectors = self.config.selectors.search_selectors
+        search = parser.parse(self.search_page({'txq': 'check', 'r': '1'}))
+        article = parser.parse(self.article_page('SYNcheck-1'))
+        missing = [selector for selector in (search_selectors.result_item, search_selectors.result_link,
+                                             search_selectors.result_newspaper, '#searchresultssummary')
+                   if not search.select_one(selector)]
+        if not article.select_one(self.config.selectors.article_selectors.article_text):
+            missing.append(self.config.selectors.article_selectors.article_text)
+        if missing:
+            logger.warning(f"Synthetic pages do not match selectors {missing}, the scraper will not find their content")
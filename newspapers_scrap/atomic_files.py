@@ -0,0 +1,246 @@
+import atexit
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Set, Union
+
+logger = logging.getLogger(__name__)
+
+# Name prefix of the temporary files written before their rename
+TEMP_PREFIX = '.tmp-'
+
+
+def write_atomic(path: Union[str, Path], data: bytes, durable: bool = True):
+    """
+    Replace a file through a temporary file of its directory and a rename
+
+    Readers, and a process crashing mid-write, only ever see the old or the
+    new content. With durable, the content is also flushed to disk before
+    the rename, so a power failure cannot leave the new name on a truncated
+    file either (the rename itself reaches the disk with the next sync of
+    the directory).
+
+    Args:
+        path: File to write
+        data: Its new content
+        durable: fsync the content before the rename (not needed for files
+            that can be rebuilt, like cache entries)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=TEMP_PREFIX)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def sync_directory(directory: Union[str, Path]):
+    """Flush the entries of a directory (renames, deletions) to disk"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        # Directories cannot be opened (and need no sync) on Windows
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class AtomicFileWriter:
+    """
+    Atomic file writes made durable by groups (group commit).
+
+    A write only stages its content in a temporary file next to the target.
+    Once sync_files files are staged, or sync_interval seconds after the
+    first of them, the group is committed: the temporary files are synced
+    to disk together, renamed over their targets in the order they were
+    written, and each directory of the group is synced once. A power failure
+    or a crash thus loses at most the last group, whose targets keep their
+    previous content, and never leaves a truncated file; sync() commits the
+    group at once (e.g. before recording elsewhere that the files exist).
+
+    Until then the new contents are only visible through read_bytes() and
+    exists(), which see the staged files; listings of the directories do not.
+    """
+
+    def __init__(self, sync_files: int = 32, sync_interval: float = 0.5):
+        """
+        Initialize the writer
+
+        Args:
+            sync_files: Staged files that trigger the commit of the group
+            sync_interval: Seconds after which a group is committed whatever its number of files
+        """
+        self.sync_files = max(1, sync_files)
+        self.sync_interval = sync_interval
+        # Target -> temporary file holding its new content, in write order
+        self._staged: Dict[Path, str] = {}
+        # Directories with deletions or symlinks to sync with the group
+        self._changed_dirs: Set[Path] = set()
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        # The timer thread does not outlive the process: commit the last group at exit
+        atexit.register(self.sync)
+
+    def write_bytes(self, path: Union[str, Path], data: bytes):
+        """Stage the new content of a file, renamed into place with its group"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        with self._lock:
+            # A newer content of a staged file replaces the older one in the group
+            replaced = self._staged.pop(path, None)
+            if replaced is not None:
+                os.unlink(replaced)
+            self._staged[path] = tmp_path
+            self._schedule()
+
+    def write_json(self, path: Union[str, Path], data: Any):
+        """Stage a JSON file (indented, like the files written before)"""
+        self.write_bytes(path, json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8'))
+
+    def read_bytes(self, path: Union[str, Path]) -> bytes:
+        """Read a file, or its staged content; symlinks are followed through the staged files too"""
+        path = Path(path)
+        with self._lock:
+            tmp_path = self._staged.get(path)
+            if tmp_path is not None:
+                with open(tmp_path, 'rb') as f:
+                    return f.read()
+        if path.is_symlink():
+            target = Path(os.readlink(path))
+            return self.read_bytes(target if target.is_absolute() else path.parent / target)
+        return path.read_bytes()
+
+    def exists(self, path: Union[str, Path]) -> bool:
+        """Whether a file exists or is staged"""
+        path = Path(path)
+        with self._lock:
+            if path in self._staged:
+                return True
+        return path.exists()
+
+    def symlink(self, path: Union[str, Path], target: Union[str, Path]):
+        """Create or replace a symlink atomically (right away: it holds no data to sync)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.parent / f"{TEMP_PREFIX}{os.getpid()}-{threading.get_ident()}-{path.name}"
+        if tmp_path.is_symlink() or tmp_path.exists():
+            tmp_path.unlink()
+        tmp_path.symlink_to(target)
+        try:
+            os.replace(tmp_path, path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._changed_dirs.add(path.parent)
+            self._schedule()
+
+    def remove(self, path: Union[str, Path]):
+        """Delete a file and its staged content; the deletion is synced with the group"""
+        path = Path(path)
+        with self._lock:
+            tmp_path = self._staged.pop(path, None)
+            if tmp_path is not None:
+                os.unlink(tmp_path)
+            path.unlink(missing_ok=True)
+            self._changed_dirs.add(path.parent)
+            self._schedule()
+
+    def _schedule(self):
+        """Commit the group when it is full, or start its timer (lock held)"""
+        if len(self._staged) >= self.sync_files:
+            self._commit()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.sync_interval, self.sync)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def sync(self):
+        """Commit the staged files to disk now"""
+        with self._lock:
+            self._commit()
+
+    def _commit(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._staged and not self._changed_dirs:
+            return
+        started = time.time()
+        staged = self._staged
+        self._staged = {}
+        directories = self._changed_dirs
+        self._changed_dirs = set()
+        try:
+            for tmp_path in staged.values():
+                fd = os.open(tmp_path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            for path, tmp_path in staged.items():
+                os.replace(tmp_path, path)
+                directories.add(path.parent)
+        except Exception:
+            # Left for remove_temp_files; the targets keep their previous content
+            logger.error(f"Could not commit a group of {len(staged)} files", exc_info=True)
+            raise
+        finally:
+            for directory in directories:
+                sync_directory(directory)
+        logger.debug(f"Committed {len(staged)} files in {len(directories)} directories "
+                     f"in {time.time() - started:.3f}s")
+
+
+def remove_temp_files(directories: Iterable[Union[str, Path]], stale_after: float = 60) -> int:
+    """
+    Delete the temporary files left by writes interrupted by a crash
+
+    Args:
+        directories: Directories scanned recursively
+        stale_after: Age in seconds from which a temporary file is orphaned
+            (younger ones may belong to a write of another running process)
+
+    Returns:
+        Number of files deleted
+    """
+    removed = 0
+    now = time.time()
+    for directory in directories:
+        directory = Path(directory)
+        if not directory.is_dir():
+            continue
+        for tmp_path in directory.rglob(f"{TEMP_PREFIX}*"):
+            try:
+                if now - tmp_path.lstat().st_mtime < stale_after:
+                    continue
+                tmp_path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Could not remove temporary file {tmp_path}: {e}")
+    if removed:
+        logger.info(f"Removed {removed} temporary files left by interrupted writes")
+    return removed
@@ -0,0 +1,129 @@
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+from typing import Any, Awaitable, Callable, List
+
+logger = logging.getLogger(__name__)
+
+
+class PooledPage:
+    """A warm browser page together with the context that owns it"""
+
+    def __init__(self, context: Any, page: Any):
+        self.context = context
+        self.page = page
+        self.uses = 0
+        self.needs_recycle = False
+
+    def recycle(self):
+        """Mark this page so its context is closed instead of returned to the pool"""
+        self.needs_recycle = True
+
+
+class BrowserContextPool:
+    """
+    Pool of warm Playwright contexts, each holding one reusable page.
+
+    Contexts are created lazily up to ``size`` and handed out one at a time.
+    A context is closed and replaced after ``max_pages_per_context`` page loads
+    or as soon as a fetch using it fails.
+    """
+
+    def __init__(self, context_factory: Callable[[], Awaitable[Any]], size: int = 2,
+                 max_pages_per_context: int = 50):
+        """
+        Initialize the pool
+
+        Args:
+            context_factory: Coroutine function returning a new, configured browser context
+            size: Maximum number of contexts kept alive at the same time
+            max_pages_per_context: Number of page loads after which a context is recycled
+        """
+        self.context_factory = context_factory
+        self.size = max(1, size)
+        self.max_pages_per_context = max(1, max_pages_per_context)
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._all: List[PooledPage] = []
+        self._closed = False
+
+        # An empty slot is represented by None and is filled lazily on checkout
+        for _ in range(self.size):
+            self._idle.put_nowait(None)
+
+    async def _create(self) -> PooledPage:
+        """Create a new context and its page"""
+        context = await self.context_factory()
+        page = await context.new_page()
+        pooled = PooledPage(context, page)
+        self._all.append(pooled)
+        logger.info(f"Created pooled browser context ({len(self._all)}/{self.size})")
+        return pooled
+
+    async def _discard(self, pooled: PooledPage):
+        """Close a pooled context and forget about it"""
+        if pooled in self._all:
+            self._all.remove(pooled)
+        try:
+            await pooled.context.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled browser context: {e}")
+
+    async def checkout(self) -> PooledPage:
+        """Take a warm page from the pool, waiting if every context is in use"""
+        if self._closed:
+            raise RuntimeError("Browser context pool is closed")
+
+        pooled = await self._idle.get()
+        if pooled is not None:
+            return pooled
+
+        try:
+            return await self._create()
+        except Exception:
+            # Give the slot back so another caller can try again
+            self._idle.put_nowait(None)
+            raise
+
+    async def checkin(self, pooled: PooledPage):
+        """Return a page to the pool, recycling its context if it is worn out or failed"""
+        pooled.uses += 1
+        if self._closed:
+            await self._discard(pooled)
+            return
+
+        if pooled.needs_recycle or pooled.uses >= self.max_pages_per_context:
+            reason = "after an error" if pooled.needs_recycle else f"after {pooled.uses} pages"
+            logger.info(f"Recycling browser context {reason}")
+            await self._discard(pooled)
+            self._idle.put_nowait(None)
+            return
+
+        self._idle.put_nowait(pooled)
+
+    @asynccontextmanager
+    async def page(self):
+        """Check a page out for the duration of a ``with`` block"""
+        pooled = await self.checkout()
+        try:
+            yield pooled
+        except BaseException:
+            pooled.recycle()
+            raise
+        finally:
+            await self.checkin(pooled)
+
+    async def close(self):
+        """Close every context owned by the pool"""
+        self._closed = True
+        for pooled in list(self._all):
+            await self._discard(pooled)
+        logger.info("Browser context pool closed")
+
+    @property
+    def stats(self) -> dict:
+        """Return the current pool occupancy"""
+        return {
+            'size': self.size,
+            'open_contexts': len(self._all),
+            'total_page_loads': sum(pooled.uses for pooled in self._all),
+        }
@@ -0,0 +1,278 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from newspapers_scrap.atomic_files import write_atomic
+
+logger = logging.getLogger(__name__)
+
+RUNNING = 'running'
+INTERRUPTED = 'interrupted'
+COMPLETED = 'completed'
+
+
+def search_identity(query: str, newspapers: Optional[List[str]] = None, cantons: Optional[List[str]] = None,
+                    laq: str = 'fr', decade: Optional[str] = None, year: Optional[str] = None) -> Dict[str, Any]:
+    """Query, filters and period identifying the checkpoint of a search"""
+    return {'query': query, 'newspapers': newspapers, 'cantons': cantons, 'laq': laq,
+            'decade': decade, 'year': year}
+
+
+def _pid_alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists but belongs to someone else
+        return True
+    return True
+
+
+class CrawlCheckpoint:
+    """
+    Crawl frontier of one search (query, filters and period).
+
+    Holds the index of the next result to process (the cursor), the number of
+    articles collected, the results whose article could not be fetched and
+    the search result pages fetched ahead of the cursor, so an interrupted
+    search continues exactly where it stopped without fetching anything
+    twice. Pages behind the cursor are dropped, so the checkpoint stays the
+    same small size however long the crawl.
+
+    Commits only change the checkpoint in memory; flush() writes it off the
+    event loop once save_every changes are pending or save_interval seconds
+    after the last write. A crash thus forgets the last few commits: their
+    articles are stored already and are found again by the URL index on resume.
+    """
+
+    def __init__(self, path: Path, data: Dict[str, Any], save_every: int = 32, save_interval: float = 1.0,
+                 sync: Optional[Callable[[], None]] = None):
+        """
+        Initialize the checkpoint
+
+        Args:
+            path: JSON file of the checkpoint
+            data: Its content
+            save_every: Changes after which flush() writes the checkpoint
+            save_interval: Seconds after which flush() writes pending changes whatever their number
+            sync: Called before each write of the checkpoint, to make the articles it
+                counts durable first (e.g. ArticleStorage.sync)
+        """
+        self.path = path
+        self.data = data
+        self.sync = sync
+        self.save_every = max(1, save_every)
+        self.save_interval = save_interval
+        self._changes = 0
+        self._saved_at = time.monotonic()
+        self._save_lock = asyncio.Lock()
+
+    @property
+    def status(self) -> str:
+        """Status, with 'running' checkpoints of dead processes reported as interrupted"""
+        status = self.data['status']
+        if status == RUNNING and not _pid_alive(self.data.get('pid')):
+            return INTERRUPTED
+        return status
+
+    @property
+    def next_index(self) -> int:
+        return self.data['next_index']
+
+    @property
+    def collected(self) -> int:
+        return self.data['collected']
+
+    @property
+    def failed(self) -> List[Dict[str, Any]]:
+        return self.data['failed']
+
+    def get_page(self, start: int) -> Optional[Dict[str, Any]]:
+        """Return the stored search result page starting at result `start`, or None if it was never fetched"""
+        return self.data.setdefault('result_pages', {}).get(str(start))
+
+    def record_page(self, start: int, search_result: Dict[str, Any]):
+        """Store a fetched search result page under the index of its first result"""
+        if search_result['articles']:
+            self.data.setdefault('result_pages', {})[str(start)] = search_result
+            self._changes += 1
+
+    def commit(self, index: Optional[int], collected: bool = True):
+        """
+        Record a processed result
+
+        Args:
+            index: Result index of the article (None for a retried failure)
+            collected: Whether the article was stored (False: it goes to the failed list)
+        """
+        if collected:
+            self.data['collected'] += 1
+        if index is not None:
+            self.data['next_index'] = max(self.data['next_index'], index + 1)
+            self._drop_consumed_pages()
+        self._changes += 1
+
+    def _drop_consumed_pages(self):
+        """Forget the result pages whose results are all behind the cursor"""
+        pages = self.data.setdefault('result_pages', {})
+        # Pages are keyed by their 1-based first result, the cursor is a 0-based index
+        consumed = [start for start, page in pages.items()
+                    if int(start) - 1 + len(page['articles']) <= self.data['next_index']]
+        for start in consumed:
+            del pages[start]
+
+    def add_failed(self, article: Dict[str, Any]):
+        """Remember a result whose article could not be fetched"""
+        if all(failed['url'] != article['url'] for failed in self.data['failed']):
+            self.data['failed'].append(article)
+            self._changes += 1
+
+    def remove_failed(self, article: Dict[str, Any]):
+        """Forget a failed result that was fetched on retry"""
+        failed = [failed for failed in self.data['failed'] if failed['url'] != article['url']]
+        if len(failed) != len(self.data['failed']):
+            self.data['failed'] = failed
+            self._changes += 1
+
+    def start(self):
+        """Mark the checkpoint as owned by this process (written by the next flush)"""
+        self.data['status'] = RUNNING
+        self.data['pid'] = os.getpid()
+        self._changes += 1
+
+    def finish(self, completed: bool):
+        """Mark the search as completed or interrupted (written by the next flush)"""
+        self.data['status'] = COMPLETED if completed else INTERRUPTED
+        self.data['pid'] = None
+        self._changes += 1
+
+    async def flush(self, force: bool = False):
+        """
+        Write the pending changes off the event loop when they are due
+
+        Args:
+            force: Write any pending change now (start and end of the search)
+        """
+        if not self._changes:
+            return
+        if not force and self._changes < self.save_every \
+                and time.monotonic() - self._saved_at < self.save_interval:
+            return
+        # One write at a time, so an older state never replaces a newer one
+        async with self._save_lock:
+            if not self._changes:
+                return
+            # Serialized on the loop, where the data is changed
+            content = self._serialize()
+            self._changes = 0
+            self._saved_at = time.monotonic()
+            try:
+                await asyncio.to_thread(self._write, content)
+            except Exception:
+                # Still to be written
+                self._changes += 1
+                raise
+
+    def save(self):
+        """Write the checkpoint atomically (temporary file then rename)"""
+        content = self._serialize()
+        self._changes = 0
+        self._saved_at = time.monotonic()
+        self._write(content)
+
+    def _write(self, content: bytes):
+        if self.sync is not None:
+            self.sync()
+        write_atomic(self.path, content)
+
+    def _serialize(self) -> bytes:
+        self.data['updated_at'] = time.time()
+        return json.dumps(self.data, ensure_ascii=False).encode('utf-8')
+
+
+class CheckpointStore:
+    """Directory of crawl checkpoints, one JSON file per query, filter set and period"""
+
+    def __init__(self, directory: Union[str, Path], sync: Optional[Callable[[], None]] = None):
+        """
+        Initialize the store
+
+        Args:
+            directory: Directory of the checkpoint files
+            sync: Called before each write of a checkpoint (see CrawlCheckpoint)
+        """
+        self.directory = Path(directory)
+        self.sync = sync
+
+    @staticmethod
+    def key(search: Dict[str, Any]) -> str:
+        """Stable identifier of a search (query, filters and period)"""
+        canonical = json.dumps(search, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+    def _path(self, search: Dict[str, Any]) -> Path:
+        return self.directory / f"{self.key(search)}.json"
+
+    def load(self, search: Dict[str, Any]) -> Optional[CrawlCheckpoint]:
+        """Load the checkpoint of a search, or None if there is none (or it is unreadable)"""
+        path = self._path(search)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return CrawlCheckpoint(path, json.load(f), sync=self.sync)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Could not load checkpoint {path}: {e}")
+            return None
+
+    def open(self, search: Dict[str, Any], start_from: int = 0, resume: bool = False,
+             job: Optional[Dict[str, Any]] = None) -> CrawlCheckpoint:
+        """
+        Load the checkpoint of a search, or start a new one
+
+        Args:
+            search: Query, filters and period identifying the search
+            start_from: First result index of a new checkpoint
+            resume: Continue an existing checkpoint instead of starting over
+            job: Extra settings of the run (limits, correction) kept for resuming from the UI
+        """
+        checkpoint = self.load(search) if resume else None
+        if checkpoint:
+            logger.info(f"Resuming checkpoint {checkpoint.path.name} at result {checkpoint.next_index} "
+                        f"({checkpoint.collected} collected, {len(checkpoint.failed)} failed)")
+            return checkpoint
+
+        return CrawlCheckpoint(self._path(search), {
+            'search': search,
+            'job': job or {},
+            'status': RUNNING,
+            'pid': None,
+            'next_index': start_from,
+            'collected': 0,
+            'result_pages': {},
+            'failed': [],
+            'created_at': time.time(),
+            'updated_at': time.time(),
+        }, sync=self.sync)
+
+    def list(self, status: Optional[str] = None) -> List[CrawlCheckpoint]:
+        """List the stored checkpoints, optionally only those with the given status"""
+        checkpoints = []
+        for path in sorted(self.directory.glob('*.json')):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    checkpoint = CrawlCheckpoint(path, json.load(f), sync=self.sync)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Skipping unreadable checkpoint {path}: {e}")
+                continue
+            if status is None or checkpoint.status == status:
+                checkpoints.append(checkpoint)
+        return checkpoints
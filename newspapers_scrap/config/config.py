@@ -2,7 +2,7 @@ import os
 
 import yaml
 import re
-from typing import Dict, Any, Union
+from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 from pydantic import BaseModel, Field, create_model
 
@@ -21,6 +21,8 @@ class SearchParams(BaseModel):
 
 class SearchConfig(BaseModel):
     params: SearchParams
+    page_size: int = 20  # Results requested per search page
+    page_size_param: Optional[str] = None  # URL parameter carrying page_size (None = archive default)
 
 
 class SearchSelectors(BaseModel):
@@ -75,9 +77,116 @@ class Limits(BaseModel):
     max_results_per_search: int
 
 
+class BrowserPoolConfig(BaseModel):
+    size: int = 2
+    max_pages_per_context: int = 50
+
+
+class HttpFetchConfig(BaseModel):
+    enabled: bool = True
+    timeout: float = 20
+    connection_limit: int = 4
+    keepalive_timeout: float = 30
+
+
+class ConcurrencyConfig(BaseModel):
+    article_workers: int = 1
+    prefetch_pages: int = 1
+    parallel_periods: int = 1
+    persistence_queue: int = 16
+    persistence_workers: int = 1
+
+
+class RequestFilterConfig(BaseModel):
+    enabled: bool = True
+    blocked_resource_types: List[str] = Field(default_factory=lambda: ['image', 'font', 'media'])
+    allowed_domains: List[str] = Field(default_factory=list)
+    estimated_bytes: Dict[str, int] = Field(default_factory=dict)
+
+
+class ReadinessRule(BaseModel):
+    selector: Optional[str] = None
+    timeout_ms: int = 10000
+
+
+class ReadinessConfig(BaseModel):
+    enabled: bool = True
+    search: Optional[ReadinessRule] = Field(default_factory=ReadinessRule)
+    article: Optional[ReadinessRule] = Field(default_factory=ReadinessRule)
+
+
+class HttpCacheConfig(BaseModel):
+    enabled: bool = True
+    directory: str = 'data/cache/http'
+    max_bytes: int = 512 * 1024 * 1024
+    ttl_seconds: Dict[str, int] = Field(default_factory=lambda: {'search': 86400, 'article': 2592000})
+
+
+class ParserConfig(BaseModel):
+    backend: str = 'selectolax'
+    partial: bool = True
+    containers: Dict[str, List[str]] = Field(default_factory=lambda: {
+        'search': ['#searchresultsheader', 'ol.searchresults'],
+        'article': ['#documentdisplayleftpanesectiontextcontainer'],
+    })
+
+
+class RateLimitConfig(BaseModel):
+    shared: bool = True
+    db_path: str = 'data/state/politeness.sqlite'
+    burst: int = 1
+
+
+class RobotsConfig(BaseModel):
+    persistent: bool = True
+    ttl_seconds: int = 86400
+    failure_ttl_seconds: int = 3600
+
+
+class PacingConfig(BaseModel):
+    enabled: bool = True
+    initial_interval: Optional[float] = None  # default: middle of request_delay_min/max
+    min_interval: Optional[float] = None  # default: request_delay_min
+    max_interval: float = 60
+    additive_increase: float = 0.05
+    decrease_factor: float = 2.0
+    latency_spike_ratio: float = 2.5
+    latency_alpha: float = 0.2
+    jitter: float = 0.2
+
+
+class PlannerConfig(BaseModel):
+    order: str = 'chronological'  # chronological, largest_first or smallest_first
+    probe_concurrency: int = 4
+
+
+class ShardingConfig(BaseModel):
+    enabled: bool = True
+    cantons: List[str] = Field(default_factory=list)
+    newspapers: List[str] = Field(default_factory=list)
+
+
+class FixturesConfig(BaseModel):
+    record: bool = False
+    directory: str = 'data/fixtures'
+
+
 class Scraping(BaseModel):
     request: RequestConfig = Field(alias="REQUEST")
     limits: Limits = Field(alias="LIMITS")
+    browser_pool: BrowserPoolConfig = Field(default_factory=BrowserPoolConfig, alias="BROWSER_POOL")
+    http_fetch: HttpFetchConfig = Field(default_factory=HttpFetchConfig, alias="HTTP_FETCH")
+    concurrency: ConcurrencyConfig = Field(default_factory=ConcurrencyConfig, alias="CONCURRENCY")
+    request_filter: RequestFilterConfig = Field(default_factory=RequestFilterConfig, alias="REQUEST_FILTER")
+    readiness: ReadinessConfig = Field(default_factory=ReadinessConfig, alias="READINESS")
+    http_cache: HttpCacheConfig = Field(default_factory=HttpCacheConfig, alias="HTTP_CACHE")
+    parser: ParserConfig = Field(default_factory=ParserConfig, alias="PARSER")
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig, alias="RATE_LIMIT")
+    robots: RobotsConfig = Field(default_factory=RobotsConfig, alias="ROBOTS")
+    pacing: PacingConfig = Field(default_factory=PacingConfig, alias="PACING")
+    planner: PlannerConfig = Field(default_factory=PlannerConfig, alias="PLANNER")
+    sharding: ShardingConfig = Field(default_factory=ShardingConfig, alias="SHARDING")
+    fixtures: FixturesConfig = Field(default_factory=FixturesConfig, alias="FIXTURES")
 
 
 class StorageConfig(BaseModel):
@@ -87,10 +196,21 @@ class StorageConfig(BaseModel):
     logs_dir: str
     models_dir: str
     dicts_dir: str
+    url_index_path: str = 'data/index/url_index.jsonl'
+    checkpoints_dir: str = 'data/checkpoints'
+    blobs_dir: str = 'data/blobs'
+
+
+class StoreConfig(BaseModel):
+    backend: str = 'sqlite'
+    db_path: str = 'data/index/articles.sqlite'
+    sync_files: int = 32
+    sync_interval_ms: int = 500
 
 
 class Storage(BaseModel):
     paths: StorageConfig = Field(alias="PATHS")
+    store: StoreConfig = Field(default_factory=StoreConfig, alias="STORE")
 
 
 class UrlsConfig(BaseModel):
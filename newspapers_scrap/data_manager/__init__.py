@@ -1 +1,3 @@
-from .organizer import organize_article
+from .organizer import add_topic_to_article, organize_article
+
+__all__ = ['add_topic_to_article', 'organize_article']
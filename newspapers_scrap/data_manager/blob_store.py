@@ -0,0 +1,175 @@
+import difflib
+import gzip
+import hashlib
+import logging
+from pathlib import Path
+import re
+import sqlite3
+from typing import List, Optional, Union
+
+from newspapers_scrap.atomic_files import AtomicFileWriter
+
+logger = logging.getLogger(__name__)
+
+# Words with their trailing whitespace: the unit of the text deltas
+TOKEN_PATTERN = re.compile(r'\S+\s*|\s+')
+
+
+def blob_key(text: str) -> str:
+    """Content address of a text"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def text_delta(base: str, text: str) -> Optional[list]:
+    """
+    Encode a text as a word-level delta against a base text
+
+    Args:
+        base: Text the delta refers to (the raw text of an article)
+        text: Text to encode (a corrected version of it)
+
+    Returns:
+        List of [start, end] token ranges copied from the base and inserted strings,
+        or None when the texts differ too much for a delta to be smaller than the text
+    """
+    base_tokens = TOKEN_PATTERN.findall(base)
+    tokens = TOKEN_PATTERN.findall(text)
+    matcher = difflib.SequenceMatcher(None, base_tokens, tokens, autojunk=False)
+    delta = []
+    inserted = 0
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            delta.append([i1, i2])
+        elif j2 > j1:
+            literal = ''.join(tokens[j1:j2])
+            inserted += len(literal)
+            if delta and isinstance(delta[-1], str):
+                delta[-1] += literal
+            else:
+                delta.append(literal)
+    if inserted * 2 > len(text):
+        return None
+    return delta
+
+
+def apply_delta(base: str, delta: list) -> str:
+    """Rebuild a text from its base text and text_delta()"""
+    base_tokens = TOKEN_PATTERN.findall(base)
+    return ''.join(part if isinstance(part, str) else ''.join(base_tokens[part[0]:part[1]]) for part in delta)
+
+
+class BlobStore:
+    """
+    Content-addressed store of gzip-compressed texts with reference counts.
+
+    A text is stored once whatever the number of records holding it: put()
+    returns its key and adds a reference, release() drops one and deletes the
+    blob with its last reference. Counts (and, without a directory, the
+    compressed texts) live in a SQLite table; the count update and the blob
+    write or deletion run in one immediate transaction, so concurrent
+    processes never delete a blob another one just referenced.
+    """
+
+    def __init__(self, db_path: Union[str, Path], directory: Optional[Union[str, Path]] = None,
+                 lock_timeout: float = 30, files: Optional[AtomicFileWriter] = None):
+        """
+        Initialize the store
+
+        Args:
+            db_path: SQLite database holding the reference counts
+            directory: Directory of the blob files (None = compressed texts kept in the database)
+            lock_timeout: Seconds to wait for another process holding the database lock
+            files: Writer of the blob files, shared with the records referencing them
+        """
+        self.db_path = Path(db_path)
+        self.directory = Path(directory) if directory is not None else None
+        self.lock_timeout = lock_timeout
+        self.files = files or AtomicFileWriter()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS blobs ("
+                "key TEXT PRIMARY KEY, data BLOB, size INTEGER NOT NULL, refcount INTEGER NOT NULL)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.lock_timeout, isolation_level=None)
+        # In WAL mode, transactions stay atomic and are synced to disk at checkpoints rather than each commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _blob_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.gz"
+
+    def put(self, text: str) -> str:
+        """
+        Store a text, or add a reference to it if it is already stored
+
+        Returns:
+            Key of the blob
+        """
+        key = blob_key(text)
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT refcount FROM blobs WHERE key = ?", (key,)).fetchone()
+            if row:
+                conn.execute("UPDATE blobs SET refcount = refcount + 1 WHERE key = ?", (key,))
+                # Blob files are committed by groups: one counted before a crash may never have been written
+                if self.directory is not None and not self.files.exists(self._blob_path(key)):
+                    self.files.write_bytes(self._blob_path(key), gzip.compress(text.encode('utf-8')))
+            else:
+                data = gzip.compress(text.encode('utf-8'))
+                if self.directory is not None:
+                    self.files.write_bytes(self._blob_path(key), data)
+                    data = None
+                conn.execute("INSERT INTO blobs (key, data, size, refcount) VALUES (?, ?, ?, 1)",
+                             (key, data, len(text)))
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return key
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the text of a blob, or None if it is not stored"""
+        if self.directory is not None:
+            try:
+                return gzip.decompress(self.files.read_bytes(self._blob_path(key))).decode('utf-8')
+            except FileNotFoundError:
+                return None
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT data FROM blobs WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+        return gzip.decompress(row[0]).decode('utf-8') if row else None
+
+    def release(self, keys: List[str]):
+        """Drop one reference per listed key, deleting the blobs left without reference"""
+        if not keys:
+            return
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for key in keys:
+                conn.execute("UPDATE blobs SET refcount = refcount - 1 WHERE key = ?", (key,))
+                row = conn.execute("SELECT refcount FROM blobs WHERE key = ?", (key,)).fetchone()
+                if row and row[0] <= 0:
+                    conn.execute("DELETE FROM blobs WHERE key = ?", (key,))
+                    if self.directory is not None:
+                        self.files.remove(self._blob_path(key))
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
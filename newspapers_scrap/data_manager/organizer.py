@@ -1,16 +1,55 @@
 import hashlib
 import logging
 import os
-import json
 import re
+import unicodedata
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional
-from newspapers_scrap.config.config import env
+from typing import Dict, Optional
+from newspapers_scrap.data_manager.storage import get_storage
+from newspapers_scrap.data_manager.url_index import get_url_index
 from newspapers_scrap.utils import clean_and_parse_date
 
 logger = logging.getLogger(__name__)
 
+
+def normalize_filename(text):
+    text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
+    text = re.sub(r'[\s\'"]', '_', text)
+    text = re.sub(r'[^a-zA-Z0-9_-]', '', text)
+    return text.lower()
+
+
+def add_topic_to_article(base_article_id: str, search_term: str) -> Optional[Dict]:
+    """
+    Attach a search term to an already stored article without fetching it again
+
+    Args:
+        base_article_id: Base identifier of the stored article
+        search_term: The search term that found the article again
+
+    Returns:
+        The article metadata without content, or None if the article is not stored
+    """
+    storage = get_storage()
+    processed_data = storage.get_article(base_article_id)
+    if processed_data is None:
+        logger.warning(f"Could not load stored article {base_article_id}")
+        return None
+
+    topics = processed_data.setdefault("topics", [])
+    if search_term not in topics:
+        topics.append(search_term)
+        storage.save_article(processed_data)
+        logger.info(f"Added topic '{search_term}' to stored article {base_article_id}")
+
+    storage.add_topic(base_article_id, normalize_filename(search_term))
+
+    # Return metadata without the content for the API response
+    metadata = {**processed_data}
+    metadata.pop("content", None)
+    return metadata
+
+
 def organize_article(
         article_text: str,
         url: str,
@@ -36,9 +75,7 @@ def organize_article(
         apply_spell_correction: Whether to apply spell correction
         correction_method: Which spell correction method to use ('mistral' or 'symspell')
     """
-    import unicodedata
     import tempfile
-    import glob
 
     # Apply spell correction if enabled
     if apply_spell_correction:
@@ -112,12 +149,6 @@ def organize_article(
     # Format the date for storage
     formatted_date = parsed_date.strftime('%Y-%m-%d')
 
-    def normalize_filename(text):
-        text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
-        text = re.sub(r'[\s\'"]', '_', text)
-        text = re.sub(r'[^a-zA-Z0-9_-]', '', text)
-        return text.lower()
-
     content_hash = hashlib.md5((url + article_text[:200]).encode('utf-8')).hexdigest()[:8]
     newspaper_id = normalize_filename(newspaper_name)
     base_article_id = f"article_{formatted_date}_{newspaper_id}_{content_hash}"
@@ -128,51 +159,10 @@ def organize_article(
 
     article_id = f"{base_article_id}{version_suffix}"
 
-    # Get data directories from config - using existing path implementation
-    raw_data_dir = Path(env.storage.paths.raw_data_dir)
-    processed_data_dir = Path(env.storage.paths.processed_data_dir)
-    topics_data_dir = Path(env.storage.paths.topics_data_dir)
-    versions_data_dir = Path(env.storage.paths.processed_data_dir) / "versions"
-
-    # Ensure directories exist
-    raw_data_dir.mkdir(parents=True, exist_ok=True)
-    processed_data_dir.mkdir(parents=True, exist_ok=True)
-    versions_data_dir.mkdir(parents=True, exist_ok=True)
-    topic_dir = topics_data_dir / normalize_filename(search_term)
-    topic_dir.mkdir(parents=True, exist_ok=True)
-
-    # Define path for article versions directory
-    article_versions_dir = versions_data_dir / base_article_id
-    article_versions_dir.mkdir(parents=True, exist_ok=True)
-
-    # Define file paths with normalized names
-    raw_path = raw_data_dir / f"{base_article_id}.txt"
-    version_path = article_versions_dir / f"{article_id}.json"
-
-    # The main processed file will always point to the latest version
-    processed_path = processed_data_dir / f"{base_article_id}.json"
-
-    # First, save the raw content if it doesn't exist yet
-    if not raw_path.exists():
-        with open(raw_path, "w", encoding="utf-8") as f:
-            f.write(article_text)  # Save original uncorrected text
-            logger.info(f"Raw content saved to: {raw_path}")
-
-    # Check for existing versions and get their information
-    existing_versions = []
-    version_files = glob.glob(str(article_versions_dir / "*.json"))
-
-    for vf in version_files:
-        try:
-            with open(vf, "r", encoding="utf-8") as f:
-                version_data = json.load(f)
-                existing_versions.append({
-                    "id": version_data["id"],
-                    "correction_method": version_data["correction_method"],
-                    "path": vf
-                })
-        except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Error reading version file {vf}: {str(e)}")
+    storage = get_storage()
+
+    # Ids of the versions already stored (a version saved again with the same method is replaced)
+    existing_versions = [v["id"] for v in storage.list_versions(base_article_id) if v["id"] != article_id]
 
     # Create processed content (with metadata)
     processed_data = {
@@ -183,7 +173,6 @@ def organize_article(
         "date": formatted_date,
         "topics": [search_term],
         "url": url,
-        "raw_path": str(raw_path),
         "content": corrected_text,
         "original_content": article_text,
         "spell_corrected": has_corrections,
@@ -191,30 +180,18 @@ def organize_article(
         "word_count": len(corrected_text.split()),
         "canton": canton,
         "created_at": datetime.now().isoformat(),
-        "versions": [v["id"] for v in existing_versions] + [article_id]
+        "versions": existing_versions + [article_id]
     }
 
-    # Save this version
-    with open(version_path, "w", encoding="utf-8") as f:
-        json.dump(processed_data, ensure_ascii=False, indent=2, fp=f)
-        logger.info(f"Version saved to: {version_path}")
-
-    # Always update the main processed file to point to this latest version
-    with open(processed_path, "w", encoding="utf-8") as f:
-        json.dump(processed_data, ensure_ascii=False, indent=2, fp=f)
-        logger.info(f"Main processed content updated: {processed_path}")
-
-    # Create topic reference with normalized path (pointing to main processed file)
-    topic_ref_path = topic_dir / f"{base_article_id}.json"
-
-    try:
-        if topic_ref_path.exists():
-            topic_ref_path.unlink()
-        topic_ref_path.symlink_to(processed_path.absolute())
-    except (OSError, AttributeError):
-        with open(topic_ref_path, "w", encoding="utf-8") as f:
-            ref_data = {"reference_path": str(processed_path)}
-            json.dump(ref_data, f, ensure_ascii=False, indent=2)
+    # Save this version, the raw content if it doesn't exist yet (versions are stored as deltas
+    # against it) and update the main record to the latest version, all at once
+    storage.save_article_version(processed_data, raw_text=article_text)
+    logger.info(f"Version saved: {article_id}")
+
+    storage.add_topic(base_article_id, normalize_filename(search_term))
+
+    # Remember the URL so later searches skip fetching this article
+    get_url_index().add(url, base_article_id)
 
     # Return metadata without the content for the API response
     metadata = {**processed_data}
@@ -0,0 +1,828 @@
+from abc import ABC, abstractmethod
+import json
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from newspapers_scrap.atomic_files import AtomicFileWriter, remove_temp_files
+from newspapers_scrap.config.config import env
+from newspapers_scrap.data_manager.blob_store import BlobStore, apply_delta, text_delta
+
+logger = logging.getLogger(__name__)
+
+# Article fields shown in topic listings
+SUMMARY_FIELDS = ('base_id', 'title', 'date', 'word_count', 'newspaper', 'canton')
+
+# Record fields holding article texts, stored as deltas against the raw text or as blobs
+TEXT_FIELDS = ('content', 'original_content')
+
+
+def version_entry(version: Dict[str, Any]) -> Dict[str, Any]:
+    """Metadata of a version listed by ArticleStorage.list_versions (everything but the texts)"""
+    return {
+        'id': version['id'],
+        'correction_method': version.get('correction_method', 'none'),
+        'language': version.get('language', 'fr'),
+        'word_count': version.get('word_count', 0),
+        'created_at': version.get('created_at', ''),
+    }
+
+
+def matches_filters(article: Dict[str, Any], word: Optional[str] = None, date_from: Optional[str] = None,
+                    date_to: Optional[str] = None, canton: Optional[str] = None,
+                    newspaper: Optional[str] = None, min_words: Optional[int] = None,
+                    max_words: Optional[int] = None) -> bool:
+    """
+    Check an article against the browse filters
+
+    Args:
+        article: Stored article record
+        word: Lowercase word to find in the title or content
+        date_from: First date (YYYY-MM-DD) included
+        date_to: Last date (YYYY-MM-DD) included
+        canton: Canton code (case insensitive)
+        newspaper: Lowercase part of the newspaper name
+        min_words: Minimum word count
+        max_words: Maximum word count
+
+    Returns:
+        True if the article passes every given filter
+    """
+    if word and word not in (article.get('title') or '').lower() \
+            and word not in (article.get('content') or '').lower():
+        return False
+    article_date = article.get('date') or ''
+    if (date_from and article_date < date_from) or (date_to and article_date > date_to):
+        return False
+    word_count = article.get('word_count') or 0
+    if (min_words is not None and word_count < min_words) or (max_words is not None and word_count > max_words):
+        return False
+    if canton and (article.get('canton') or '').lower() != canton.lower():
+        return False
+    if newspaper and newspaper not in (article.get('newspaper') or '').lower():
+        return False
+    return True
+
+
+class ArticleStorage(ABC):
+    """
+    Where articles, their versions and their topic membership are kept.
+
+    An article is identified by its base id and has one main record (its
+    latest version), the raw text it was scraped with, any number of version
+    records and the normalized topics it was found under. The organizer, the
+    URL index, the web app and the Mongo export only go through this
+    interface, so the backend can change without touching them.
+
+    Texts are not duplicated across records: the raw text is a blob of the
+    content-addressed blob store, and the content and original_content of
+    the main and version records are stored as word-level deltas against it
+    (or as blobs of their own when they differ too much). Records are read
+    and written with their texts, the encoding stays inside the backends.
+    """
+
+    blobs: BlobStore
+
+    def _pack(self, record: Dict[str, Any], raw_text: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Replace the texts of a record by deltas against the raw text or blob references
+
+        Args:
+            record: Main or version record
+            raw_text: Raw text the deltas refer to (None = the stored raw text of the article)
+        """
+        packed = {key: value for key, value in record.items() if key not in TEXT_FIELDS}
+        texts = {}
+        for field in TEXT_FIELDS:
+            text = record.get(field)
+            if text is None:
+                continue
+            if raw_text is None:
+                raw_text = self.get_raw(record['base_id'])
+            delta = text_delta(raw_text, text) if raw_text is not None else None
+            texts[field] = {'delta': delta} if delta is not None else {'blob': self.blobs.put(text)}
+        packed['texts'] = texts
+        return packed
+
+    def _unpack(self, packed: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Restore the texts of a stored record"""
+        if packed is None or 'texts' not in packed:
+            # Records stored before the blob store embed their texts
+            return packed
+        texts = packed.pop('texts')
+        raw_text = None
+        for field, reference in texts.items():
+            if 'blob' in reference:
+                packed[field] = self.blobs.get(reference['blob'])
+            else:
+                if raw_text is None:
+                    raw_text = self.get_raw(packed['base_id']) or ''
+                packed[field] = apply_delta(raw_text, reference['delta'])
+        return packed
+
+    @staticmethod
+    def _blob_references(packed: Optional[Dict[str, Any]]) -> List[str]:
+        """Keys of the blobs a stored record holds a reference to"""
+        texts = (packed or {}).get('texts', {})
+        return [reference['blob'] for reference in texts.values() if 'blob' in reference]
+
+    @abstractmethod
+    def save_raw(self, base_id: str, text: str):
+        """Store the raw text of an article (kept as first stored, it never changes)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_raw(self, base_id: str) -> Optional[str]:
+        """Return the raw text of an article, or None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_article(self, article: Dict[str, Any]):
+        """Store (or replace) the main record of an article, keyed by its base_id"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_article(self, base_id: str) -> Optional[Dict[str, Any]]:
+        """Return the main record of an article, or None"""
+        raise NotImplementedError
+
+    def has_article(self, base_id: str) -> bool:
+        """Whether the main record of an article is stored"""
+        return self.get_article(base_id) is not None
+
+    @abstractmethod
+    def iter_articles(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the main records of every stored article"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def count_articles(self) -> int:
+        """Number of stored articles"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_version(self, version: Dict[str, Any]):
+        """Store a version record, keyed by its id (its base_id names the article)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_version(self, version_id: str) -> Optional[Dict[str, Any]]:
+        """Return a version record, or None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_versions(self, base_id: str) -> List[Dict[str, Any]]:
+        """
+        List the versions of an article, oldest first
+
+        Returns:
+            Version metadata (id, correction_method, language, word_count, created_at)
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_topic(self, base_id: str, topic: str):
+        """Add an article to a topic (a normalized search term)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_topics(self) -> List[str]:
+        """Names of the topics holding articles, sorted"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def article_topics(self, base_id: str) -> List[str]:
+        """Names of the topics an article belongs to, sorted"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def topic_articles(self, topic: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over the main records of the articles of a topic"""
+        raise NotImplementedError
+
+    def save_article_version(self, version: Dict[str, Any], article: Optional[Dict[str, Any]] = None,
+                             raw_text: Optional[str] = None):
+        """
+        Store a version together with the main record of its article
+
+        Args:
+            version: Version record
+            article: Main record (None = the version becomes the main record)
+            raw_text: Raw text of the article, stored if it is not yet
+        """
+        if raw_text is not None:
+            self.save_raw(version['base_id'], raw_text)
+        self.save_version(version)
+        # Written last: a main record never refers to a version that was not stored
+        self.save_article(article if article is not None else version)
+
+    def sync(self):
+        """Flush the pending writes to disk"""
+
+    def find_articles(self, topic: Optional[str] = None, **filters) -> List[Dict[str, Any]]:
+        """
+        Summaries of the articles matching the browse filters, sorted by base id
+
+        Args:
+            topic: Only articles of this topic (None = every article)
+            **filters: Filters of matches_filters()
+
+        Returns:
+            Article summaries with the SUMMARY_FIELDS
+        """
+        articles = self.topic_articles(topic) if topic else self.iter_articles()
+        summaries = [{field: article.get(field) for field in SUMMARY_FIELDS}
+                     for article in articles if matches_filters(article, **filters)]
+        summaries.sort(key=lambda summary: summary['base_id'] or '')
+        return summaries
+
+
+class JsonStorage(ArticleStorage):
+    """
+    One file per record, the historical data layout.
+
+    Raw texts are blob references ``<raw_dir>/<base_id>.json`` (plain
+    ``<base_id>.txt`` files for articles stored before the blob store) with
+    the blob files and their reference counts in ``blobs_dir``, main records
+    ``<processed_dir>/<base_id>.json``, versions
+    ``<processed_dir>/versions/<base_id>/<version_id>.json``, listed with
+    their metadata in ``manifest.json`` next to them, and topic membership a
+    symlink (or a reference JSON where symlinks are not available)
+    ``<topics_dir>/<topic>/<base_id>.json`` to the main record.
+    Files are written atomically and made durable by groups (see
+    AtomicFileWriter): reads of a record see it at once, listings once its
+    group is committed, which they force. Every listing scans directories and
+    parses files, so this backend mostly serves as a readable export of the
+    database backend.
+    """
+
+    def __init__(self, raw_dir: Union[str, Path], processed_dir: Union[str, Path], topics_dir: Union[str, Path],
+                 blobs_dir: Union[str, Path], sync_files: int = 32, sync_interval: float = 0.5):
+        """
+        Initialize the storage
+
+        Args:
+            raw_dir: Directory of the raw text references
+            processed_dir: Directory of the main records (versions go to its versions/ subdirectory)
+            topics_dir: Directory holding one subdirectory per topic
+            blobs_dir: Directory of the text blobs
+            sync_files: Written files committed to disk together (see AtomicFileWriter)
+            sync_interval: Seconds after which the written files are committed whatever their number
+        """
+        self.raw_dir = Path(raw_dir)
+        self.processed_dir = Path(processed_dir)
+        self.versions_dir = self.processed_dir / 'versions'
+        self.topics_dir = Path(topics_dir)
+        self.blobs_dir = Path(blobs_dir)
+        self.files = AtomicFileWriter(sync_files=sync_files, sync_interval=sync_interval)
+        self.blobs = BlobStore(self.blobs_dir / 'refcounts.sqlite', self.blobs_dir, files=self.files)
+        # Manifest updates are read-modify-write: serialized per article (striped to bound the number of locks)
+        self._manifest_locks = [threading.RLock() for _ in range(64)]
+
+    def _read_json(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            # Through the writer, which serves the files of the group not committed yet
+            return json.loads(self.files.read_bytes(path).decode('utf-8'))
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Could not read {path}: {e}")
+            return None
+
+    def _write_json(self, path: Path, data: Dict[str, Any]):
+        self.files.write_json(path, data)
+
+    def sync(self):
+        self.files.sync()
+
+    def recover(self) -> int:
+        """
+        Delete the temporary files of writes interrupted by a crash (run at startup)
+
+        Returns:
+            Number of files deleted
+        """
+        return remove_temp_files([self.raw_dir, self.processed_dir, self.topics_dir, self.blobs_dir])
+
+    def _article_path(self, base_id: str) -> Path:
+        return self.processed_dir / f"{base_id}.json"
+
+    def _write_record(self, path: Path, record: Dict[str, Any]):
+        """Write a main or version record, releasing the blobs of the record it replaces"""
+        previous = self._read_json(path)
+        self._write_json(path, self._pack(record))
+        self.blobs.release(self._blob_references(previous))
+
+    def save_raw(self, base_id: str, text: str):
+        raw_path = self.raw_dir / f"{base_id}.json"
+        if self.files.exists(raw_path) or raw_path.with_suffix('.txt').exists():
+            return
+        self._write_json(raw_path, {'blob': self.blobs.put(text)})
+        logger.info(f"Raw content saved to: {raw_path}")
+
+    def get_raw(self, base_id: str) -> Optional[str]:
+        reference = self._read_json(self.raw_dir / f"{base_id}.json")
+        if reference is not None:
+            return self.blobs.get(reference['blob'])
+        try:
+            with open(self.raw_dir / f"{base_id}.txt", 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def save_article(self, article: Dict[str, Any]):
+        self._write_record(self._article_path(article['base_id']), article)
+
+    def get_article(self, base_id: str) -> Optional[Dict[str, Any]]:
+        return self._unpack(self._read_json(self._article_path(base_id)))
+
+    def iter_articles(self) -> Iterator[Dict[str, Any]]:
+        if not self.processed_dir.exists():
+            return
+        # Listings only see committed files
+        self.files.sync()
+        for path in sorted(self.processed_dir.glob('*.json')):
+            article = self._unpack(self._read_json(path))
+            if article is not None:
+                yield article
+
+    def count_articles(self) -> int:
+        if not self.processed_dir.exists():
+            return 0
+        self.files.sync()
+        return sum(1 for _ in self.processed_dir.glob('*.json'))
+
+    def _manifest_path(self, base_id: str) -> Path:
+        return self.versions_dir / base_id / 'manifest.json'
+
+    def _manifest_lock(self, base_id: str) -> threading.RLock:
+        return self._manifest_locks[hash(base_id) % len(self._manifest_locks)]
+
+    def save_version(self, version: Dict[str, Any]):
+        version_path = self.versions_dir / version['base_id'] / f"{version['id']}.json"
+        self._write_record(version_path, version)
+        # Listing versions then reads one small file instead of every version with its texts
+        with self._manifest_lock(version['base_id']):
+            versions = [entry for entry in self.list_versions(version['base_id']) if entry['id'] != version['id']]
+            versions.append(version_entry(version))
+            versions.sort(key=lambda entry: entry['created_at'])
+            self._write_json(self._manifest_path(version['base_id']), {'versions': versions})
+
+    def get_version(self, version_id: str) -> Optional[Dict[str, Any]]:
+        # Version ids start with the base id of their article, which may itself contain underscores
+        for position, char in enumerate(version_id):
+            if char == '_':
+                version_path = self.versions_dir / version_id[:position] / f"{version_id}.json"
+                if self.files.exists(version_path):
+                    return self._unpack(self._read_json(version_path))
+        return None
+
+    def list_versions(self, base_id: str) -> List[Dict[str, Any]]:
+        manifest = self._read_json(self._manifest_path(base_id))
+        if manifest is not None:
+            return manifest['versions']
+        return self._rebuild_manifest(base_id)
+
+    def _rebuild_manifest(self, base_id: str) -> List[Dict[str, Any]]:
+        """Build the manifest of versions stored before manifests existed (or whose manifest is unreadable)"""
+        article_versions_dir = self.versions_dir / base_id
+        if not article_versions_dir.is_dir():
+            return []
+        with self._manifest_lock(base_id):
+            versions = []
+            for path in article_versions_dir.glob('*.json'):
+                if path.name == 'manifest.json':
+                    continue
+                version = self._read_json(path)
+                if version and version.get('id'):
+                    versions.append(version_entry(version))
+            versions.sort(key=lambda entry: entry['created_at'])
+            self._write_json(self._manifest_path(base_id), {'versions': versions})
+        return versions
+
+    def add_topic(self, base_id: str, topic: str):
+        topic_ref_path = self.topics_dir / topic / f"{base_id}.json"
+        article_path = self._article_path(base_id)
+        try:
+            self.files.symlink(topic_ref_path, article_path.absolute())
+        except (OSError, AttributeError):
+            self._write_json(topic_ref_path, {"reference_path": str(article_path)})
+
+    def list_topics(self) -> List[str]:
+        if not self.topics_dir.exists():
+            return []
+        return sorted(topic_dir.name for topic_dir in self.topics_dir.iterdir() if topic_dir.is_dir())
+
+    def article_topics(self, base_id: str) -> List[str]:
+        return [topic for topic in self.list_topics()
+                if (self.topics_dir / topic / f"{base_id}.json").is_symlink()
+                or (self.topics_dir / topic / f"{base_id}.json").exists()]
+
+    def topic_articles(self, topic: str) -> Iterator[Dict[str, Any]]:
+        topic_dir = self.topics_dir / topic
+        if not topic_dir.is_dir():
+            return
+        self.files.sync()
+        for ref_path in sorted(topic_dir.glob('*.json')):
+            article = self._read_json(ref_path)
+            if article and 'reference_path' in article:
+                article = self._read_json(Path(article['reference_path']))
+            article = self._unpack(article)
+            if article is not None:
+                yield article
+
+
+class SqliteStorage(ArticleStorage):
+    """
+    Articles, versions and topic membership in one SQLite database.
+
+    Main and version records are stored as JSON next to indexed columns
+    (base_id, url, date, newspaper, canton, topic), so lookups and the
+    browse filters are answered by the database instead of directory scans.
+    Text blobs are kept compressed in the blobs table of the same database.
+    Like the rate limiter, every call opens a short-lived connection: the
+    scraper processes and the web app threads share the file, and WAL mode
+    lets readers proceed while one of them writes.
+    """
+
+    def __init__(self, db_path: Union[str, Path], lock_timeout: float = 30):
+        """
+        Initialize the storage
+
+        Args:
+            db_path: SQLite database file
+            lock_timeout: Seconds to wait for another process holding the database lock
+        """
+        self.db_path = Path(db_path)
+        self.lock_timeout = lock_timeout
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.blobs = BlobStore(self.db_path, lock_timeout=lock_timeout)
+        conn = self._connect()
+        try:
+            conn.executescript(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                " base_id TEXT PRIMARY KEY, url TEXT, title TEXT, date TEXT, newspaper TEXT,"
+                " canton TEXT, word_count INTEGER, data TEXT NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS articles_url ON articles (url);"
+                "CREATE INDEX IF NOT EXISTS articles_date ON articles (date);"
+                "CREATE INDEX IF NOT EXISTS articles_newspaper ON articles (newspaper);"
+                "CREATE INDEX IF NOT EXISTS articles_canton ON articles (canton);"
+                "CREATE TABLE IF NOT EXISTS raw_blobs (base_id TEXT PRIMARY KEY, blob TEXT NOT NULL);"
+                "CREATE TABLE IF NOT EXISTS versions ("
+                " id TEXT PRIMARY KEY, base_id TEXT NOT NULL, correction_method TEXT, language TEXT,"
+                " word_count INTEGER, created_at TEXT, data TEXT NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS versions_base_id ON versions (base_id);"
+                "CREATE TABLE IF NOT EXISTS article_topics ("
+                " topic TEXT NOT NULL, base_id TEXT NOT NULL, PRIMARY KEY (topic, base_id));"
+                "CREATE INDEX IF NOT EXISTS article_topics_base_id ON article_topics (base_id);"
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.lock_timeout, isolation_level=None)
+        # In WAL mode, transactions stay atomic and are synced to disk at checkpoints rather than each commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # SQLite's lower() only folds ASCII, the filters must match accented titles like str.lower()
+        conn.create_function('py_lower', 1, lambda text: text.lower() if text else '', deterministic=True)
+        return conn
+
+    def _fetch_one(self, query: str, params: tuple) -> Optional[tuple]:
+        conn = self._connect()
+        try:
+            return conn.execute(query, params).fetchone()
+        finally:
+            conn.close()
+
+    def _execute(self, query: str, params: tuple) -> int:
+        conn = self._connect()
+        try:
+            return conn.execute(query, params).rowcount
+        finally:
+            conn.close()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Return a value of the meta table (state of the database itself), or None"""
+        row = self._fetch_one("SELECT value FROM meta WHERE key = ?", (key,))
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        """Set a value of the meta table"""
+        self._execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _previous_references(self, query: str, key: str) -> List[str]:
+        """Blob references of the record a write is about to replace"""
+        row = self._fetch_one(query, (key,))
+        return self._blob_references(json.loads(row[0])) if row else []
+
+    def save_raw(self, base_id: str, text: str):
+        if self._fetch_one("SELECT 1 FROM raw_blobs WHERE base_id = ?", (base_id,)):
+            return
+        key = self.blobs.put(text)
+        if not self._execute("INSERT OR IGNORE INTO raw_blobs (base_id, blob) VALUES (?, ?)", (base_id, key)):
+            # Stored by another process in the meantime
+            self.blobs.release([key])
+
+    def get_raw(self, base_id: str) -> Optional[str]:
+        row = self._fetch_one("SELECT blob FROM raw_blobs WHERE base_id = ?", (base_id,))
+        return self.blobs.get(row[0]) if row else None
+
+    def save_article(self, article: Dict[str, Any]):
+        previous = self._previous_references("SELECT data FROM articles WHERE base_id = ?", article['base_id'])
+        self._execute(
+            "INSERT OR REPLACE INTO articles (base_id, url, title, date, newspaper, canton, word_count, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (article['base_id'], article.get('url'), article.get('title'), article.get('date'),
+             article.get('newspaper'), article.get('canton'), article.get('word_count') or 0,
+             json.dumps(self._pack(article), ensure_ascii=False))
+        )
+        self.blobs.release(previous)
+
+    def get_article(self, base_id: str) -> Optional[Dict[str, Any]]:
+        row = self._fetch_one("SELECT data FROM articles WHERE base_id = ?", (base_id,))
+        return self._unpack(json.loads(row[0])) if row else None
+
+    def has_article(self, base_id: str) -> bool:
+        return self._fetch_one("SELECT 1 FROM articles WHERE base_id = ?", (base_id,)) is not None
+
+    def _iter_data(self, query: str, params: tuple = ()) -> Iterator[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(500)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._unpack(json.loads(row[0]))
+        finally:
+            conn.close()
+
+    def iter_articles(self) -> Iterator[Dict[str, Any]]:
+        return self._iter_data("SELECT data FROM articles ORDER BY base_id")
+
+    def count_articles(self) -> int:
+        return self._fetch_one("SELECT COUNT(*) FROM articles", ())[0]
+
+    def save_version(self, version: Dict[str, Any]):
+        previous = self._previous_references("SELECT data FROM versions WHERE id = ?", version['id'])
+        self._execute(
+            "INSERT OR REPLACE INTO versions (id, base_id, correction_method, language, word_count, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (version['id'], version['base_id'], version.get('correction_method', 'none'),
+             version.get('language', 'fr'), version.get('word_count') or 0, version.get('created_at', ''),
+             json.dumps(self._pack(version), ensure_ascii=False))
+        )
+        self.blobs.release(previous)
+
+    def save_article_version(self, version: Dict[str, Any], article: Optional[Dict[str, Any]] = None,
+                             raw_text: Optional[str] = None):
+        # The raw text, version and main rows are written in one transaction, so a crash never leaves
+        # a version without its article. Blobs are stored before it (the blob store has its own
+        # transactions): a crash in between only leaves unreferenced blobs behind.
+        base_id = version['base_id']
+        article = article if article is not None else version
+        while True:
+            row = self._fetch_one("SELECT blob FROM raw_blobs WHERE base_id = ?", (base_id,))
+            new_raw_key = None
+            if row:
+                # The deltas refer to the raw text first stored
+                raw_text = self.blobs.get(row[0])
+            elif raw_text is not None:
+                new_raw_key = self.blobs.put(raw_text)
+            packed_version = self._pack(version, raw_text)
+            packed_article = self._pack(article, raw_text)
+            added = self._blob_references(packed_version) + self._blob_references(packed_article)
+            if new_raw_key:
+                added.append(new_raw_key)
+
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                stored = conn.execute("SELECT 1 FROM raw_blobs WHERE base_id = ?", (base_id,)).fetchone()
+                if not row and stored:
+                    # Raw text stored by another process in the meantime: pack against it
+                    conn.execute("ROLLBACK")
+                    self.blobs.release(added)
+                    continue
+                if new_raw_key:
+                    conn.execute("INSERT INTO raw_blobs (base_id, blob) VALUES (?, ?)", (base_id, new_raw_key))
+                previous = []
+                for query, key in (("SELECT data FROM versions WHERE id = ?", version['id']),
+                                   ("SELECT data FROM articles WHERE base_id = ?", base_id)):
+                    previous_row = conn.execute(query, (key,)).fetchone()
+                    if previous_row:
+                        previous += self._blob_references(json.loads(previous_row[0]))
+                conn.execute(
+                    "INSERT OR REPLACE INTO versions "
+                    "(id, base_id, correction_method, language, word_count, created_at, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (version['id'], base_id, version.get('correction_method', 'none'),
+                     version.get('language', 'fr'), version.get('word_count') or 0, version.get('created_at', ''),
+                     json.dumps(packed_version, ensure_ascii=False))
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO articles "
+                    "(base_id, url, title, date, newspaper, canton, word_count, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (base_id, article.get('url'), article.get('title'), article.get('date'),
+                     article.get('newspaper'), article.get('canton'), article.get('word_count') or 0,
+                     json.dumps(packed_article, ensure_ascii=False))
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                self.blobs.release(added)
+                raise
+            finally:
+                conn.close()
+            self.blobs.release(previous)
+            return
+
+    def get_version(self, version_id: str) -> Optional[Dict[str, Any]]:
+        row = self._fetch_one("SELECT data FROM versions WHERE id = ?", (version_id,))
+        return self._unpack(json.loads(row[0])) if row else None
+
+    def list_versions(self, base_id: str) -> List[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT id, correction_method, language, word_count, created_at FROM versions "
+                "WHERE base_id = ? ORDER BY created_at", (base_id,)
+            ).fetchall()
+        finally:
+            conn.close()
+        return [{'id': row[0], 'correction_method': row[1], 'language': row[2],
+                 'word_count': row[3], 'created_at': row[4]} for row in rows]
+
+    def add_topic(self, base_id: str, topic: str):
+        self._execute("INSERT OR IGNORE INTO article_topics (topic, base_id) VALUES (?, ?)", (topic, base_id))
+
+    def list_topics(self) -> List[str]:
+        conn = self._connect()
+        try:
+            return [row[0] for row in conn.execute("SELECT DISTINCT topic FROM article_topics ORDER BY topic")]
+        finally:
+            conn.close()
+
+    def article_topics(self, base_id: str) -> List[str]:
+        conn = self._connect()
+        try:
+            return [row[0] for row in conn.execute(
+                "SELECT topic FROM article_topics WHERE base_id = ? ORDER BY topic", (base_id,))]
+        finally:
+            conn.close()
+
+    def topic_articles(self, topic: str) -> Iterator[Dict[str, Any]]:
+        return self._iter_data(
+            "SELECT a.data FROM article_topics t JOIN articles a ON a.base_id = t.base_id "
+            "WHERE t.topic = ? ORDER BY a.base_id", (topic,))
+
+    def find_articles(self, topic: Optional[str] = None, word: Optional[str] = None,
+                      date_from: Optional[str] = None, date_to: Optional[str] = None,
+                      canton: Optional[str] = None, newspaper: Optional[str] = None,
+                      min_words: Optional[int] = None, max_words: Optional[int] = None) -> List[Dict[str, Any]]:
+        # The record is only read for the word filter, its content being a delta against the raw text
+        query = ("SELECT a.base_id, a.title, a.date, a.word_count, a.newspaper, a.canton"
+                 + (", a.data" if word else "") + " FROM articles a")
+        conditions, params = [], []
+        if topic:
+            query += " JOIN article_topics t ON t.base_id = a.base_id AND t.topic = ?"
+            params.append(topic)
+        if date_from:
+            conditions.append("a.date >= ?")
+            params.append(date_from)
+        if date_to:
+            conditions.append("a.date <= ?")
+            params.append(date_to)
+        if canton:
+            conditions.append("py_lower(a.canton) = ?")
+            params.append(canton.lower())
+        if newspaper:
+            conditions.append("instr(py_lower(a.newspaper), ?) > 0")
+            params.append(newspaper)
+        if min_words is not None:
+            conditions.append("a.word_count >= ?")
+            params.append(min_words)
+        if max_words is not None:
+            conditions.append("a.word_count <= ?")
+            params.append(max_words)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY a.base_id"
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+        if word:
+            rows = [row for row in rows if word in (row[1] or '').lower()
+                    or matches_filters(self._unpack(json.loads(row[-1])), word=word)]
+        return [dict(zip(SUMMARY_FIELDS, row)) for row in rows]
+
+
+def copy_storage(source: ArticleStorage, target: ArticleStorage, skip_existing: bool = False) -> int:
+    """
+    Copy every article with its raw text, versions and topics to another storage
+
+    Used to export the database to the JSON tree and to import an existing
+    JSON tree into the database. Records already in the target are replaced.
+
+    Args:
+        source: Storage to read
+        target: Storage to write
+        skip_existing: Only add the topics of the articles already in the target
+            (resumes an interrupted copy: the main record is written after the raw text and versions)
+
+    Returns:
+        Number of articles copied
+    """
+    copied = 0
+    for article in source.iter_articles():
+        base_id = article.get('base_id')
+        if not base_id:
+            continue
+        if skip_existing and target.has_article(base_id):
+            for topic in source.article_topics(base_id):
+                target.add_topic(base_id, topic)
+            continue
+        raw_text = source.get_raw(base_id)
+        if raw_text is not None:
+            target.save_raw(base_id, raw_text)
+        for version_info in source.list_versions(base_id):
+            version = source.get_version(version_info['id'])
+            if version is not None:
+                target.save_version(version)
+        target.save_article(article)
+        for topic in source.article_topics(base_id):
+            target.add_topic(base_id, topic)
+        copied += 1
+        if copied % 1000 == 0:
+            logger.info(f"Copied {copied} articles")
+    return copied
+
+
+def json_storage(root: Optional[Union[str, Path]] = None) -> JsonStorage:
+    """
+    JSON tree storage in the configured data directories, or under another root
+
+    Args:
+        root: Directory receiving raw/, processed/, by_topic/ and blobs/ (None = the PATHS directories)
+    """
+    store_config = env.storage.store
+    sync = {'sync_files': store_config.sync_files, 'sync_interval': store_config.sync_interval_ms / 1000}
+    if root is not None:
+        root = Path(root)
+        return JsonStorage(root / 'raw', root / 'processed', root / 'by_topic', root / 'blobs', **sync)
+    paths = env.storage.paths
+    return JsonStorage(paths.raw_data_dir, paths.processed_data_dir, paths.topics_data_dir, paths.blobs_dir, **sync)
+
+
+# Meta key set once the JSON tree of earlier runs is fully imported into the database
+LEGACY_IMPORT_KEY = 'legacy_json_import'
+
+_storage: Optional[ArticleStorage] = None
+# The persistence workers and the web app threads may ask for the storage at the same time
+_storage_lock = threading.Lock()
+
+
+def import_legacy_tree(storage: SqliteStorage):
+    """
+    Import the JSON tree of earlier runs into the database, once
+
+    An import interrupted by a crash is resumed on the next start (articles
+    already imported are skipped) until it completes and sets LEGACY_IMPORT_KEY.
+    """
+    if storage.get_meta(LEGACY_IMPORT_KEY):
+        return
+    legacy = json_storage()
+    if legacy.count_articles():
+        logger.info(f"Importing {legacy.count_articles()} stored articles into {storage.db_path}")
+        copied = copy_storage(legacy, storage, skip_existing=True)
+        logger.info(f"Imported {copied} articles")
+    storage.set_meta(LEGACY_IMPORT_KEY, 'completed')
+
+
+def get_storage() -> ArticleStorage:
+    """Return the process-wide article storage of the configured backend"""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                store_config = env.storage.store
+                if store_config.backend == 'json':
+                    storage = json_storage()
+                    storage.recover()
+                elif store_config.backend == 'sqlite':
+                    storage = SqliteStorage(store_config.db_path)
+                    # Built from the JSON tree of earlier runs, like the URL index
+                    import_legacy_tree(storage)
+                else:
+                    raise ValueError(f"Unknown storage backend '{store_config.backend}', expected 'json' or 'sqlite'")
+                _storage = storage
+    return _storage
@@ -0,0 +1,129 @@
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import Dict, Optional, Union
+
+from newspapers_scrap.config.config import env
+from newspapers_scrap.data_manager.storage import ArticleStorage, get_storage
+from newspapers_scrap.utils import normalize_url
+
+logger = logging.getLogger(__name__)
+
+
+class UrlIndex:
+    """
+    Persistent index from article URL to base article id.
+
+    The index is an append-only JSON Lines file so that recording an article
+    costs one small append, and several scraper processes can add entries
+    without rewriting each other's work. When the file does not exist yet it
+    is built once from the stored articles. Lookups are answered from memory
+    (the scraper runs them on its event loop); load() picks up the entries
+    appended by other processes and is called off the loop at the start of
+    each search. The persistence workers add entries meanwhile, hence the lock.
+    """
+
+    def __init__(self, index_path: Union[str, Path], storage: ArticleStorage):
+        """
+        Initialize the index
+
+        Args:
+            index_path: Path of the JSON Lines index file
+            storage: Article storage the index is built from
+        """
+        self.index_path = Path(index_path)
+        self.storage = storage
+        self._entries: Dict[str, str] = {}
+        self._offset = 0
+        self._loaded = False
+        self._lock = threading.RLock()
+
+    def load(self):
+        """Load the index (building it on first use), or read the entries appended since the last load"""
+        with self._lock:
+            if self._loaded:
+                self._read_new_entries()
+            else:
+                self._load()
+
+    def _load(self):
+        """Load the index, building it from the stored articles on first use"""
+        if not self.index_path.exists():
+            self.rebuild()
+        self._read_new_entries()
+        self._loaded = True
+
+    def _read_new_entries(self):
+        """Read entries appended since the last read (possibly by another process)"""
+        try:
+            with open(self.index_path, 'rb') as f:
+                f.seek(self._offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Another process is still writing this line
+                        break
+                    self._offset += len(line)
+                    try:
+                        entry = json.loads(line.decode('utf-8'))
+                        self._entries[entry['url']] = entry['base_id']
+                    except (json.JSONDecodeError, KeyError):
+                        logger.warning(f"Skipping malformed URL index line: {line.strip()}")
+        except FileNotFoundError:
+            pass
+
+    def rebuild(self):
+        """Rebuild the index file from the stored articles"""
+        entries = {}
+        for article in self.storage.iter_articles():
+            if article.get('url') and article.get('base_id'):
+                entries[normalize_url(article['url'])] = article['base_id']
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for url, base_id in entries.items():
+                f.write(json.dumps({'url': url, 'base_id': base_id}, ensure_ascii=False) + '\n')
+        os.replace(tmp_path, self.index_path)
+
+        self._entries = {}
+        self._offset = 0
+        logger.info(f"Built URL index with {len(entries)} articles at {self.index_path}")
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the base id of an already scraped article, or None"""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            return self._entries.get(normalize_url(url))
+
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def add(self, url: str, base_id: str):
+        """Record a stored article"""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            key = normalize_url(url)
+            if self._entries.get(key) == base_id:
+                return
+            self._entries[key] = base_id
+            line = json.dumps({'url': key, 'base_id': base_id}, ensure_ascii=False) + '\n'
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+
+
+_url_index: Optional[UrlIndex] = None
+_url_index_lock = threading.Lock()
+
+
+def get_url_index() -> UrlIndex:
+    """Return the process-wide URL index of the configured storage"""
+    global _url_index
+    if _url_index is None:
+        with _url_index_lock:
+            if _url_index is None:
+                _url_index = UrlIndex(env.storage.paths.url_index_path, get_storage())
+    return _url_index
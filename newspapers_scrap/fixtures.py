@@ -0,0 +1,74 @@
+import gzip
+import hashlib
+import json
+import logging
+from pathlib import Path
+import time
+from typing import Any, Dict, Iterator, Optional, Union
+import urllib.parse
+
+logger = logging.getLogger(__name__)
+
+
+def fixture_key(url: str) -> str:
+    """
+    Identifier of a recorded page: path and sorted query of the URL, without the host
+
+    The host is left out so pages recorded from the archive are found again when
+    the replay server runs on localhost.
+    """
+    parsed = urllib.parse.urlsplit(url)
+    query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)))
+    canonical = f"{parsed.path or '/'}?{query}"
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:24]
+
+
+class FixtureStore:
+    """
+    Recorded archive responses for offline replay.
+
+    Each page is stored as gzip-compressed HTML named after fixture_key(url),
+    and index.jsonl lists the recorded URLs with their page type.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.index_path = self.directory / 'index.jsonl'
+
+    def _page_path(self, key: str) -> Path:
+        return self.directory / 'pages' / f"{key}.html.gz"
+
+    def record(self, url: str, html: str, page_type: Optional[str] = None):
+        """Store the HTML served for a URL (a page recorded again is overwritten)"""
+        key = fixture_key(url)
+        path = self._page_path(key)
+        is_new = not path.exists()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.write(html)
+        if is_new:
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'key': key, 'url': url, 'page_type': page_type,
+                                    'recorded_at': time.time()}, ensure_ascii=False) + '\n')
+        logger.debug(f"Recorded {page_type or 'page'} fixture for {url}")
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the recorded HTML of a URL, or None if it was never recorded"""
+        path = self._page_path(fixture_key(url))
+        if not path.exists():
+            return None
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return f.read()
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the index entries of the recorded pages"""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def count(self) -> int:
+        """Number of recorded pages"""
+        return sum(1 for _ in self.entries())
@@ -0,0 +1,190 @@
+import logging
+import re
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+logger = logging.getLogger(__name__)
+
+# Container selectors simple enough to be matched while parsing: tag, #id, .class, tag#id, tag.class
+_SIMPLE_SELECTOR = re.compile(r'^([a-zA-Z][\w-]*)?(?:#([\w-]+))?((?:\.[\w-]+)*)$')
+
+
+class SelectolaxNode:
+    """
+    Adapter exposing the subset of the BeautifulSoup API used by the scraper
+    (``select``, ``select_one``, ``text``, ``get_text``, attribute access and
+    ``decompose``) on top of a selectolax node.
+    """
+
+    def __init__(self, node):
+        self._node = node
+
+    def select(self, selector: str) -> List['SelectolaxNode']:
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector: str) -> Optional['SelectolaxNode']:
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        strings = [node.text(deep=False) for node in self._node.traverse(include_text=True)
+                   if node.tag == '-text']
+        if strip:
+            strings = [string.strip() for string in strings if string.strip()]
+        return separator.join(strings)
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    def get(self, attribute: str, default=None):
+        value = self._node.attributes.get(attribute)
+        return default if value is None else value
+
+    def __getitem__(self, attribute: str):
+        return self._node.attributes[attribute]
+
+    def decompose(self):
+        self._node.decompose()
+
+
+# A parsed page: both tree types support the same select/select_one/text API
+HtmlTree = Union[BeautifulSoup, SelectolaxNode]
+
+
+class _ContainerStrainer(SoupStrainer):
+    """
+    SoupStrainer keeping only the subtrees whose root matches one of several
+    simple selectors (a plain SoupStrainer can only AND its conditions).
+    """
+
+    def __init__(self, rules: List[Tuple[Optional[str], Optional[str], List[str]]]):
+        super().__init__()
+        self.rules = rules
+
+    def _matches(self, name: str, attrs) -> bool:
+        attrs = attrs or {}
+        classes = attrs.get('class') or []
+        if isinstance(classes, str):
+            classes = classes.split()
+        for tag, element_id, required_classes in self.rules:
+            if tag and tag != name:
+                continue
+            if element_id and attrs.get('id') != element_id:
+                continue
+            if not all(cls in classes for cls in required_classes):
+                continue
+            return True
+        return False
+
+    # beautifulsoup4 >= 4.13
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return self._matches(name, attrs)
+
+    def allow_string_creation(self, string) -> bool:
+        return False
+
+    # beautifulsoup4 < 4.13
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        if isinstance(markup_name, str) and self._matches(markup_name, markup_attrs):
+            return markup_name
+        return None
+
+    def search(self, markup):
+        return None
+
+
+def _container_strainer(selectors: List[str]) -> Optional[_ContainerStrainer]:
+    """Build a strainer for the given containers, or None if one of them is not a simple selector"""
+    rules = []
+    for selector in selectors:
+        match = _SIMPLE_SELECTOR.match(selector.strip())
+        if not match or not any(match.groups()):
+            logger.warning(f"Container selector '{selector}' is too complex for partial parsing")
+            return None
+        tag, element_id, classes = match.groups()
+        rules.append((tag.lower() if tag else None, element_id,
+                      [cls for cls in classes.split('.') if cls]))
+    return _ContainerStrainer(rules)
+
+
+class HtmlParser:
+    """
+    Pluggable HTML parsing backend.
+
+    ``html.parser`` and ``lxml`` build BeautifulSoup trees and can restrict
+    parsing to the configured container elements of each page type, while
+    ``selectolax`` parses the whole document in C and is wrapped in
+    ``SelectolaxNode``. Backends whose package is missing fall back to the
+    next one in selectolax, lxml, html.parser order.
+    """
+
+    # Fastest first, each backend falls back to the ones after it
+    BACKENDS = ('selectolax', 'lxml', 'html.parser')
+
+    def __init__(self, backend: str = 'selectolax', partial: bool = True,
+                 containers: Optional[Dict[str, List[str]]] = None,
+                 on_parsed: Optional[Callable[[str, float], None]] = None):
+        """
+        Initialize the parser
+
+        Args:
+            backend: One of 'selectolax', 'lxml' or 'html.parser'
+            partial: Whether BeautifulSoup backends only build the configured containers
+            containers: CSS selectors of the subtrees needed for each page type
+            on_parsed: Callback receiving the page type and parse duration of each parse
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown parser backend '{backend}', expected one of {self.BACKENDS}")
+        self.backend = self._resolve_backend(backend)
+        self.partial = partial
+        self.containers = containers or {}
+        self.on_parsed = on_parsed
+        self._strainers: Dict[str, Optional[_ContainerStrainer]] = {}
+
+    @classmethod
+    def _resolve_backend(cls, backend: str) -> str:
+        """Fall back to the next backend when the requested package is not installed"""
+        for candidate in cls.BACKENDS[cls.BACKENDS.index(backend):]:
+            try:
+                if candidate == 'selectolax':
+                    import selectolax.lexbor  # noqa: F401
+                elif candidate == 'lxml':
+                    BeautifulSoup('', 'lxml')
+            except (ImportError, FeatureNotFound):
+                logger.warning(f"Parser backend '{candidate}' is not installed, trying the next one")
+                continue
+            return candidate
+        return 'html.parser'
+
+    def _strainer(self, page_type: Optional[str]) -> Optional[_ContainerStrainer]:
+        """Return the (cached) strainer restricting parsing to the page type's containers"""
+        if not self.partial or not self.containers.get(page_type):
+            return None
+        if page_type not in self._strainers:
+            self._strainers[page_type] = _container_strainer(self.containers[page_type])
+        return self._strainers[page_type]
+
+    def parse(self, html: str, page_type: Optional[str] = None) -> HtmlTree:
+        """
+        Parse a page
+
+        Args:
+            html: Raw HTML
+            page_type: 'search' or 'article'; selects the containers kept by partial parsing
+
+        Returns:
+            Parsed tree supporting select/select_one
+        """
+        started = time.time()
+        if self.backend == 'selectolax':
+            from selectolax.lexbor import LexborHTMLParser
+            tree = SelectolaxNode(LexborHTMLParser(html).root)
+        else:
+            tree = BeautifulSoup(html, self.backend, parse_only=self._strainer(page_type))
+
+        if self.on_parsed:
+            self.on_parsed(page_type or 'other', time.time() - started)
+        return tree
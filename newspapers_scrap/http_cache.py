@@ -0,0 +1,169 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import time
+from typing import Any, Dict, Optional, Union
+
+from newspapers_scrap.atomic_files import write_atomic
+from newspapers_scrap.utils import normalize_url
+
+logger = logging.getLogger(__name__)
+
+
+class CachedPage:
+    """A cached page body with its metadata"""
+
+    def __init__(self, html: str, meta: Dict[str, Any], fresh: bool):
+        self.html = html
+        self.meta = meta
+        self.fresh = fresh
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        if self.meta.get('etag'):
+            headers['If-None-Match'] = self.meta['etag']
+        if self.meta.get('last_modified'):
+            headers['If-Modified-Since'] = self.meta['last_modified']
+        return headers
+
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache for fetched HTML pages.
+
+    Entries are keyed by the SHA-256 of the normalized URL and stored as a
+    gzip body plus a small JSON metadata file. Freshness is decided per page
+    type, stale entries keep their validators for conditional revalidation,
+    and the least recently used entries are evicted once the byte budget is
+    exceeded.
+    """
+
+    def __init__(self, directory: Union[str, Path], max_bytes: int,
+                 ttl_seconds: Optional[Dict[str, int]] = None, default_ttl: int = 86400):
+        """
+        Initialize the cache
+
+        Args:
+            directory: Directory holding the cache entries
+            max_bytes: Budget for the compressed bodies on disk
+            ttl_seconds: Freshness lifetime per page type
+            default_ttl: Freshness lifetime for page types without a TTL
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds or {}
+        self.default_ttl = default_ttl
+        self._total_bytes = None
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        shard = self.directory / key[:2]
+        return shard / f"{key}.html.gz", shard / f"{key}.json"
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        """Write through a temporary file so readers never see a partial entry"""
+        # No fsync: an entry lost or damaged by a power failure is only a cache miss
+        write_atomic(path, data, durable=False)
+
+    def get(self, url: str, page_type: Optional[str] = None) -> Optional[CachedPage]:
+        """
+        Look up a page
+
+        Returns:
+            CachedPage (fresh or stale), or None on a miss
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with gzip.open(body_path, 'rt', encoding='utf-8') as f:
+                html = f.read()
+        except (FileNotFoundError, json.JSONDecodeError, OSError, EOFError):
+            return None
+
+        # Touch the body so eviction sees it as recently used
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+
+        ttl = self.ttl_seconds.get(page_type or meta.get('page_type'), self.default_ttl)
+        fresh = time.time() - meta.get('fetched_at', 0) < ttl
+        return CachedPage(html, meta, fresh)
+
+    def put(self, url: str, html: str, page_type: Optional[str] = None,
+            headers: Optional[Dict[str, str]] = None):
+        """Store a page body together with its validators"""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        body_path, meta_path = self._paths(url)
+        body = gzip.compress(html.encode('utf-8'))
+        meta = {
+            'url': normalize_url(url),
+            'page_type': page_type,
+            'fetched_at': time.time(),
+            'etag': headers.get('etag'),
+            'last_modified': headers.get('last-modified'),
+            'size': len(body),
+        }
+
+        try:
+            previous_size = body_path.stat().st_size if body_path.exists() else 0
+            self._atomic_write(body_path, body)
+            self._atomic_write(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Could not write cache entry for {url}: {e}")
+            return
+
+        if self._total_bytes is not None:
+            self._total_bytes += len(body) - previous_size
+        self._enforce_budget()
+
+    def refresh(self, url: str, cached: CachedPage):
+        """Mark a stale entry as fresh again after a 304 Not Modified"""
+        _, meta_path = self._paths(url)
+        cached.meta['fetched_at'] = time.time()
+        cached.fresh = True
+        try:
+            self._atomic_write(meta_path, json.dumps(cached.meta).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Could not refresh cache entry for {url}: {e}")
+
+    def _scan(self):
+        """List cache bodies as (last access, size, path) tuples"""
+        entries = []
+        for body_path in self.directory.glob('*/*.html.gz'):
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, body_path))
+        return entries
+
+    def _enforce_budget(self):
+        """Evict least recently used entries until the cache fits its byte budget"""
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self._scan())
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        # Evict down to 90% of the budget so we do not rescan on every write
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for _, size, body_path in sorted(self._scan()):
+            if self._total_bytes <= target:
+                break
+            meta_path = body_path.with_name(body_path.name[:-len('.html.gz')] + '.json')
+            for path in (body_path, meta_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            self._total_bytes -= size
+            evicted += 1
+        logger.info(f"Evicted {evicted} cache entries, cache now uses {self._total_bytes} bytes")
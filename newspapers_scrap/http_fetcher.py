@@ -0,0 +1,92 @@
+import logging
+from typing import Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class HttpResponse:
+    """Minimal view of an HTTP response used by the scraper"""
+
+    def __init__(self, url: str, status: int, text: str, headers: Dict[str, str]):
+        self.url = url
+        self.status = status
+        self.text = text
+        self.headers = headers
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+class HttpFetcher:
+    """
+    Lightweight fetch backend for server-rendered pages.
+
+    Uses one pooled ``aiohttp.ClientSession`` with keep-alive connections so
+    pages that do not need JavaScript are fetched without starting a browser.
+    """
+
+    def __init__(self, user_agent: str, timeout: float = 20, connection_limit: int = 4,
+                 keepalive_timeout: float = 30):
+        """
+        Initialize the fetcher
+
+        Args:
+            user_agent: User agent sent with every request
+            timeout: Total timeout for a single request in seconds
+            connection_limit: Maximum number of pooled connections
+            keepalive_timeout: How long idle connections are kept open in seconds
+        """
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.connection_limit = connection_limit
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the shared session on first use (it must live inside the event loop)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    'User-Agent': self.user_agent,
+                    'Accept': 'text/html,application/xhtml+xml',
+                    'Accept-Language': 'fr,de;q=0.8,en;q=0.5',
+                }
+            )
+            logger.info("Created pooled HTTP session")
+        return self._session
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> Optional[HttpResponse]:
+        """
+        Fetch a URL and return its decoded body
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+
+        Returns:
+            HttpResponse, or None if the request failed at the network level
+        """
+        session = await self._get_session()
+        try:
+            async with session.get(url, headers=headers) as response:
+                text = await response.text(errors='replace')
+                return HttpResponse(url, response.status, text, dict(response.headers))
+        except Exception as e:
+            logger.warning(f"HTTP fetch failed for {url}: {e}")
+            return None
+
+    async def close(self):
+        """Close the pooled session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+            logger.info("Closed pooled HTTP session")
+        self._session = None
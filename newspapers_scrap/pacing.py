@@ -0,0 +1,107 @@
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AimdPacer:
+    """
+    Adaptive per-host request pacing (additive increase, multiplicative decrease).
+
+    While responses are healthy and latencies stay close to their moving
+    baseline, the request rate grows by a fixed step. A 429, a 5xx, a network
+    error or a latency spike multiplies the interval between requests
+    instead. The scheduler never spaces requests closer than the robots.txt
+    crawl delay, whatever the pacer suggests.
+    """
+
+    def __init__(self, initial_interval: float, min_interval: float, max_interval: float,
+                 additive_increase: float = 0.05, decrease_factor: float = 2.0,
+                 latency_spike_ratio: float = 2.0, latency_alpha: float = 0.2,
+                 on_adjust: Optional[Callable[[str, float, str], None]] = None):
+        """
+        Initialize the pacer
+
+        Args:
+            initial_interval: Interval in seconds between two requests to a new host
+            min_interval: Shortest interval the pacer may reach
+            max_interval: Longest interval the pacer may back off to
+            additive_increase: Requests per second added to the rate after a healthy response
+            decrease_factor: Factor applied to the interval after a congestion signal
+            latency_spike_ratio: Latency above this multiple of the baseline counts as a spike
+            latency_alpha: Weight of the newest sample in the latency baseline (EWMA)
+            on_adjust: Callback receiving the host, new interval and reason of each change
+        """
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.additive_increase = additive_increase
+        self.decrease_factor = decrease_factor
+        self.latency_spike_ratio = latency_spike_ratio
+        self.latency_alpha = latency_alpha
+        self.on_adjust = on_adjust
+        self._intervals: Dict[str, float] = {}
+        # Latency baselines per host and backend (browser pages are much slower than HTTP)
+        self._baselines: Dict[Tuple[str, str], float] = {}
+
+    def interval(self, host: str) -> float:
+        """Return the current interval between two requests to a host"""
+        return self._intervals.get(host, self.initial_interval)
+
+    def _set_interval(self, host: str, interval: float, reason: str):
+        interval = min(self.max_interval, max(self.min_interval, interval))
+        previous = self.interval(host)
+        self._intervals[host] = interval
+        if interval == previous:
+            return
+        if reason != 'increase':
+            logger.info(f"Pacing for {host}: {previous:.2f}s -> {interval:.2f}s ({reason})")
+        if self.on_adjust:
+            self.on_adjust(host, interval, reason)
+
+    def record(self, host: str, latency: Optional[float], status: Optional[int], backend: str = 'http'):
+        """
+        Feed the outcome of a request back into the pacer
+
+        Args:
+            host: Host key (scheme://netloc)
+            latency: Seconds until the response arrived (None if it never did)
+            status: HTTP status, or None for a network error
+            backend: Fetch backend, latency baselines are kept per backend
+        """
+        if status is None or status == 429 or status >= 500:
+            reason = f"status {status}" if status is not None else "network error"
+            self._set_interval(host, self.interval(host) * self.decrease_factor, reason)
+            return
+
+        if latency is None:
+            return
+        key = (host, backend)
+        baseline = self._baselines.get(key)
+        if baseline is None:
+            self._baselines[key] = latency
+            return
+
+        # Spikes enter the baseline too, so a lasting latency shift stops counting as one
+        self._baselines[key] = baseline + self.latency_alpha * (latency - baseline)
+        if latency > baseline * self.latency_spike_ratio:
+            self._set_interval(host, self.interval(host) * self.decrease_factor,
+                               f"latency {latency:.2f}s vs {baseline:.2f}s baseline")
+            return
+
+        if status < 400:
+            rate = 1 / self.interval(host) + self.additive_increase
+            self._set_interval(host, 1 / rate, 'increase')
+
+    def state(self) -> Dict[str, Any]:
+        """Current intervals and latency baselines, per host"""
+        return {
+            host: {
+                'interval': interval,
+                'latency_baselines': {
+                    backend: baseline for (baseline_host, backend), baseline in self._baselines.items()
+                    if baseline_host == host
+                },
+            }
+            for host, interval in self._intervals.items()
+        }
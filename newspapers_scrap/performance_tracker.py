@@ -21,6 +21,15 @@ class PerformanceTracker:
         self.search_terms = []
         self.error_count = 0
         self.retry_count = 0
+        self.fetch_backends = defaultdict(int)
+        self.blocked_requests = defaultdict(int)
+        self.blocked_bytes_estimate = 0
+        self.readiness_times = defaultdict(list)
+        self.parse_times = defaultdict(list)
+        # Pacing state per host, aggregated as the adjustments come in
+        self.pacing_hosts = {}
+        self.cache_events = defaultdict(int)
+        self.known_articles = 0
         self.current_query = None
         self.current_article_start_time = None
         self.current_request_start_time = None
@@ -59,45 +68,152 @@ class PerformanceTracker:
         if canton:
             self.articles_per_canton[canton] += 1
 
-    def start_article_processing(self):
+    def start_article_processing(self) -> float:
         """Start tracking the processing time for an article"""
         self.current_article_start_time = time.time()
+        return self.current_article_start_time
 
-    def stop_article_processing(self):
-        """Stop tracking the processing time for an article"""
-        if self.current_article_start_time:
-            processing_time = time.time() - self.current_article_start_time
+    def stop_article_processing(self, started_at: Optional[float] = None):
+        """
+        Stop tracking the processing time for an article
+
+        Args:
+            started_at: Value returned by start_article_processing, needed when
+                several articles are processed concurrently
+        """
+        start_time = started_at or self.current_article_start_time
+        if start_time:
+            processing_time = time.time() - start_time
             self.processing_times.append(processing_time)
-            self.current_article_start_time = None
+            if started_at is None:
+                self.current_article_start_time = None
 
-    def start_request(self):
+    def start_request(self) -> float:
         """Start tracking a network request"""
         self.current_request_start_time = time.time()
+        return self.current_request_start_time
+
+    def stop_request(self, success: bool = True, started_at: Optional[float] = None,
+                     ended_at: Optional[float] = None):
+        """
+        Stop tracking a network request
 
-    def stop_request(self, success: bool = True):
-        """Stop tracking a network request"""
-        if self.current_request_start_time:
-            request_time = time.time() - self.current_request_start_time
+        Args:
+            success: Whether the request succeeded
+            started_at: Value returned by start_request, needed for concurrent requests
+            ended_at: When the response was received, if earlier than now
+        """
+        start_time = started_at or self.current_request_start_time
+        if start_time:
+            request_time = (ended_at or time.time()) - start_time
             self.request_times.append(request_time)
-            self.current_request_start_time = None
+            if started_at is None:
+                self.current_request_start_time = None
             if not success:
                 self.error_count += 1
 
-    def start_delay(self):
+    def start_delay(self) -> float:
         """Start tracking a delay between requests"""
         self.current_delay_start_time = time.time()
+        return self.current_delay_start_time
+
+    def stop_delay(self, started_at: Optional[float] = None):
+        """
+        Stop tracking a delay between requests
 
-    def stop_delay(self):
-        """Stop tracking a delay between requests"""
-        if self.current_delay_start_time:
-            delay_time = time.time() - self.current_delay_start_time
+        Args:
+            started_at: Value returned by start_delay, needed for concurrent delays
+        """
+        start_time = started_at or self.current_delay_start_time
+        if start_time:
+            delay_time = time.time() - start_time
             self.delay_times.append(delay_time)
-            self.current_delay_start_time = None
+            if started_at is None:
+                self.current_delay_start_time = None
 
     def track_retry(self):
         """Track a retry attempt"""
         self.retry_count += 1
 
+    def track_fetch_backend(self, backend: str):
+        """Track which backend (http or browser) served a page"""
+        self.fetch_backends[backend] += 1
+
+    def track_blocked_request(self, resource_type: str, estimated_bytes: int = 0):
+        """Track a browser request aborted by the request filter"""
+        self.blocked_requests[resource_type] += 1
+        self.blocked_bytes_estimate += estimated_bytes
+
+    def track_cache(self, event: str):
+        """Track a response cache lookup outcome (hit, miss or revalidated)"""
+        self.cache_events[event] += 1
+
+    def track_known_article(self):
+        """Track a search result already stored by a previous search and not fetched again"""
+        self.known_articles += 1
+
+    def track_readiness(self, page_type: str, strategy: str, duration: float):
+        """Track how long a browser page took to become readable and which strategy was used"""
+        self.readiness_times[page_type].append((strategy, duration))
+
+    def track_parse(self, page_type: str, duration: float):
+        """Track the time spent parsing a fetched page, separately from the request time"""
+        self.parse_times[page_type].append(duration)
+
+    def track_pacing(self, host: str, interval: float, reason: str):
+        """Track a change of the adaptive pacing interval for a host (kept as aggregates, not events)"""
+        host_summary = self.pacing_hosts.setdefault(host, {
+            'current_interval': interval, 'min_interval': interval, 'max_interval': interval,
+            'increases': 0, 'decreases': 0, 'decrease_reasons': defaultdict(int),
+        })
+        host_summary['current_interval'] = interval
+        host_summary['min_interval'] = min(host_summary['min_interval'], interval)
+        host_summary['max_interval'] = max(host_summary['max_interval'], interval)
+        if reason == 'increase':
+            host_summary['increases'] += 1
+        else:
+            host_summary['decreases'] += 1
+            # Group "latency 3.10s vs 1.02s baseline" reasons together
+            host_summary['decrease_reasons']['latency' if reason.startswith('latency') else reason] += 1
+
+    def _pacing_summary(self) -> Dict[str, Any]:
+        """Summarize the pacing state per host: current interval, range and adjustments"""
+        return {host: {**host_summary, 'decrease_reasons': dict(host_summary['decrease_reasons'])}
+                for host, host_summary in self.pacing_hosts.items()}
+
+    def _parse_summary(self) -> Dict[str, Any]:
+        """Summarize parse timings, overall and per page type"""
+        all_times = [duration for durations in self.parse_times.values() for duration in durations]
+        return {
+            'count': len(all_times),
+            'total_time': sum(all_times),
+            'average_time': sum(all_times) / len(all_times) if all_times else 0,
+            'max_time': max(all_times) if all_times else 0,
+            'per_page_type': {
+                page_type: {'count': len(durations), 'average_time': sum(durations) / len(durations)}
+                for page_type, durations in self.parse_times.items()
+            },
+        }
+
+    def _readiness_summary(self) -> Dict[str, Any]:
+        """Summarize readiness timings per page type and strategy"""
+        summary = {}
+        for page_type, timings in self.readiness_times.items():
+            durations = [duration for _, duration in timings]
+            by_strategy = defaultdict(list)
+            for strategy, duration in timings:
+                by_strategy[strategy].append(duration)
+            summary[page_type] = {
+                'count': len(durations),
+                'total_time': sum(durations),
+                'average_time': sum(durations) / len(durations),
+                'strategies': {
+                    strategy: {'count': len(values), 'average_time': sum(values) / len(values)}
+                    for strategy, values in by_strategy.items()
+                },
+            }
+        return summary
+
     def generate_summary(self) -> Dict[str, Any]:
         """Generate a comprehensive summary of the scraping performance"""
         if not self.end_time:
@@ -116,6 +232,8 @@ class PerformanceTracker:
         total_delay_time = sum(self.delay_times)
         total_processing_time = sum(self.processing_times)
         
+        cache_lookups = sum(self.cache_events.values())
+
         # Calculate articles per minute
         articles_per_minute = (total_articles / total_time) * 60 if total_time > 0 else 0
         
@@ -128,6 +246,21 @@ class PerformanceTracker:
             'search_terms': self.search_terms,
             'error_count': self.error_count,
             'retry_count': self.retry_count,
+            'fetch_backends': dict(self.fetch_backends),
+            'readiness_stats': self._readiness_summary(),
+            'cache_stats': {
+                'hits': self.cache_events['hit'],
+                'revalidated': self.cache_events['revalidated'],
+                'misses': self.cache_events['miss'],
+                'hit_rate': ((self.cache_events['hit'] + self.cache_events['revalidated'])
+                             / cache_lookups * 100) if cache_lookups else 0,
+            },
+            'known_articles_skipped': self.known_articles,
+            'request_filter': {
+                'blocked_requests': dict(self.blocked_requests),
+                'total_blocked': sum(self.blocked_requests.values()),
+                'estimated_bytes_saved': self.blocked_bytes_estimate,
+            },
             'request_stats': {
                 'count': len(self.request_times),
                 'total_time': total_request_time,
@@ -135,6 +268,8 @@ class PerformanceTracker:
                 'min_time': min(self.request_times) if self.request_times else 0,
                 'max_time': max(self.request_times) if self.request_times else 0,
             },
+            'parse_stats': self._parse_summary(),
+            'pacing': self._pacing_summary(),
             'delay_stats': {
                 'count': len(self.delay_times),
                 'total_time': total_delay_time,
@@ -0,0 +1,94 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import logging
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PersistencePipeline:
+    """
+    Write-behind stage between the article fetches and the storage.
+
+    Spell correction and writes (organize_article, add_topic_to_article) run
+    on dedicated worker threads, so the event loop keeps fetching while
+    earlier articles are corrected and written. Jobs go through a bounded
+    queue: when the workers fall behind, submit() waits for a free slot,
+    which holds the fetch loop back instead of piling articles up in memory.
+    flush() is the barrier waiting for every submitted job.
+    """
+
+    def __init__(self, queue_size: int = 16, workers: int = 1):
+        """
+        Initialize the pipeline
+
+        Args:
+            queue_size: Jobs waiting for a worker before submit() blocks
+            workers: Worker threads running the jobs
+        """
+        self.queue_size = max(1, queue_size)
+        self.workers = max(1, workers)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._loop = None
+
+    def _ensure_started(self):
+        """Start the workers on the running event loop (again if the scraper moved to another loop)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='persistence')
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def submit(self, func: Callable, *args, **kwargs) -> asyncio.Future:
+        """
+        Queue a job, waiting while the queue is full
+
+        Args:
+            func: Blocking function run on a worker thread
+            *args, **kwargs: Its arguments
+
+        Returns:
+            Future resolved with the result of the job (or its exception)
+        """
+        self._ensure_started()
+        future = self._loop.create_future()
+        await self._queue.put((functools.partial(func, *args, **kwargs), future))
+        return future
+
+    async def _worker(self):
+        while True:
+            job, future = await self._queue.get()
+            try:
+                result = await self._loop.run_in_executor(self._executor, job)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self._queue.task_done()
+
+    async def flush(self):
+        """Wait until every submitted job has run"""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+
+    async def close(self):
+        """Run the queued jobs, then stop the workers"""
+        await self.flush()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._loop = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
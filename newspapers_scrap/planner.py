@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Execution orders of the planned periods
+ORDERS = ('chronological', 'largest_first', 'smallest_first')
+
+
+class SearchPlanner:
+    """
+    Count-probe planning of a search over several periods.
+
+    Before anything is scraped, the first result page of every period is
+    fetched through the scraper (so probes are cached and spaced by the
+    politeness scheduler like any request) and only its hit count is read.
+    The plan lists the hits per period, flags the periods above
+    ``max_results_per_search`` (sharded, or cut off when sharding is disabled)
+    and estimates the duration of the crawl, and the run then only visits the
+    periods that have results.
+    """
+
+    def __init__(self, scraper, probe_concurrency: int = 4):
+        """
+        Initialize the planner
+
+        Args:
+            scraper: NewspaperScraper whose fetch path (cache, scheduler) runs the probes
+            probe_concurrency: Probes kept in flight (the scheduler still spaces them per host)
+        """
+        self.scraper = scraper
+        self.probe_concurrency = max(1, probe_concurrency)
+
+    async def plan(self, query: str, periods: List[Tuple[str, Dict[str, str]]],
+                   newspapers: Optional[List[str]] = None, cantons: Optional[List[str]] = None,
+                   laq: str = 'fr', max_articles: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Probe the hit count of every period and build the plan
+
+        Args:
+            query: The search query text
+            periods: (name, filter) pairs, the filter holding the 'year' or 'decade' search argument
+            newspapers: List of newspaper codes to restrict the search to
+            cantons: List of canton codes to restrict the search to
+            laq: Language of the query
+            max_articles: Articles to collect per period (None = every reachable result)
+
+        Returns:
+            Plan with one entry per period (total_results, planned, sharded, truncated) and totals
+        """
+        cap = self.scraper.config.scraping.limits.max_results_per_search
+        sharding = self.scraper.config.scraping.sharding.enabled
+        probe_slots = asyncio.Semaphore(self.probe_concurrency)
+
+        async def probe(name: str, period_filter: Dict[str, str]) -> Dict[str, Any]:
+            async with probe_slots:
+                total = await self.scraper.count_results(
+                    query, newspapers=newspapers, cantons=cantons, laq=laq, **period_filter)
+            # Searches above the cap are sharded, or only reach the first `cap` hits
+            reachable = total if sharding else min(total, cap)
+            planned = min(reachable, max_articles) if max_articles is not None else reachable
+            logger.info(f"Plan: {name} has {total} results")
+            return {
+                'period': name,
+                'filter': period_filter,
+                'total_results': total,
+                'planned': planned,
+                'sharded': total > cap and sharding,
+                'truncated': total > cap and not sharding,
+            }
+
+        started = time.time()
+        entries = await asyncio.gather(*(probe(name, period_filter) for name, period_filter in periods))
+        planned = sum(entry['planned'] for entry in entries)
+        # Page 1 of each period was just fetched by the probe and comes from the cache
+        page_size = self.scraper.config.urls.search.page_size
+        search_pages = sum(max(0, math.ceil(entry['planned'] / page_size) - 1) for entry in entries)
+        interval = await self.scraper.scheduler.expected_interval(self.scraper.base_url)
+
+        return {
+            'query': query,
+            'newspapers': newspapers,
+            'cantons': cantons,
+            'max_results_per_search': cap,
+            'periods': entries,
+            'total_results': sum(entry['total_results'] for entry in entries),
+            'planned_articles': planned,
+            'empty_periods': [entry['period'] for entry in entries if entry['total_results'] == 0],
+            'sharded_periods': [entry['period'] for entry in entries if entry['sharded']],
+            'truncated_periods': [entry['period'] for entry in entries if entry['truncated']],
+            # Upper bound: articles already stored by earlier searches are not fetched again
+            'eta_seconds': round((planned + search_pages) * interval),
+            'probe_seconds': round(time.time() - started, 1),
+        }
+
+    @staticmethod
+    def order_periods(plan: Dict[str, Any], order: str = 'chronological') -> List[Dict[str, Any]]:
+        """
+        Return the periods of a plan that have results, in execution order
+
+        Args:
+            plan: Plan returned by plan()
+            order: 'chronological', 'largest_first' or 'smallest_first'
+
+        Returns:
+            Plan entries of the non-empty periods
+        """
+        if order not in ORDERS:
+            raise ValueError(f"Unknown plan order '{order}', expected one of {', '.join(ORDERS)}")
+        entries = [entry for entry in plan['periods'] if entry['total_results'] > 0]
+        if order == 'largest_first':
+            entries.sort(key=lambda entry: entry['total_results'], reverse=True)
+        elif order == 'smallest_first':
+            entries.sort(key=lambda entry: entry['total_results'])
+        return entries
+
+    @staticmethod
+    def format_plan(plan: Dict[str, Any]) -> str:
+        """Render a plan as a text table for the logs"""
+        lines = [f"{'Period':<12}{'Results':>10}{'Planned':>10}"]
+        for entry in plan['periods']:
+            flag = '  truncated' if entry['truncated'] else '  sharded' if entry['sharded'] else ''
+            lines.append(f"{entry['period']:<12}{entry['total_results']:>10}{entry['planned']:>10}{flag}")
+        hours, remainder = divmod(plan['eta_seconds'], 3600)
+        lines.append(f"{len(plan['periods']) - len(plan['empty_periods'])}/{len(plan['periods'])} periods "
+                     f"with results, {plan['planned_articles']} articles planned, "
+                     f"{len(plan['sharded_periods'])} sharded, {len(plan['truncated_periods'])} truncated, "
+                     f"ETA {hours}h{remainder // 60:02d}m")
+        return '\n'.join(lines)
@@ -0,0 +1,85 @@
+import logging
+from pathlib import Path
+import sqlite3
+import time
+from typing import Union
+
+logger = logging.getLogger(__name__)
+
+
+class SharedRateLimiter:
+    """
+    Per-host rate limiter shared by every scraper process on the machine.
+
+    Implements the generic cell rate algorithm (a token bucket that stores a
+    single timestamp per host): each host row holds the theoretical arrival
+    time of the next request. Reservations run inside an immediate SQLite
+    transaction, so concurrent processes are serialized by the database lock
+    and together never exceed one host budget.
+    """
+
+    def __init__(self, db_path: Union[str, Path], burst: int = 1, lock_timeout: float = 30):
+        """
+        Initialize the limiter
+
+        Args:
+            db_path: SQLite database holding the per-host state
+            burst: Number of requests allowed back to back before spacing applies
+            lock_timeout: Seconds to wait for another process holding the database lock
+        """
+        self.db_path = Path(db_path)
+        self.burst = max(1, burst)
+        self.lock_timeout = lock_timeout
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            # WAL lets readers proceed while another process holds the write lock
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits ("
+                "host TEXT PRIMARY KEY, theoretical_arrival REAL NOT NULL)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call: calls come from worker threads and other processes
+        return sqlite3.connect(self.db_path, timeout=self.lock_timeout, isolation_level=None)
+
+    def reserve(self, host: str, interval: float) -> float:
+        """
+        Reserve the next request slot for a host
+
+        Blocking (it may wait for the database lock), call it from a worker thread
+        in async code.
+
+        Args:
+            host: Host key (scheme://netloc)
+            interval: Spacing this request adds before the following one
+
+        Returns:
+            Seconds the caller has to wait before sending its request
+        """
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT theoretical_arrival FROM rate_limits WHERE host = ?", (host,)
+            ).fetchone()
+            now = time.time()
+            arrival = max(now, row[0] if row else now)
+            # Up to `burst` requests may start before their theoretical arrival time
+            start = max(now, arrival - (self.burst - 1) * interval)
+            conn.execute(
+                "INSERT INTO rate_limits (host, theoretical_arrival) VALUES (?, ?) "
+                "ON CONFLICT(host) DO UPDATE SET theoretical_arrival = excluded.theoretical_arrival",
+                (host, arrival + interval)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return start - now
@@ -0,0 +1,65 @@
+import logging
+from typing import Callable, Dict, List, Optional
+import urllib.parse
+
+logger = logging.getLogger(__name__)
+
+
+class RequestFilter:
+    """
+    Playwright route handler that drops requests the scraper does not need.
+
+    Only the text DOM of the archive pages is used, so page-scan images, fonts
+    and media are aborted, as well as every sub-resource (scripts included)
+    served from a domain outside the allow-list.
+    """
+
+    def __init__(self, blocked_resource_types: List[str], allowed_domains: List[str],
+                 estimated_bytes: Optional[Dict[str, int]] = None,
+                 on_blocked: Optional[Callable[[str, int], None]] = None):
+        """
+        Initialize the filter
+
+        Args:
+            blocked_resource_types: Playwright resource types to abort (image, font, media, ...)
+            allowed_domains: Domains (and their subdomains) allowed to serve sub-resources;
+                an empty list disables domain filtering
+            estimated_bytes: Average transfer size per resource type, used to estimate savings
+            on_blocked: Callback receiving the resource type and estimated size of each abort
+        """
+        self.blocked_resource_types = set(blocked_resource_types)
+        self.allowed_domains = [domain.lower().lstrip('.') for domain in allowed_domains]
+        self.estimated_bytes = estimated_bytes or {}
+        self.on_blocked = on_blocked
+
+    def _is_allowed_domain(self, url: str) -> bool:
+        if not self.allowed_domains:
+            return True
+        host = (urllib.parse.urlparse(url).hostname or '').lower()
+        if not host:
+            # data: and blob: URLs never leave the browser
+            return True
+        return any(host == domain or host.endswith(f".{domain}") for domain in self.allowed_domains)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """Decide whether a request of the given type and URL is aborted"""
+        if resource_type == 'document':
+            return False
+        if resource_type in self.blocked_resource_types:
+            return True
+        return not self._is_allowed_domain(url)
+
+    async def handle(self, route):
+        """Route handler passed to ``context.route``"""
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            if self.on_blocked:
+                self.on_blocked(request.resource_type, self.estimated_bytes.get(request.resource_type, 0))
+            logger.debug(f"Blocked {request.resource_type} request: {request.url}")
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def install(self, context):
+        """Attach the filter to every page of a browser context"""
+        await context.route("**/*", self.handle)
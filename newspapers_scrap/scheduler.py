@@ -0,0 +1,144 @@
+import asyncio
+from collections import defaultdict
+import logging
+import random
+from typing import Dict, Optional
+import urllib.parse
+
+logger = logging.getLogger(__name__)
+
+
+class PolitenessScheduler:
+    """
+    Central per-host request scheduler.
+
+    Every fetch asks the scheduler for a turn before it starts. Turns for the
+    same host are spaced by a random interval taken from the configured
+    ``request_delay_min/max`` budget and never closer than the robots.txt
+    crawl delay, so running more fetches concurrently does not increase the
+    request rate seen by the host. With an AimdPacer the interval adapts to
+    the host's health instead of being drawn from the fixed budget. With a SharedRateLimiter the slots are
+    reserved in a database shared by all scraper processes instead of in
+    memory, so parallel processes draw from the same per-host budget.
+    """
+
+    def __init__(self, delay_min: float, delay_max: float, robots_parser=None,
+                 respect_robots_delay: bool = True, break_probability: float = 0.1,
+                 break_range: tuple = (2, 5), limiter=None, pacer=None, jitter: float = 0.2):
+        """
+        Initialize the scheduler
+
+        Args:
+            delay_min: Minimum interval between two requests to the same host
+            delay_max: Maximum interval between two requests to the same host
+            robots_parser: SimpleRobotsParser used to look up crawl delays
+            respect_robots_delay: Whether the robots.txt crawl delay acts as a floor
+            break_probability: Chance of inserting a longer, human-like break
+            break_range: Bounds in seconds of the extra break
+            limiter: SharedRateLimiter reserving slots across processes (None = this process only)
+            pacer: AimdPacer providing adaptive intervals (None = random delay_min/max interval)
+            jitter: Relative random variation applied to the pacer's interval
+        """
+        self.delay_min = delay_min
+        self.delay_max = delay_max
+        self.robots_parser = robots_parser
+        self.respect_robots_delay = respect_robots_delay
+        self.break_probability = break_probability
+        self.break_range = break_range
+        self.limiter = limiter
+        self.pacer = pacer
+        self.jitter = jitter
+        self._next_slot: Dict[str, float] = defaultdict(float)
+        self._crawl_delays: Dict[str, Optional[float]] = {}
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    @staticmethod
+    def _host_key(url: str) -> str:
+        parsed = urllib.parse.urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    async def _crawl_delay(self, host: str) -> float:
+        """Return the robots.txt crawl delay for a host, looked up once per scheduler"""
+        if not self.respect_robots_delay or not self.robots_parser:
+            return 0
+        if host not in self._crawl_delays:
+            delay = await self.robots_parser.get_crawl_delay(host)
+            self._crawl_delays[host] = delay or 0
+            if delay:
+                logger.info(f"Respecting crawl delay of {delay} seconds for {host}")
+        return self._crawl_delays[host]
+
+    def _interval(self, host: str, crawl_delay: float) -> float:
+        """Pick the spacing before the next request to the same host"""
+        if self.pacer:
+            base = self.pacer.interval(host) * random.uniform(1 - self.jitter, 1 + self.jitter)
+        else:
+            base = random.uniform(self.delay_min, self.delay_max)
+        # The robots.txt crawl delay is a floor for both pacing modes
+        interval = max(base, crawl_delay)
+
+        # Occasionally add extra delay to simulate human breaks
+        if random.random() < self.break_probability:
+            extra_delay = random.uniform(*self.break_range)
+            logger.debug(f"Taking a slightly longer break ({interval + extra_delay:.2f}s)")
+            interval += extra_delay
+        return interval
+
+    async def expected_interval(self, url: str) -> float:
+        """
+        Average spacing between two requests to the URL's host, used for time estimates
+
+        Args:
+            url: URL of the host
+
+        Returns:
+            Mean interval in seconds, breaks included
+        """
+        host = self._host_key(url)
+        base = self.pacer.interval(host) if self.pacer else (self.delay_min + self.delay_max) / 2
+        interval = max(base, await self._crawl_delay(host))
+        return interval + self.break_probability * sum(self.break_range) / 2
+
+    async def wait_turn(self, url: str) -> float:
+        """
+        Wait until a request to the URL's host fits the politeness budget
+
+        Args:
+            url: URL about to be fetched
+
+        Returns:
+            Seconds spent waiting
+        """
+        host = self._host_key(url)
+        crawl_delay = await self._crawl_delay(host)
+
+        if self.limiter:
+            # The database lock serializes reservations of all processes
+            wait = await asyncio.to_thread(self.limiter.reserve, host, self._interval(host, crawl_delay))
+        else:
+            # Reserve a slot under the lock, but sleep outside of it so other
+            # callers can queue up their own reservations meanwhile
+            loop = asyncio.get_running_loop()
+            async with self._locks[host]:
+                now = loop.time()
+                start = max(now, self._next_slot[host])
+                self._next_slot[host] = start + self._interval(host, crawl_delay)
+            wait = start - now
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_response(self, url: str, latency: Optional[float], status: Optional[int],
+                        backend: str = 'http'):
+        """
+        Report the outcome of a request so the pacer can adapt the host's interval
+
+        Args:
+            url: URL that was fetched
+            latency: Seconds until the response arrived (None if it never did)
+            status: HTTP status, or None for a network error
+            backend: Fetch backend that made the request
+        """
+        if self.pacer:
+            self.pacer.record(self._host_key(url), latency, status, backend)
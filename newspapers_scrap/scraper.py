@@ -1,29 +1,55 @@
 # newspapers_scrap/scraper.py
+import asyncio
+from collections import deque
+from contextlib import aclosing
+import logging
+import os
+import random
 import re
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+import urllib
 
-import logging_config
-import logging
+import logging_config  # noqa: F401 (configures logging)
+from playwright.async_api import async_playwright
 
-from newspapers_scrap import performance_tracker
+from newspapers_scrap.browser_pool import BrowserContextPool
+from newspapers_scrap.checkpoint import (
+    COMPLETED,
+    CheckpointStore,
+    CrawlCheckpoint,
+    search_identity,
+)
+from newspapers_scrap.config.config import env
+from newspapers_scrap.data_manager import add_topic_to_article, organize_article
+from newspapers_scrap.data_manager.storage import get_storage
+from newspapers_scrap.data_manager.url_index import get_url_index
+from newspapers_scrap.fixtures import FixtureStore
+from newspapers_scrap.html_parser import HtmlParser, HtmlTree
+from newspapers_scrap.http_cache import CachedPage, ResponseCache
+from newspapers_scrap.http_fetcher import HttpFetcher
+from newspapers_scrap.pacing import AimdPacer
 from newspapers_scrap.performance_tracker import PerformanceTracker
+from newspapers_scrap.persistence import PersistencePipeline
+from newspapers_scrap.rate_limiter import SharedRateLimiter
 from newspapers_scrap.report_generator import ScrapingReportGenerator
+from newspapers_scrap.request_filter import RequestFilter
+from newspapers_scrap.scheduler import PolitenessScheduler
+from newspapers_scrap.security import (
+    BrowserFingerprint,
+    ProxyManager,
+    RobotsCache,
+    SimpleRobotsParser,
+    UserAgentManager,
+    exponential_backoff,
+)
+from newspapers_scrap.sharding import QuerySharder, describe_shard
 from newspapers_scrap.utils import clean_and_parse_date
 
 logger = logging.getLogger(__name__)
-import os
-import time
-import random
-import asyncio
-import urllib
-from typing import Optional, List, Any, Dict, Coroutine
-
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
 
-from newspapers_scrap.config.config import env
-from newspapers_scrap.data_manager import organize_article
-from newspapers_scrap.security import UserAgentManager, ProxyManager, BrowserFingerprint, smart_delay, \
-    exponential_backoff, SimpleRobotsParser
+# Fields of the article records streamed by iter_articles (the stored file holds the rest)
+RECORD_FIELDS = ('id', 'base_id', 'url', 'title', 'newspaper', 'date', 'canton', 'word_count')
 
 
 class NewspaperScraper:
@@ -39,37 +65,158 @@ class NewspaperScraper:
         self.delay_max = self.config.scraping.limits.request_delay_max
         self._playwright = None
         self._browser = None
+        self.context_pool = None
+        http_config = self.config.scraping.http_fetch
+        self.http_fetcher = HttpFetcher(
+            user_agent=self.headers,
+            timeout=http_config.timeout,
+            connection_limit=http_config.connection_limit,
+            keepalive_timeout=http_config.keepalive_timeout
+        ) if http_config.enabled else None
+        cache_config = self.config.scraping.http_cache
+        self.response_cache = ResponseCache(
+            cache_config.directory,
+            max_bytes=cache_config.max_bytes,
+            ttl_seconds=cache_config.ttl_seconds
+        ) if cache_config.enabled else None
+        fixtures_config = self.config.scraping.fixtures
+        self.fixture_recorder = FixtureStore(fixtures_config.directory) if fixtures_config.record else None
         self.ua_manager = UserAgentManager()
         self.fingerprint_manager = BrowserFingerprint()
-        self.robots_parser = SimpleRobotsParser(user_agent="NewspaperResearchBot/1.0")
+        robots_config = self.config.scraping.robots
+        self.robots_parser = SimpleRobotsParser(
+            user_agent="NewspaperResearchBot/1.0",
+            cache=RobotsCache(
+                self.config.scraping.rate_limit.db_path,
+                ttl_seconds=robots_config.ttl_seconds,
+                failure_ttl_seconds=robots_config.failure_ttl_seconds
+            ) if robots_config.persistent else None,
+            fetcher=self.http_fetcher
+        )
         self.respect_robots_delay = True
+        pacing_config = self.config.scraping.pacing
+        self.pacer = AimdPacer(
+            initial_interval=pacing_config.initial_interval or (self.delay_min + self.delay_max) / 2,
+            min_interval=pacing_config.min_interval or self.delay_min,
+            max_interval=pacing_config.max_interval,
+            additive_increase=pacing_config.additive_increase,
+            decrease_factor=pacing_config.decrease_factor,
+            latency_spike_ratio=pacing_config.latency_spike_ratio,
+            latency_alpha=pacing_config.latency_alpha,
+            # Looked up on each call since run_search swaps in a shared tracker
+            on_adjust=lambda host, interval, reason: self.performance_tracker.track_pacing(
+                host, interval, reason)
+        ) if pacing_config.enabled else None
+        rate_limit_config = self.config.scraping.rate_limit
+        self.scheduler = PolitenessScheduler(
+            self.delay_min,
+            self.delay_max,
+            robots_parser=self.robots_parser,
+            respect_robots_delay=self.respect_robots_delay,
+            limiter=SharedRateLimiter(
+                rate_limit_config.db_path,
+                burst=rate_limit_config.burst
+            ) if rate_limit_config.shared else None,
+            pacer=self.pacer,
+            jitter=pacing_config.jitter
+        )
         self.proxy_manager = ProxyManager()
         self.current_user_agent = None
         self.current_fingerprint = None
         self.apply_spell_correction = apply_spell_correction
         self.correction_method = correction_method
-        self.performance_tracker = performance_tracker or PerformanceTracker()
+        self.performance_tracker = PerformanceTracker()
+        parser_config = self.config.scraping.parser
+        self.html_parser = HtmlParser(
+            backend=parser_config.backend,
+            partial=parser_config.partial,
+            containers=parser_config.containers,
+            # Looked up on each call since run_search swaps in a shared tracker
+            on_parsed=lambda page_type, duration: self.performance_tracker.track_parse(page_type, duration)
+        )
+        self.url_index = get_url_index()
+        concurrency_config = self.config.scraping.concurrency
+        self.persistence = PersistencePipeline(
+            queue_size=concurrency_config.persistence_queue,
+            workers=concurrency_config.persistence_workers
+        )
+        # Articles are committed to the storage before a checkpoint counting them is written
+        self.checkpoints = CheckpointStore(self.config.storage.paths.checkpoints_dir,
+                                           sync=lambda: get_storage().sync())
         self.stop_requested = False
+        # Searches of this scraper currently running (run_search may run several periods at once)
+        self._active_searches = 0
+        self._playwright_lock = asyncio.Lock()
 
     async def _init_playwright(self):
         """Initialize Playwright with standard browser"""
-        if not self._playwright:
-            self._playwright = await async_playwright().start()
+        # Concurrent searches share the browser: only the first one launches it
+        async with self._playwright_lock:
+            # The browser lives for a whole run of searches: start over if it crashed
+            if self._browser and not self._browser.is_connected():
+                logger.warning("Browser disconnected, relaunching")
+                await self._close_playwright()
+
+            if not self._playwright:
+                self._playwright = await async_playwright().start()
+
+                # Get random user agent and fingerprint
+                self.current_user_agent = self.ua_manager.get_random_user_agent()
+                self.current_fingerprint = self.fingerprint_manager.get_random_fingerprint()
+
+                # Use standard browser launch instead of BrightData
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,  # Set to False for debugging
+                    args=['--disable-dev-shm-usage']
+                )
 
-            # Get random user agent and fingerprint
-            self.current_user_agent = self.ua_manager.get_random_user_agent()
-            self.current_fingerprint = self.fingerprint_manager.get_random_fingerprint()
+                logger.info("Launched standard Chromium browser")
 
-            # Use standard browser launch instead of BrightData
-            self._browser = await self._playwright.chromium.launch(
-                headless=True,  # Set to False for debugging
-                args=['--disable-dev-shm-usage']
-            )
+                pool_config = self.config.scraping.browser_pool
+                self.context_pool = BrowserContextPool(
+                    self._new_context,
+                    size=pool_config.size,
+                    max_pages_per_context=pool_config.max_pages_per_context
+                )
 
-            logger.info("Launched standard Chromium browser")
+    async def _new_context(self):
+        """Create a browser context with realistic fingerprinting"""
+        context = await self._browser.new_context(
+            user_agent=self.current_user_agent,
+            viewport=self.current_fingerprint['viewport'],
+            locale=self.current_fingerprint['locale'],
+            timezone_id=self.current_fingerprint['timezone_id']
+        )
+        logger.info("Browser context created with fingerprinting")
+
+        # Add common headers to appear more like a real browser
+        await context.add_init_script("""
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => false
+            });
+        """)
+        logger.info("Added script to hide webdriver property")
+
+        # Skip images, fonts, media and third-party resources we never read
+        filter_config = self.config.scraping.request_filter
+        if filter_config.enabled:
+            request_filter = RequestFilter(
+                blocked_resource_types=filter_config.blocked_resource_types,
+                allowed_domains=filter_config.allowed_domains,
+                estimated_bytes=filter_config.estimated_bytes,
+                # Looked up on each call since run_search swaps in a shared tracker
+                on_blocked=lambda resource_type, size: self.performance_tracker.track_blocked_request(
+                    resource_type, size)
+            )
+            await request_filter.install(context)
+            logger.info("Installed request filter on browser context")
+        return context
 
     async def _close_playwright(self):
         """Close browser and playwright instances"""
+        if self.context_pool:
+            await self.context_pool.close()
+            self.context_pool = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -77,98 +224,262 @@ class NewspaperScraper:
             await self._playwright.stop()
             self._playwright = None
 
-    async def get_page(self, url, max_retries=3):
-        """Fetch a webpage using Playwright with robots.txt warnings"""
+    async def close(self):
+        """Wait for the pending article writes, then close the HTTP session, the browser and playwright"""
+        await self.persistence.close()
+        if self.http_fetcher:
+            await self.http_fetcher.close()
+        await self._close_playwright()
+
+    def _required_selectors(self, page_type: Optional[str]) -> List[str]:
+        """Return the selectors proving that a page of this type was rendered server-side"""
+        if page_type == 'search':
+            return [self.config.selectors.search_selectors.result_item, '#searchresultsheader']
+        if page_type == 'article':
+            return [self.config.selectors.article_selectors.article_text]
+        return []
+
+    def _parse_html(self, html: str, page_type: Optional[str] = None) -> HtmlTree:
+        """Parse raw HTML with the configured backend (restricted to the page type's containers)"""
+        return self.html_parser.parse(html, page_type)
+
+    async def get_page(self, url, max_retries=3, page_type: Optional[str] = None):
+        """
+        Fetch a webpage, trying plain HTTP first and Playwright as fallback
+
+        Args:
+            url: URL to fetch
+            max_retries: Maximum number of Playwright attempts
+            page_type: 'search' or 'article'; enables the HTTP backend for known page types
+
+        Returns:
+            Parsed tree (see html_parser.HtmlTree) or None if the page could not be fetched
+        """
         logger.info(f"Starting to fetch page: {url}")
 
+        # Serve fresh copies from the on-disk cache without touching the network
+        cached = None
+        if self.response_cache and page_type:
+            cached = self.response_cache.get(url, page_type)
+            if cached and cached.fresh:
+                logger.info(f"Serving {page_type} page from cache: {url}")
+                self.performance_tracker.track_cache('hit')
+                self._record_fixture(url, cached.html, page_type)
+                return self._parse_html(cached.html, page_type)
+
+        # Wait for the host's turn in the politeness budget
+        delay_started = self.performance_tracker.start_delay()
+        await self.add_delay(url)
+        self.performance_tracker.stop_delay(started_at=delay_started)
+
         # Track request
-        self.performance_tracker.start_request()
+        request_started = self.performance_tracker.start_request()
+
+        # Check robots.txt but don't block (the crawl delay is enforced by the scheduler).
+        # The rules were loaded with the crawl delay, so this rarely needs to await
+        if self.robots_parser.check_url_cached(url) is None:
+            await self.robots_parser.check_url(url)
+
+        # Server-rendered pages do not need a browser when the expected content is present
+        required_selectors = self._required_selectors(page_type)
+        if self.http_fetcher and required_selectors:
+            soup = await self._get_page_with_http(url, page_type, required_selectors, cached, request_started)
+            if soup is not None:
+                self.performance_tracker.track_fetch_backend('http')
+                return soup
+
+            # The browser fetch is another request to the host: it needs a turn of its own
+            delay_started = self.performance_tracker.start_delay()
+            await self.add_delay(url)
+            self.performance_tracker.stop_delay(started_at=delay_started)
+            request_started = self.performance_tracker.start_request()
+
+        if self.response_cache and page_type:
+            self.performance_tracker.track_cache('miss')
+
+        soup = await self._get_page_with_browser(url, max_retries, request_started, page_type)
+        if soup is not None:
+            self.performance_tracker.track_fetch_backend('browser')
+        return soup
+
+    async def _get_page_with_http(self, url: str, page_type: str, required_selectors: List[str],
+                                  cached: Optional[CachedPage] = None,
+                                  request_started: Optional[float] = None) -> Optional[HtmlTree]:
+        """Fetch a page over plain HTTP, returning None if the browser is needed"""
+        fetch_started = time.time()
+        response = await self.http_fetcher.fetch(url, headers=cached.validators if cached else None)
+        self.scheduler.record_response(
+            url,
+            time.time() - fetch_started if response else None,
+            response.status if response else None,
+            backend='http'
+        )
+        if response is None:
+            return None
+        # Parse time is tracked on its own, so the request ends when the body is in
+        received_at = time.time()
+
+        # A stale cache entry the server confirmed as unchanged
+        if response.status == 304 and cached:
+            logger.info(f"Cached {page_type} page revalidated: {url}")
+            self.response_cache.refresh(url, cached)
+            self.performance_tracker.track_cache('revalidated')
+            self.performance_tracker.stop_request(success=True, started_at=request_started, ended_at=received_at)
+            self._record_fixture(url, cached.html, page_type)
+            return self._parse_html(cached.html, page_type)
+
+        if not response.ok:
+            logger.info(f"HTTP fetch returned status {response.status}, falling back to Playwright")
+            return None
 
-        # Check robots.txt but don't block
-        await self.robots_parser.check_url(url)
-        logger.info(f"Checked robots.txt for {url}")
+        soup = self._parse_html(response.text, page_type)
+        if not any(soup.select_one(selector) for selector in required_selectors):
+            logger.info(f"Expected content missing from HTTP response for {url}, falling back to Playwright")
+            return None
+
+        logger.info(f"Page fetched over HTTP with status {response.status}")
+        self.performance_tracker.stop_request(success=True, started_at=request_started, ended_at=received_at)
+        if self.response_cache:
+            self.performance_tracker.track_cache('miss')
+            self.response_cache.put(url, response.text, page_type, response.headers)
+        self._record_fixture(url, response.text, page_type)
+        return soup
+
+    def _page_ready(self, soup: HtmlTree, page_type: str, strategy: str) -> bool:
+        """Whether a browser page holds its expected content (readiness selector seen, or required selectors)"""
+        if strategy == 'selector':
+            return True
+        required_selectors = self._required_selectors(page_type)
+        return any(soup.select_one(selector) for selector in required_selectors) if required_selectors else True
+
+    def _record_fixture(self, url: str, html: str, page_type: Optional[str]):
+        """Save a served page for offline replay when fixture recording is enabled"""
+        if self.fixture_recorder and page_type:
+            self.fixture_recorder.record(url, html, page_type)
+
+    def _readiness_selector(self, page_type: Optional[str]) -> Optional[str]:
+        """Return the CSS selector signalling that a page of this type is ready, if configured"""
+        readiness = self.config.scraping.readiness
+        rule = getattr(readiness, page_type, None) if readiness.enabled and page_type else None
+        if not rule:
+            return None
+        if rule.selector:
+            return rule.selector
+        return ', '.join(self._required_selectors(page_type)) or None
+
+    async def _scroll_page(self, page):
+        """Scroll through the page like a human to trigger lazily loaded content"""
+        page_height = await page.evaluate('document.body.scrollHeight')
+        view_port_height = self.current_fingerprint['viewport']['height']
+        logger.info(f"Page height: {page_height}, Viewport height: {view_port_height}")
+
+        # Scroll down in steps
+        for i in range(0, page_height, view_port_height // 2):
+            await page.evaluate(f'window.scrollTo(0, {i})')
+            logger.info(f"Scrolled to position {i}")
+            # Random pause between scrolls like a human would
+            await asyncio.sleep(random.uniform(0.1, 0.5))
+
+    async def _wait_until_ready(self, page, page_type: Optional[str]) -> str:
+        """
+        Wait until the page content can be read
 
-        # Check for robots.txt crawl delay
-        if self.respect_robots_delay:
-            parsed_url = urllib.parse.urlparse(url)
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            delay = await self.robots_parser.get_crawl_delay(base_url)
-            if delay:
-                self.delay_min = self.delay_max = delay
-                logger.info(f"Respecting crawl delay of {delay} seconds for {base_url}")
+        Pages with a readiness selector are ready as soon as it is in the DOM; the
+        networkidle and scroll routine only runs for other pages or when the
+        selector does not show up within its timeout budget.
 
+        Returns:
+            Name of the strategy that made the page ready ('selector', 'fallback' or 'networkidle')
+        """
+        selector = self._readiness_selector(page_type)
+        if selector:
+            rule = getattr(self.config.scraping.readiness, page_type)
+            try:
+                await page.wait_for_selector(selector, state='attached', timeout=rule.timeout_ms)
+                logger.info(f"Readiness selector found for {page_type} page, skipping scroll")
+                return 'selector'
+            except Exception as e:
+                logger.info(f"Readiness selector not found for {page_type} page ({e}), scrolling instead")
+                strategy = 'fallback'
+        else:
+            strategy = 'networkidle'
+
+        await page.wait_for_load_state("networkidle")
+        await self._scroll_page(page)
+
+        # Wait for the page to load completely
+        await page.wait_for_load_state("networkidle")
+        logger.info("Page load state: networkidle")
+        return strategy
+
+    async def _get_page_with_browser(self, url: str, max_retries: int = 3,
+                                     request_started: Optional[float] = None,
+                                     page_type: Optional[str] = None) -> Optional[HtmlTree]:
+        """Fetch a webpage using a pooled Playwright page"""
         retry_count = 0
 
         while retry_count < max_retries:
+            # Only failures of the navigation itself tell the pacer something about the server
+            navigating = False
             try:
                 # Make sure playwright is initialized
                 await self._init_playwright()
                 logger.info("Playwright initialized")
 
-                # Create context with realistic browser fingerprinting
-                context = await self._browser.new_context(
-                    user_agent=self.current_user_agent,
-                    viewport=self.current_fingerprint['viewport'],
-                    locale=self.current_fingerprint['locale'],
-                    timezone_id=self.current_fingerprint['timezone_id']
-                )
-                logger.info("Browser context created with fingerprinting")
-
-                # Add common headers to appear more like a real browser
-                await context.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => false
-                    });
-                """)
-                logger.info("Added script to hide webdriver property")
-
-                # Create a new page and navigate to URL
-                page = await context.new_page()
-                logger.info(f"New page created, navigating to {url}")
-                response = await page.goto(url, wait_until="networkidle", timeout=30000)
-                logger.info(f"Page navigation completed with status {response.status}")
-
-                # Check if we hit a rate limit or other error
-                if response.status >= 400:
+                # Check a warm page out of the pool and navigate to URL
+                async with self.context_pool.page() as pooled:
+                    page = pooled.page
+                    logger.info(f"Pooled page checked out, navigating to {url}")
+                    # Pages with a readiness selector only need the DOM, not every asset
+                    wait_until = "domcontentloaded" if self._readiness_selector(page_type) else "networkidle"
+                    navigation_started = time.time()
+                    navigating = True
+                    response = await page.goto(url, wait_until=wait_until, timeout=30000)
+                    navigating = False
+                    logger.info(f"Page navigation completed with status {response.status}")
+                    self.scheduler.record_response(url, time.time() - navigation_started,
+                                                   response.status, backend='browser')
+
+                    # A rate limit or other error poisons the context, hand it back for recycling
+                    if response.status >= 400:
+                        pooled.recycle()
+                        html = None
+                    else:
+                        strategy = await self._wait_until_ready(page, page_type)
+                        self.performance_tracker.track_readiness(
+                            page_type or 'other', strategy, time.time() - navigation_started)
+
+                        html = await page.content()
+
+                # Back off outside of the checkout so other fetches can use the pool meanwhile
+                if html is None:
                     retry_count += 1
-                    await context.close()
                     wait_time = exponential_backoff(retry_count)
                     logger.warning(f"Got status {response.status}, retrying after {wait_time:.2f}s")
                     await asyncio.sleep(wait_time)
                     continue
 
-                # Add random scrolling behavior like a human
-                page_height = await page.evaluate('document.body.scrollHeight')
-                view_port_height = self.current_fingerprint['viewport']['height']
-                logger.info(f"Page height: {page_height}, Viewport height: {view_port_height}")
-
-                # Scroll down in steps
-                for i in range(0, page_height, view_port_height // 2):
-                    await page.evaluate(f'window.scrollTo(0, {i})')
-                    logger.info(f"Scrolled to position {i}")
-                    # Random pause between scrolls like a human would
-                    await asyncio.sleep(random.uniform(0.1, 0.5))
-
-                # Wait for the page to load completely
-                await page.wait_for_load_state("networkidle")
-                logger.info("Page load state: networkidle")
-
-                # Get page content and parse with BeautifulSoup
-                html = await page.content()
-                soup = BeautifulSoup(html, 'html.parser')
-                logger.info("Page content fetched and parsed with BeautifulSoup")
-
-                # Close the context to free resources
-                await context.close()
-                logger.info("Browser context closed")
-
-                # Stop tracking request with success
-                self.performance_tracker.stop_request(success=True)
+                # Stop tracking request with success (parse time is tracked separately)
+                self.performance_tracker.stop_request(success=True, started_at=request_started)
+
+                # The page is back in the pool, parse outside of the checkout
+                soup = self._parse_html(html, page_type)
+                logger.info(f"Page content fetched and parsed with {self.html_parser.backend}")
+
+                # Only complete pages are cached: a page whose readiness selector timed out may
+                # be a partial render, served again from the cache if stored
+                if self.response_cache and page_type and self._page_ready(soup, page_type, strategy):
+                    self.response_cache.put(url, html, page_type)
+                self._record_fixture(url, html, page_type)
                 return soup
 
             except Exception as e:
                 retry_count += 1
                 logger.error(f"Error fetching {url} with Playwright: {e}")
+                if navigating:
+                    # No response: network error or navigation timeout. Later failures (readiness
+                    # timeouts, parsing) were already reported with the status of the response
+                    self.scheduler.record_response(url, None, None, backend='browser')
 
                 # Track retry
                 self.performance_tracker.track_retry()
@@ -180,12 +491,12 @@ class NewspaperScraper:
                 else:
                     logger.error(f"Max retries reached for {url}")
                     # Stop tracking request with failure
-                    self.performance_tracker.stop_request(success=False)
+                    self.performance_tracker.stop_request(success=False, started_at=request_started)
                     return None
 
     async def search(self, query: str, page: int = 1, newspapers: List[str] = None,
-                     cantons: List[str] = None, decade: str = None, year: str = None, laq: str = 'fr') -> Dict[
-        str, Any]:
+                     cantons: List[str] = None, decade: str = None, year: str = None, laq: str = 'fr',
+                     start: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
         Search for articles and extract results from specified newspapers and cantons
 
@@ -197,11 +508,57 @@ class NewspaperScraper:
             decade: Decade to search (e.g., "197" for 1970s)
             year: Specific year to search (e.g., "1975")
             laq: Language of the query (default is 'fr' for French)
+            start: Index of the first result to return, starting at 1 (overrides page)
+
+        Returns:
+            Dictionary containing articles and total_results count, or None if the
+            page could not be fetched (not the same as a search without results)
+        """
+        if start is None:
+            start = (page - 1) * self.config.urls.search.page_size + 1
+        search_url = self._search_url(query, start, newspapers, cantons, decade, year, laq)
+        logger.info(f"Searching with URL: {search_url}")
+        soup = await self.get_page(search_url, page_type='search')
+        if not soup:
+            return None
+
+        # Extract search results and total count
+        articles = self._extract_search_results(soup)
+        total_results = self._extract_total_results(soup)
+
+        return {
+            "articles": articles,
+            "total_results": total_results
+        }
+
+    async def count_results(self, query: str, newspapers: List[str] = None, cantons: List[str] = None,
+                            decade: str = None, year: str = None, laq: str = 'fr') -> int:
+        """
+        Return the number of hits of a search without extracting its results
+
+        Fetches the first result page like search() does (cached, and spaced by the
+        politeness scheduler), so the search that follows gets that page from the cache.
+
+        Args:
+            query: The search query text
+            newspapers: List of newspaper codes to restrict the search to
+            cantons: List of canton codes to restrict the search to
+            decade: Decade to search (e.g., "197" for 1970s)
+            year: Specific year to search (e.g., "1975")
+            laq: Language of the query (default is 'fr' for French)
 
         Returns:
-            Dictionary containing articles and total_results count
+            Total number of results (0 if the page could not be fetched)
         """
-        search_params = self.config.urls.search.params
+        search_url = self._search_url(query, 1, newspapers, cantons, decade, year, laq)
+        soup = await self.get_page(search_url, page_type='search')
+        return self._extract_total_results(soup) if soup else 0
+
+    def _search_url(self, query: str, start: int = 1, newspapers: List[str] = None, cantons: List[str] = None,
+                    decade: str = None, year: str = None, laq: str = 'fr') -> str:
+        """Build the URL of the search results page starting at result `start` (1-based)"""
+        search_config = self.config.urls.search
+        search_params = search_config.params
         params = {
             'a': search_params.a,
             'hs': search_params.hs,
@@ -210,10 +567,10 @@ class NewspaperScraper:
             'laq': laq
         }
 
-        # Calculate the starting result index for pagination
-        # Each page has 20 results, so page 1 starts at r=1, page 2 at r=21, etc.
-        start_index = ((page - 1) * 20) + 1
-        params['r'] = str(start_index)
+        # Pagination goes by result index: r=1 is the first result, r=21 the 21st, etc.
+        params['r'] = str(start)
+        if search_config.page_size_param:
+            params[search_config.page_size_param] = str(search_config.page_size)
 
         # Add newspaper filters if specified
         if newspapers:
@@ -232,22 +589,9 @@ class NewspaperScraper:
             params['yeq'] = year
 
         query_string = '&'.join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
-        search_url = f"{self.base_url}/?{query_string}"
-        logger.info(f"Searching with URL: {search_url}")
-        soup = await self.get_page(search_url)
-        if not soup:
-            return {"articles": [], "total_results": 0}
-
-        # Extract search results and total count
-        articles = self._extract_search_results(soup)
-        total_results = self._extract_total_results(soup)
-
-        return {
-            "articles": articles,
-            "total_results": total_results
-        }
+        return f"{self.base_url}/?{query_string}"
 
-    def _extract_total_results(self, soup: BeautifulSoup) -> int:
+    def _extract_total_results(self, soup: HtmlTree) -> int:
         """Extract the total number of results from the search results header"""
         try:
             # Look for the search results header
@@ -273,8 +617,8 @@ class NewspaperScraper:
             logger.warning(f"Could not extract total results count: {e}")
             return 0
 
-    def _extract_search_results(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
-        """Extract search results from the soup object"""
+    def _extract_search_results(self, soup: HtmlTree) -> List[Dict[str, Any]]:
+        """Extract search results from the parsed search page"""
         results = []
         search_selectors = self.config.selectors.search_selectors
         result_items = soup.select(search_selectors.result_item)
@@ -323,7 +667,7 @@ class NewspaperScraper:
 
     async def scrape_article_content(self, url: str) -> str:
         """Extract the full article text content from a newspaper article page"""
-        soup = await self.get_page(url)
+        soup = await self.get_page(url, page_type='article')
         if not soup:
             logger.warning(f"Could not fetch page content for {url}")
             return ""
@@ -352,10 +696,45 @@ class NewspaperScraper:
                                         max_articles: int = None, newspapers: List[str] = None,
                                         cantons: List[str] = None, decade: str = None,
                                         year: str = None, generate_report: bool = True, laq: str = 'fr',
-                                        start_from: int = 0) -> List[Dict[str, Any]]:
+                                        start_from: int = 0, concurrency: int = None,
+                                        prefetch_pages: int = None, resume: bool = False,
+                                        close_when_done: bool = True) -> Dict[str, int]:
         """
         Search for articles, extract their content, and save using the organizer
 
+        Runs iter_articles to its end and only counts the articles, so long
+        crawls do not keep anything in memory (see iter_articles for the arguments).
+
+        Returns:
+            {'count': number of articles collected}
+        """
+        count = 0
+        async with aclosing(self.iter_articles(
+                query, output_dir=output_dir, max_articles=max_articles, newspapers=newspapers,
+                cantons=cantons, decade=decade, year=year, generate_report=generate_report, laq=laq,
+                start_from=start_from, concurrency=concurrency, prefetch_pages=prefetch_pages,
+                resume=resume, close_when_done=close_when_done)) as articles:
+            async for _ in articles:
+                count += 1
+        return {'count': count}
+
+    async def iter_articles(self, query: str, output_dir: str = None,
+                            max_articles: int = None, newspapers: List[str] = None,
+                            cantons: List[str] = None, decade: str = None,
+                            year: str = None, generate_report: bool = True, laq: str = 'fr',
+                            start_from: int = 0, concurrency: int = None,
+                            prefetch_pages: int = None, resume: bool = False,
+                            close_when_done: bool = True, allow_sharding: bool = True,
+                            seen_urls: Optional[Set[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search for articles, extract their content, save them using the organizer
+        and yield a record of each article once it is stored and checkpointed
+
+        Records only hold RECORD_FIELDS and 'known' (True when the article was
+        stored by an earlier search), the text stays on disk. A consumer leaving
+        the loop early must close the generator (contextlib.aclosing) so the
+        search is checkpointed and the scraper closed.
+
         Args:
             query: The search query text
             output_dir: Directory to save the articles (override default location)
@@ -367,30 +746,68 @@ class NewspaperScraper:
             generate_report: Whether to generate a visual performance report
             laq: Language of the query (default is 'fr' for French)
             start_from: Result number to start from (skip earlier results)
-
-
-        Returns:
-            List of article metadata
+            concurrency: Number of article fetches kept in flight (default from config)
+            prefetch_pages: Number of search result pages fetched ahead (default from config)
+            resume: Continue from the checkpoint of an earlier run of the same search
+                (start_from only applies to a new checkpoint)
+            close_when_done: Close the HTTP session and the browser at the end; False when
+                the caller runs several searches with this scraper and closes it itself
+            allow_sharding: Split the search into shards when it has more results than
+                max_results_per_search (see sharding.QuerySharder)
+            seen_urls: URLs already collected by other shards of the same search, skipped
+                here; the URLs of this search are added to it
+
+        Yields:
+            Article records, in result order
         """
-        # Reset stop flag at the beginning of a new search
-        self.stop_requested = False
+        # Reset stop flag at the beginning of a new search, unless a stop is still
+        # winding down other searches running on this scraper
+        if not self._active_searches:
+            self.stop_requested = False
+
+        # Checkpoint of this query, filter set and period
+        checkpoint = self.checkpoints.open(
+            search_identity(query, newspapers, cantons, laq, decade, year),
+            start_from=start_from,
+            resume=resume,
+            job={'max_articles': max_articles,
+                 'correction_method': self.correction_method if self.apply_spell_correction else None}
+        )
+        self._active_searches += 1
+        started = False
+        completed = False
 
         try:
-            self.performance_tracker.start_tracking()  # Start tracking
+            if resume and checkpoint.status == COMPLETED:
+                logger.info(f"Search '{query}' ({year or decade or 'all time'}) already completed, nothing to resume")
+                return
+            checkpoint.start()
+            await checkpoint.flush(force=True)
+            started = True
+            start_from = checkpoint.next_index
+
+            # A tracker shared by several searches keeps the start of the first one
+            if self.performance_tracker.start_time is None:
+                self.performance_tracker.start_tracking()
             self.performance_tracker.track_search_query(query)  # Track the search query
-            all_results = []
             config_max = self.config.scraping.limits.max_results_per_search
+            concurrency = max(1, concurrency or self.config.scraping.concurrency.article_workers)
+            if prefetch_pages is None:
+                prefetch_pages = self.config.scraping.concurrency.prefetch_pages
+
+            # Known URLs are then looked up in memory (the first load scans the stored articles)
+            await asyncio.to_thread(self.url_index.load)
 
             # Get first page of results to determine total count
             logger.debug(f"start from: {start_from}")
-            starting_page = (start_from // 20) + 1
-            results_to_skip = start_from % 20
-            page = starting_page
+            # Start on a page boundary so the first page is the one already cached (e.g. by the planner)
+            page_size = self.config.urls.search.page_size
+            first_index = start_from - start_from % page_size
+            results_to_skip = start_from - first_index
 
             # Create a copy of the search parameters
             search_params = {
                 'query': query,
-                'page': page,
                 'newspapers': newspapers,
                 'cantons': cantons,
                 'laq': laq
@@ -402,14 +819,37 @@ class NewspaperScraper:
             if year:
                 search_params['year'] = year
 
-            search_result = await self.search(**search_params)
+            search_result = await self._fetch_search_page(search_params, first_index + 1, checkpoint)
+            if search_result is None:
+                # Not an empty search: leave the checkpoint interrupted so a resume fetches it again
+                logger.error(f"Could not fetch the search results of query '{query}', search interrupted")
+                return
             total_results = search_result["total_results"]
             articles = search_result["articles"]
+            # The next page starts after what the archive actually returned, whatever page_size says
+            next_start = first_index + 1 + len(articles)
+            if articles:
+                page_size = len(articles)
 
             # If no results found, return empty list
             if total_results == 0:
                 logger.info(f"No results found for query '{query}'")
-                return []
+                completed = True
+                return
+
+            # The archive stops at the cap: run the search as shards that each fit under it
+            incomplete_shards = []
+            if total_results > config_max and allow_sharding and self.config.scraping.sharding.enabled:
+                async with aclosing(self._iter_shards(
+                        query, total_results, output_dir=output_dir, max_articles=max_articles,
+                        newspapers=newspapers, cantons=cantons, decade=decade, year=year, laq=laq,
+                        concurrency=concurrency, prefetch_pages=prefetch_pages, resume=resume,
+                        incomplete_shards=incomplete_shards)) as records:
+                    async for record in records:
+                        yield record
+                # Completed only with all its shards, or a resume would skip the interrupted ones
+                completed = not self.stop_requested and not incomplete_shards
+                return
 
             # Determine max articles to process
             if max_articles is None:
@@ -421,11 +861,17 @@ class NewspaperScraper:
 
             logger.info(f"Found {total_results} total results for query '{query}', processing up to {max_articles}")
 
+            # Articles collected before an interruption count towards the limit
+            max_articles -= checkpoint.collected
+            if max_articles <= 0:
+                completed = True
+                return
+
             # Process articles
             total_collected = 0
 
             if results_to_skip > 0 and articles:
-                logger.info(f"Skipping first {results_to_skip} results on page {page}")
+                logger.info(f"Skipping first {results_to_skip} results of the page starting at {first_index + 1}")
                 articles = articles[results_to_skip:]
 
             # Fonction pour vérifier le fichier signal d'arrêt
@@ -436,96 +882,135 @@ class NewspaperScraper:
                     return True
                 return False
 
-            while total_collected < max_articles and not self.stop_requested:
-                # Vérifier périodiquement le signal d'arrêt externe
-                if total_collected % 5 == 0:  # Vérifier tous les 5 articles
-                    check_external_stop_signal()
-                if not articles:
-                    # If no more articles on current page, go to next page
-                    page += 1
-
-                    # Track delay
-                    self.performance_tracker.start_delay()
-                    await self.add_delay()
-                    self.performance_tracker.stop_delay()
-
-                    # Update page number in search parameters
-                    search_params['page'] = page
-                    search_result = await self.search(**search_params)
-                    articles = search_result["articles"]
+            # Up to `concurrency` articles are fetched at once, but they are committed
+            # in result order so that start_from stays a valid resume point.
+            # Articles already stored by an earlier search get no fetch task (None)
+            failed_pages = []
+            results = self._iter_search_results(search_params, articles, next_start, page_size,
+                                                last_start=start_from + max_articles,
+                                                prefetch_pages=prefetch_pages, checkpoint=checkpoint,
+                                                failed_pages=failed_pages)
+
+            async def indexed_results():
+                # Results whose article failed last time are retried first (index None)
+                for failed_article in list(checkpoint.failed):
+                    yield None, failed_article
+                index = start_from
+                async for article in results:
+                    yield index, article
+                    index += 1
+
+            indexed = indexed_results()
+            in_flight = deque()
+            # Articles handed to the persistence pipeline, committed once written (result order)
+            persisting = deque()
+            exhausted = False
 
-                    if not articles:
-                        logger.info(f"No more results found on page {page}. Stopping pagination.")
+            try:
+                while not self.stop_requested:
+                    # Vérifier périodiquement le signal d'arrêt externe
+                    if total_collected % 5 == 0:  # Vérifier tous les 5 articles
+                        check_external_stop_signal()
+
+                    # Keep the window full without fetching more articles than still needed
+                    while (not exhausted and not self.stop_requested
+                           and sum(task is not None for _, _, task in in_flight) < concurrency
+                           and total_collected + len(persisting) + len(in_flight) < max_articles):
+                        # No anext() default: it trips over generators awaiting in their cleanup
+                        try:
+                            index, article = await anext(indexed)
+                        except StopAsyncIteration:
+                            exhausted = True
+                            break
+                        if seen_urls is not None:
+                            if article['url'] in seen_urls:
+                                # Already collected by another shard of this search
+                                continue
+                            seen_urls.add(article['url'])
+                        if article['url'] in self.url_index:
+                            in_flight.append((index, article, None))
+                        else:
+                            in_flight.append((index, article, asyncio.create_task(self._fetch_article(article))))
+
+                    if in_flight:
+                        # Hand the next article over to the persistence pipeline (waits while it is full)
+                        index, article, fetch_task = in_flight.popleft()
+                        logger.info(f"Processing article {total_collected + len(persisting) + 1}/{max_articles}: "
+                                    f"{article['title']}")
+                        if fetch_task is None:
+                            # Already stored: only record that this query found it too
+                            write = await self.persistence.submit(
+                                add_topic_to_article, self.url_index.get(article['url']), query)
+                            persisting.append((index, article, write, True))
+                        else:
+                            write = await self._persist_fetched(article, fetch_task, query, cantons)
+                            persisting.append((index, article, write, False))
+                    elif not persisting:
                         break
 
-                # Get the next article to process
-                article = articles.pop(0)
-
-                logger.info(f"Processing article {total_collected + 1}/{max_articles}: {article['title']}")
-
-                # Track article processing time
-                self.performance_tracker.start_article_processing()
-
-                # Track delay
-                self.performance_tracker.start_delay()
-                await self.add_delay()
-                self.performance_tracker.stop_delay()
-
-                # Track request
-                self.performance_tracker.start_request()
-                article_content = await self.scrape_article_content(article['url'])
-                self.performance_tracker.stop_request(success=bool(article_content))
+                    # Commit the articles written so far; wait for the oldest one when nothing is left to fetch
+                    async with aclosing(self._commit_persisted(
+                            persisting, checkpoint, query, cantons, wait=not in_flight)) as records:
+                        async for record in records:
+                            total_collected += 1
+                            yield record
 
-                if not article_content:
-                    logger.warning(f"No content found for article: {article['title']}")
-                    continue
-
-                # Process and save the article
-                metadata = organize_article(
-                    article_text=article_content,
-                    url=article['url'],
-                    search_term=query,
-                    article_title=article['title'],
-                    newspaper_name=article.get('newspaper', 'Unknown'),
-                    date_str=article.get('date', ''),
-                    canton=cantons[0] if cantons else None,
-                    apply_spell_correction=self.apply_spell_correction,
-                    correction_method=self.correction_method,
-                )
-
-                # Track article with all metadata
-                self.performance_tracker.track_article(
-                    article_date=article.get('date', ''),
-                    newspaper=article.get('newspaper', 'Unknown'),
-                    canton=cantons[0] if cantons else None
-                )
-
-                # Stop tracking this article's processing time
-                self.performance_tracker.stop_article_processing()
-
-                all_results.append(metadata)
-                total_collected += 1
+                    # Check if we've reached the maximum
+                    if total_collected >= max_articles:
+                        break
 
-                # Check if we've reached the maximum
-                if total_collected >= max_articles:
-                    break
+                    # Check if stop was requested
+                    if self.stop_requested:
+                        logger.info("Scraping stopped by user request")
+                        break
 
-                # Check if stop was requested
-                if self.stop_requested:
-                    logger.info("Scraping stopped by user request")
-                    break
+                # Barrier: the articles already handed over are written and committed before returning,
+                # also when a stop was requested
+                while persisting:
+                    async with aclosing(self._commit_persisted(
+                            persisting, checkpoint, query, cantons, wait=True)) as records:
+                        async for record in records:
+                            total_collected += 1
+                            yield record
+            finally:
+                # Drop fetches that will never be committed
+                pending = [task for _, _, task in in_flight if task is not None]
+                for fetch_task in pending:
+                    fetch_task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                await indexed.aclose()
+                await results.aclose()
+                # Left early: the articles handed over are stored anyway, checkpoint them
+                while persisting:
+                    try:
+                        async with aclosing(self._commit_persisted(
+                                persisting, checkpoint, query, cantons, wait=True)) as records:
+                            async for _ in records:
+                                pass
+                    except Exception as e:
+                        logger.error(f"Error storing article: {e}")
 
             if self.stop_requested:
                 logger.info(f"Scraping stopped after processing {total_collected} articles")
 
-            return all_results
+            # A result page that could not be fetched ended the search early: resumable, not completed
+            completed = not self.stop_requested and not failed_pages
         finally:
-            self.performance_tracker.stop_tracking()  # Stop tracking
-            summary = self.performance_tracker.generate_summary()  # Generate summary
-            logger.info(f"Scraping summary: {summary}")
+            self._active_searches -= 1
+            if started:
+                # A search that did not run to its end can be resumed from its checkpoint
+                checkpoint.finish(completed)
+                try:
+                    await checkpoint.flush(force=True)
+                except Exception as e:
+                    logger.error(f"Could not save checkpoint {checkpoint.path}: {e}")
+
+                self.performance_tracker.stop_tracking()  # Stop tracking
+                summary = self.performance_tracker.generate_summary()  # Generate summary
+                logger.info(f"Scraping summary: {summary}")
 
             # Generate visual report if requested
-            if generate_report and year is None and decade is None:
+            if started and generate_report and year is None and decade is None:
                 try:
                     report_generator = ScrapingReportGenerator()
                     report_path = report_generator.generate_report(summary, query)
@@ -534,12 +1019,159 @@ class NewspaperScraper:
                 except Exception as e:
                     logger.error(f"Failed to generate performance report: {e}")
 
-            # Always ensure browser and playwright are closed
-            await self._close_playwright()
+            if close_when_done:
+                await self.close()
+
+    async def _persist_fetched(self, article: Dict[str, Any], fetch_task: asyncio.Task, query: str,
+                               cantons: Optional[List[str]]) -> Optional[asyncio.Future]:
+        """
+        Wait for the fetch of an article and queue its correction and storage
+
+        Returns:
+            Future of the organize_article job, or None when the article could not be fetched
+        """
+        try:
+            article_content, processing_started = await fetch_task
+        except Exception as e:
+            logger.error(f"Error fetching article {article['url']}: {e}")
+            article_content, processing_started = "", None
+
+        if not article_content:
+            logger.warning(f"No content found for article: {article['title']}")
+            return None
+
+        # Track article with all metadata
+        self.performance_tracker.track_article(
+            article_date=article.get('date', ''),
+            newspaper=article.get('newspaper', 'Unknown'),
+            canton=cantons[0] if cantons else None
+        )
+
+        # Stop tracking this article's processing time (correction and writes overlap the next fetches)
+        self.performance_tracker.stop_article_processing(started_at=processing_started)
+
+        # Process and save the article
+        return await self.persistence.submit(
+            organize_article,
+            article_text=article_content,
+            url=article['url'],
+            search_term=query,
+            article_title=article['title'],
+            newspaper_name=article.get('newspaper', 'Unknown'),
+            date_str=article.get('date', ''),
+            canton=cantons[0] if cantons else None,
+            apply_spell_correction=self.apply_spell_correction,
+            correction_method=self.correction_method,
+        )
+
+    async def _commit_persisted(self, persisting: deque, checkpoint: CrawlCheckpoint, query: str,
+                                cantons: Optional[List[str]], wait: bool = False) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Checkpoint the articles at the head of the persistence queue once written
+
+        Args:
+            persisting: (index, article, write future or None if the fetch failed, known) entries
+                in result order; the committed ones are removed
+            checkpoint: Checkpoint of the search
+            query: The search query text
+            cantons: Canton filter of the search
+            wait: Wait for the write of the head entry instead of stopping at it
+
+        Yields:
+            Records of the committed articles
+        """
+        while persisting and (wait or persisting[0][2] is None or persisting[0][2].done()):
+            wait = False
+            index, article, write, known = persisting.popleft()
+            if write is None:
+                checkpoint.add_failed(article)
+                checkpoint.commit(index, collected=False)
+                await checkpoint.flush()
+                continue
+
+            metadata = await write
+            if known and not metadata:
+                # The stored file is gone, fetch the article again
+                fetch_task = asyncio.create_task(self._fetch_article(article))
+                write = await self._persist_fetched(article, fetch_task, query, cantons)
+                persisting.appendleft((index, article, write, False))
+                wait = True
+                continue
+
+            if known:
+                logger.info(f"Article already stored, added topic '{query}': {article['url']}")
+                self.performance_tracker.track_known_article()
+            checkpoint.remove_failed(article)
+            checkpoint.commit(index)
+            await checkpoint.flush()
+            yield self._article_record(metadata, known=known)
+
+    async def _iter_shards(self, query: str, total_results: int, output_dir: str = None,
+                           max_articles: int = None, newspapers: List[str] = None, cantons: List[str] = None,
+                           decade: str = None, year: str = None, laq: str = 'fr', concurrency: int = None,
+                           prefetch_pages: int = None, resume: bool = False,
+                           incomplete_shards: Optional[List[Dict[str, Any]]] = None
+                           ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Collect a search with more results than max_results_per_search, shard by shard
+
+        Each shard is a search of its own (own checkpoint, same scheduler and browser);
+        a result found by several shards is only collected once.
+
+        Args:
+            query: The search query text
+            total_results: Hit count of the whole search
+            max_articles: Maximum articles over all shards (None = all)
+            incomplete_shards: Shards whose search did not complete are appended to it
+            (other arguments as in iter_articles)
+
+        Yields:
+            Article records of all shards
+        """
+        sharding_config = self.config.scraping.sharding
+        config_max = self.config.scraping.limits.max_results_per_search
+        sharder = QuerySharder(self, config_max, cantons=sharding_config.cantons,
+                               newspapers=sharding_config.newspapers)
+        shards = await sharder.split(
+            query, {'newspapers': newspapers, 'cantons': cantons, 'decade': decade, 'year': year},
+            total_results, laq=laq)
+        truncated = sum(shard['truncated'] for shard in shards)
+        logger.info(f"Found {total_results} total results for query '{query}', more than {config_max}: "
+                    f"collecting them in {len(shards)} shards ({truncated} still truncated)")
+
+        seen_urls = set()
+        collected = 0
+        for shard in shards:
+            if self.stop_requested:
+                break
+            remaining = None if max_articles is None else max_articles - collected
+            if remaining is not None and remaining <= 0:
+                break
+            logger.info(f"Collecting shard {describe_shard(shard)} ({shard['total_results']} results)")
+            async with aclosing(self.iter_articles(
+                    query, output_dir=output_dir, max_articles=remaining, newspapers=shard['newspapers'],
+                    cantons=shard['cantons'], decade=shard['decade'], year=shard['year'], generate_report=False,
+                    laq=laq, concurrency=concurrency, prefetch_pages=prefetch_pages, resume=resume,
+                    close_when_done=False, allow_sharding=False, seen_urls=seen_urls)) as records:
+                async for record in records:
+                    collected += 1
+                    yield record
+            if incomplete_shards is not None:
+                shard_checkpoint = self.checkpoints.load(search_identity(
+                    query, shard['newspapers'], shard['cantons'], laq, shard['decade'], shard['year']))
+                if shard_checkpoint is None or shard_checkpoint.status != COMPLETED:
+                    incomplete_shards.append(shard)
+
+    @staticmethod
+    def _article_record(metadata: Dict[str, Any], known: bool = False) -> Dict[str, Any]:
+        """Lightweight record of a stored article (no text)"""
+        record = {field: metadata.get(field) for field in RECORD_FIELDS}
+        record['known'] = known
+        return record
 
     @staticmethod
     def _extract_by_selector(soup, selector, join_texts=False):
-        """Extract text content from a BeautifulSoup object using a CSS selector"""
+        """Extract text content from a parsed tree using a CSS selector"""
         elements = soup.select(selector)
         if not elements:
             return ""
@@ -547,9 +1179,97 @@ class NewspaperScraper:
             return "\n\n".join([el.text.strip() for el in elements])
         return elements[0].text.strip()
 
-    async def add_delay(self):
-        """Add smart delay between requests to be respectful"""
-        await smart_delay(self.delay_min, self.delay_max)
+    async def _fetch_search_page(self, search_params: Dict[str, Any], start: int,
+                                 checkpoint: Optional[CrawlCheckpoint] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch the page of search results starting at result `start` (get_page waits for the politeness slot)
+
+        Returns:
+            The page as returned by search(), or None if it could not be fetched (not recorded)
+        """
+        if checkpoint:
+            stored = checkpoint.get_page(start)
+            if stored:
+                logger.info(f"Search results from {start} loaded from checkpoint")
+                return stored
+        search_result = await self.search(**search_params, start=start)
+        if checkpoint and search_result is not None:
+            checkpoint.record_page(start, search_result)
+            await checkpoint.flush()
+        return search_result
+
+    async def _iter_search_results(self, search_params: Dict[str, Any], articles: List[Dict[str, Any]],
+                                   next_start: int, page_size: int, last_start: int = None,
+                                   prefetch_pages: int = 0, checkpoint: Optional[CrawlCheckpoint] = None,
+                                   failed_pages: Optional[List[int]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield search results in order, fetching the following result pages as needed
+
+        Args:
+            search_params: Parameters of the search
+            articles: Results of the current page that are still to be yielded
+            next_start: Index (1-based) of the first result of the next page
+            page_size: Results per page returned by the archive, used to place the prefetched pages
+            last_start: Last result index worth fetching ahead of time (None = no bound)
+            prefetch_pages: Number of pages fetched in the background ahead of the current one
+            checkpoint: Checkpoint serving and recording the result pages
+            failed_pages: The start of a result page that could not be fetched is appended to it
+                (the results stop there, unlike at the real end of the search)
+        """
+        articles = list(articles)
+        prefetched = {}
+
+        try:
+            while True:
+                # Look ahead while the current page's articles are being processed
+                for ahead in range(next_start, next_start + prefetch_pages * page_size, page_size):
+                    if ahead in prefetched or (last_start is not None and ahead > last_start):
+                        continue
+                    logger.debug(f"Prefetching search results from {ahead}")
+                    prefetched[ahead] = asyncio.create_task(
+                        self._fetch_search_page(search_params, ahead, checkpoint))
+
+                while articles:
+                    yield articles.pop(0)
+
+                if self.stop_requested:
+                    return
+
+                # If no more articles on current page, go to next page
+                prefetch_task = prefetched.pop(next_start, None)
+                if prefetch_task:
+                    search_result = await prefetch_task
+                else:
+                    search_result = await self._fetch_search_page(search_params, next_start, checkpoint)
+                if search_result is None:
+                    logger.error(f"Could not fetch the search results from {next_start}, stopping pagination")
+                    if failed_pages is not None:
+                        failed_pages.append(next_start)
+                    return
+                # Copied: the page may also be held by the checkpoint
+                articles = list(search_result["articles"])
+
+                if not articles:
+                    logger.info(f"No more results found from {next_start}. Stopping pagination.")
+                    return
+                next_start += len(articles)
+        finally:
+            # Cancel look-ahead pages that will not be consumed (stop requested or limit reached)
+            for prefetch_task in prefetched.values():
+                prefetch_task.cancel()
+            await asyncio.gather(*prefetched.values(), return_exceptions=True)
+
+    async def _fetch_article(self, article: Dict[str, Any]) -> Tuple[str, float]:
+        """Fetch the article text (get_page waits for the politeness slot)"""
+        # Track article processing time
+        processing_started = self.performance_tracker.start_article_processing()
+
+        article_content = await self.scrape_article_content(article['url'])
+        return article_content, processing_started
+
+    async def add_delay(self, url: str = None):
+        """Wait for the host's turn in the politeness scheduler"""
+        await self.scheduler.wait_turn(url or self.base_url)
 
     def save_articles_sync(self, query: str, output_dir: str = None, max_articles: int = None,
                            newspapers: List[str] = None, cantons: List[str] = None):
@@ -1,11 +1,15 @@
-import random
-import re
 import asyncio
+from collections import defaultdict
 import logging
-import aiohttp
-import json
+from pathlib import Path
+import random
+import sqlite3
 import time
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, List, Optional, Tuple
+import urllib.parse
+from urllib.robotparser import RobotFileParser
+
+import aiohttp
 
 logger = logging.getLogger(__name__)
 
@@ -81,60 +85,170 @@ class BrowserFingerprint:
         }
 
 
-import urllib.parse
-import aiohttp
-from urllib.robotparser import RobotFileParser
-import logging
 
-logger = logging.getLogger(__name__)
+class RobotsCache:
+    """
+    robots.txt bodies persisted in SQLite with a TTL.
+
+    Shared by every scraper process on the machine (it lives next to the
+    rate limiter state), so each host's robots.txt is fetched once per TTL
+    instead of once per process.
+    """
+
+    def __init__(self, db_path, ttl_seconds: int = 86400, failure_ttl_seconds: int = 3600):
+        """
+        Initialize the cache
+
+        Args:
+            db_path: SQLite database file
+            ttl_seconds: Lifetime of a fetched robots.txt
+            failure_ttl_seconds: Lifetime of a failed fetch (allow-all) before retrying
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.failure_ttl_seconds = failure_ttl_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS robots_cache ("
+                "host TEXT PRIMARY KEY, status INTEGER, content TEXT, fetched_at REAL NOT NULL)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+
+    def get(self, host: str) -> Optional[Tuple[Optional[int], str]]:
+        """Return the fresh (status, content) stored for a host, or None; status is None for a failed fetch"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT status, content, fetched_at FROM robots_cache WHERE host = ?", (host,)
+            ).fetchone()
+        finally:
+            conn.close()
+        if not row:
+            return None
+        status, content, fetched_at = row
+        ttl = self.ttl_seconds if status is not None else self.failure_ttl_seconds
+        if time.time() - fetched_at >= ttl:
+            return None
+        return status, content or ''
+
+    def put(self, host: str, status: Optional[int], content: str = ''):
+        """Store the outcome of a robots.txt fetch (status None for a network failure)"""
+        conn = self._connect()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO robots_cache (host, status, content, fetched_at) VALUES (?, ?, ?, ?)",
+                (host, status, content, time.time())
+            )
+        finally:
+            conn.close()
 
 
 class SimpleRobotsParser:
     """Basic robots.txt parser that logs warnings but doesn't block requests"""
 
-    def __init__(self, user_agent="NewspaperResearchBot/1.0"):
+    def __init__(self, user_agent="NewspaperResearchBot/1.0", cache: Optional[RobotsCache] = None,
+                 fetcher=None):
+        """
+        Initialize the parser
+
+        Args:
+            user_agent: User agent the rules are evaluated for
+            cache: Persistent robots.txt cache shared across runs and processes
+            fetcher: HttpFetcher used to download robots.txt (None = one-off aiohttp session)
+        """
         self.user_agent = user_agent
+        self.cache = cache
+        self.fetcher = fetcher
         self.rules_cache = {}
-
-    async def fetch_robots_txt(self, base_url):
-        """Fetch and parse robots.txt file"""
+        self._locks = defaultdict(asyncio.Lock)
+
+    @staticmethod
+    def _parser_from(status: Optional[int], content: str) -> RobotFileParser:
+        parser = RobotFileParser()
+        if status == 200:
+            parser.parse(content.splitlines())
+        else:
+            # Missing or unreachable robots.txt: everything is allowed
+            parser.allow_all = True
+        return parser
+
+    async def _download(self, robots_url: str) -> Tuple[Optional[int], str]:
+        """Download robots.txt, returning (status, body) or (None, '') on a network error"""
         try:
-            robots_url = urllib.parse.urljoin(base_url, "/robots.txt")
-            if robots_url in self.rules_cache:
-                return self.rules_cache[robots_url]
-
+            if self.fetcher:
+                response = await self.fetcher.fetch(robots_url)
+                if response is None:
+                    return None, ''
+                return response.status, response.text
             async with aiohttp.ClientSession() as session:
                 async with session.get(robots_url, timeout=10) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        parser = RobotFileParser()
-                        parser.parse(content.splitlines())
-                        self.rules_cache[robots_url] = parser
-                        return parser
+                    return response.status, await response.text()
         except Exception as e:
             logger.warning(f"Error fetching robots.txt: {e}")
+            return None, ''
 
-        # Return empty parser if we can't fetch
-        empty_parser = RobotFileParser()
-        empty_parser.allow_all = True
-        self.rules_cache[base_url] = empty_parser
-        return empty_parser
-
-    async def check_url(self, url):
-        """Check if URL is allowed, log warning but don't block"""
+    async def fetch_robots_txt(self, base_url):
+        """Fetch and parse robots.txt file (memory, then disk cache, then network)"""
+        if base_url in self.rules_cache:
+            return self.rules_cache[base_url]
+
+        # Concurrent fetches to the same host share one download
+        async with self._locks[base_url]:
+            if base_url in self.rules_cache:
+                return self.rules_cache[base_url]
+
+            cached = self.cache.get(base_url) if self.cache else None
+            if cached:
+                status, content = cached
+                logger.debug(f"Loaded robots.txt for {base_url} from the persistent cache")
+            else:
+                robots_url = urllib.parse.urljoin(base_url, "/robots.txt")
+                status, content = await self._download(robots_url)
+                if status is None:
+                    logger.warning(f"Could not fetch {robots_url}, allowing all URLs")
+                if self.cache:
+                    self.cache.put(base_url, status, content)
+
+            # Failures are cached too, under the same key used for lookups
+            parser = self._parser_from(status, content)
+            self.rules_cache[base_url] = parser
+            return parser
+
+    @staticmethod
+    def _split_url(url):
         parsed_url = urllib.parse.urlparse(url)
         base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-
-        parser = await self.fetch_robots_txt(base_url)
         path = parsed_url.path
         if parsed_url.query:
             path = f"{path}?{parsed_url.query}"
+        return base_url, path
 
+    def _check(self, parser: RobotFileParser, url, path) -> bool:
         if not parser.can_fetch(self.user_agent, path):
             logger.warning(f"⚠️ URL {url} is disallowed by robots.txt, but proceeding anyway")
             return False
         return True
 
+    async def check_url(self, url):
+        """Check if URL is allowed, log warning but don't block"""
+        base_url, path = self._split_url(url)
+        parser = await self.fetch_robots_txt(base_url)
+        return self._check(parser, url, path)
+
+    def check_url_cached(self, url) -> Optional[bool]:
+        """Like check_url, without awaiting: returns None if the host's rules are not loaded yet"""
+        base_url, path = self._split_url(url)
+        parser = self.rules_cache.get(base_url)
+        if parser is None:
+            return None
+        return self._check(parser, url, path)
+
     async def get_crawl_delay(self, base_url):
         """Get crawl delay if specified"""
         parser = await self.fetch_robots_txt(base_url)
@@ -144,19 +258,6 @@ class SimpleRobotsParser:
         return delay if delay is not None else 1  # Default to 1s
 
 
-async def smart_delay(min_delay: float, max_delay: float) -> None:
-    """Add variable delay between requests with randomized patterns"""
-    base_delay = random.uniform(min_delay, max_delay)
-
-    # Occasionally add extra delay to simulate human breaks (10% chance)
-    if random.random() < 0.1:
-        extra_delay = random.uniform(2, 5)
-        logger.debug(f"Taking a slightly longer break ({base_delay + extra_delay:.2f}s)")
-        await asyncio.sleep(base_delay + extra_delay)
-    else:
-        await asyncio.sleep(base_delay)
-
-
 def exponential_backoff(retry_count: int, base_wait: float = 1.0) -> float:
     """Calculate exponential backoff time based on retry count"""
     return base_wait * (2 ** retry_count) * (0.5 + random.random())
\ No newline at end of file
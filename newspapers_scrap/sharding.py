@@ -0,0 +1,98 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def describe_shard(shard: Dict[str, Any]) -> str:
+    """Short human-readable form of a shard's filters"""
+    parts = []
+    if shard.get('decade'):
+        parts.append(f"{shard['decade']}0s")
+    if shard.get('year'):
+        parts.append(shard['year'])
+    if shard.get('cantons'):
+        parts.append(f"ccq={','.join(shard['cantons'])}")
+    if shard.get('newspapers'):
+        parts.append(f"puq={','.join(shard['newspapers'])}")
+    return ' '.join(parts) or 'all results'
+
+
+class QuerySharder:
+    """
+    Recursive splitting of a search whose hits exceed max_results_per_search.
+
+    The archive only lets us walk the first ``max_results_per_search`` results
+    of a search. A decade is split into its years, then a year (or an undated
+    search) into one shard per canton (``ccq``), then a canton into one shard
+    per newspaper (``puq``). Every split is probed with count_results, which
+    goes through the scraper's cache and politeness scheduler, and only the
+    shards still above the cap are split further. Shards that cannot be split
+    any more are kept and flagged as truncated.
+    """
+
+    def __init__(self, scraper, cap: int, cantons: Optional[List[str]] = None,
+                 newspapers: Optional[List[str]] = None):
+        """
+        Initialize the sharder
+
+        Args:
+            scraper: NewspaperScraper used to probe the hit count of each shard
+            cap: Largest number of results a single search can reach
+            cantons: Canton codes splitting a search without canton filter
+            newspapers: Newspaper codes splitting a search without newspaper filter
+        """
+        self.scraper = scraper
+        self.cap = cap
+        self.cantons = cantons or []
+        self.newspapers = newspapers or []
+
+    def _children(self, shard: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Split a shard one level further, or return [] if it cannot be split"""
+        if shard.get('decade') and not shard.get('year'):
+            return [dict(shard, decade=None, year=f"{shard['decade']}{digit}") for digit in range(10)]
+
+        cantons = shard.get('cantons') or self.cantons
+        if len(cantons) > 1:
+            return [dict(shard, cantons=[canton]) for canton in cantons]
+
+        newspapers = shard.get('newspapers') or self.newspapers
+        if len(newspapers) > 1:
+            return [dict(shard, newspapers=[newspaper]) for newspaper in newspapers]
+        return []
+
+    async def split(self, query: str, shard: Dict[str, Any], total: int, laq: str = 'fr') -> List[Dict[str, Any]]:
+        """
+        Split a search until every shard fits under the cap
+
+        Args:
+            query: The search query text
+            shard: Filters of the search ('newspapers', 'cantons', 'decade', 'year')
+            total: Hit count of the search
+            laq: Language of the query
+
+        Returns:
+            Leaf shards with their filters, 'total_results' and 'truncated' flag
+        """
+        if total <= self.cap:
+            return [dict(shard, total_results=total, truncated=False)]
+
+        children = self._children(shard)
+        if not children:
+            logger.warning(f"Shard {describe_shard(shard)} has {total} results and cannot be split further, "
+                           f"only the first {self.cap} will be collected")
+            return [dict(shard, total_results=total, truncated=True)]
+
+        counts = await asyncio.gather(*(self.scraper.count_results(query, laq=laq, **child) for child in children))
+        covered = sum(counts)
+        logger.info(f"Split {describe_shard(shard)} ({total} results) into {len(children)} shards "
+                    f"covering {covered} results")
+        if covered < total:
+            logger.warning(f"Shards of {describe_shard(shard)} only cover {covered} of its {total} results")
+
+        leaves = []
+        for child, count in zip(children, counts):
+            if count:
+                leaves.extend(await self.split(query, child, count, laq))
+        return leaves
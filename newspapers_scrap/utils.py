@@ -5,6 +5,7 @@ import re
 
 import re
 import unicodedata
+import urllib.parse
 from datetime import datetime
 from dateutil import parser as date_parser
 import logging
@@ -143,6 +144,23 @@ def clean_and_parse_date(date_str, default_date=None):
     return default_date
 
 
+def normalize_url(url):
+    """
+    Normalize a URL so that equivalent requests compare equal
+
+    Lower-cases the scheme and host, sorts the query parameters and drops the fragment.
+    """
+    parsed = urllib.parse.urlsplit(url)
+    query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)))
+    return urllib.parse.urlunsplit((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path or '/',
+        query,
+        ''  # Fragments are never sent to the server
+    ))
+
+
 def generate_html_diff(original_text, corrected_text):
     """
     Generate HTML that highlights the differences between original and corrected text
@@ -0,0 +1,51 @@
+from pathlib import Path
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import logging_config
+import logging
+
+logger = logging.getLogger(__name__)
+import argparse
+import asyncio
+
+from newspapers_scrap.archive_server import ArchiveServer
+from newspapers_scrap.fixtures import FixtureStore
+
+
+async def async_main():
+    parser = argparse.ArgumentParser(description='Serve recorded or synthetic archive pages on localhost')
+    parser.add_argument('--fixtures', type=str, default=None, help='Directory of recorded pages to replay')
+    parser.add_argument('--synthetic', type=int, default=200,
+                        help='Hits of every synthetic search, used for pages without fixture (0 = fixtures only)')
+    parser.add_argument('--article_words', type=int, default=300, help='Length of the synthetic articles')
+    parser.add_argument('--latency', type=float, default=0.05, help='Mean delay per page in seconds')
+    parser.add_argument('--jitter', type=float, default=0.02, help='Delays vary by ± jitter seconds')
+    parser.add_argument('--error_rate', type=float, default=0.0, help='Share of page requests answered with an error')
+    parser.add_argument('--error_status', type=int, default=503, help='HTTP status of the injected errors')
+    parser.add_argument('--seed', type=int, default=None, help='Seed of the injected latency and errors')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8081, help='Port to listen on')
+    args = parser.parse_args()
+
+    server = ArchiveServer(fixtures=FixtureStore(args.fixtures) if args.fixtures else None,
+                           synthetic_results=args.synthetic, article_words=args.article_words,
+                           latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           error_status=args.error_status, seed=args.seed)
+    url = await server.start(args.host, args.port)
+    print(f"Serving archive pages on {url} (Ctrl+C to stop)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+        logger.info(f"Server stats: {server.stats}")
+
+
+def main():
+    try:
+        asyncio.run(async_main())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+from pathlib import Path
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import logging_config
+import logging
+
+logger = logging.getLogger(__name__)
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from newspapers_scrap.archive_server import ArchiveServer
+from newspapers_scrap.config.config import env
+from newspapers_scrap.fixtures import FixtureStore
+from newspapers_scrap.scraper import NewspaperScraper
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of values (0 if empty)"""
+    if not values:
+        return 0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB (None where unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+async def async_main():
+    parser = argparse.ArgumentParser(
+        description='Run save_articles_from_search against a local stand-in of the archive and report throughput')
+    parser.add_argument('query', nargs='?', default='benchmark', help='Search query text')
+    parser.add_argument('--fixtures', type=str, default=None,
+                        help='Directory of recorded pages to replay (FIXTURES.directory of a recording run)')
+    parser.add_argument('--synthetic', type=int, default=200,
+                        help='Hits of every synthetic search, used for pages without fixture (0 = fixtures only)')
+    parser.add_argument('--article_words', type=int, default=300, help='Length of the synthetic articles')
+    parser.add_argument('--latency', type=float, default=0.05, help='Mean server delay per page in seconds')
+    parser.add_argument('--jitter', type=float, default=0.02, help='Server delays vary by ± jitter seconds')
+    parser.add_argument('--error_rate', type=float, default=0.0,
+                        help='Share of page requests answered with an error (the scraper then falls back '
+                             'to Playwright, which must be installed)')
+    parser.add_argument('--server_url', type=str, default=None,
+                        help='Benchmark an already running server (scripts/archive_server.py) instead')
+    parser.add_argument('--max_articles', type=int, default=None, help='Maximum articles to retrieve')
+    parser.add_argument('--year', type=str, default=None, help='Year filter of the search')
+    parser.add_argument('--newspapers', type=str, nargs='+', help='Newspaper codes to search')
+    parser.add_argument('--cantons', type=str, nargs='+', help='Canton codes to search')
+    parser.add_argument('--laq', type=str, default='fr', help='Language for search query (default: fr)')
+    parser.add_argument('--delay', type=float, default=0.0,
+                        help='Politeness interval between requests in seconds (LIMITS.request_delay_min/max); '
+                             '0 also disables adaptive pacing and breaks')
+    parser.add_argument('--workers', type=int, default=None, help='Article fetches kept in flight')
+    parser.add_argument('--prefetch_pages', type=int, default=None, help='Search pages fetched ahead')
+    parser.add_argument('--cache', action='store_true', help='Keep the HTTP cache enabled')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the injected latency and errors')
+    parser.add_argument('--json', type=str, default=None, help='Also write the results to this JSON file')
+    args = parser.parse_args()
+
+    # Articles, checkpoints, URL index and politeness state of the run go to a scratch directory
+    workdir = tempfile.mkdtemp(prefix='newspapers-benchmark-')
+    json_path = os.path.abspath(args.json) if args.json else None
+    fixtures = FixtureStore(os.path.abspath(args.fixtures)) if args.fixtures else None
+    os.chdir(workdir)
+    logger.info(f"Benchmark data goes to {workdir}")
+
+    env.scraping.limits.request_delay_min = args.delay
+    env.scraping.limits.request_delay_max = args.delay
+    # Adaptive pacing needs a non-zero interval to adapt
+    env.scraping.pacing.enabled = env.scraping.pacing.enabled and args.delay > 0
+    env.scraping.http_cache.enabled = args.cache
+    env.scraping.fixtures.record = False
+    if args.workers:
+        env.scraping.concurrency.article_workers = args.workers
+
+    server = None
+    base_url = args.server_url
+    if not base_url:
+        server = ArchiveServer(fixtures=fixtures, synthetic_results=args.synthetic,
+                               article_words=args.article_words, latency=args.latency, jitter=args.jitter,
+                               error_rate=args.error_rate, seed=args.seed)
+        base_url = await server.start()
+
+    scraper = NewspaperScraper()
+    scraper.base_url = base_url.rstrip('/')
+    if not args.delay:
+        # No human-like breaks either: measure the scraper, not the politeness budget
+        scraper.scheduler.break_probability = 0
+    started = time.time()
+    try:
+        result = await scraper.save_articles_from_search(
+            args.query,
+            max_articles=args.max_articles,
+            newspapers=args.newspapers,
+            cantons=args.cantons,
+            year=args.year,
+            laq=args.laq,
+            prefetch_pages=args.prefetch_pages,
+            generate_report=False
+        )
+    finally:
+        duration = time.time() - started
+        if server:
+            await server.stop()
+
+    tracker = scraper.performance_tracker
+    results = {
+        'articles': result['count'],
+        'duration_seconds': round(duration, 2),
+        'articles_per_minute': round(result['count'] / duration * 60, 1) if duration else 0,
+        'requests': len(tracker.request_times),
+        'latency_p50_ms': round(percentile(tracker.request_times, 0.5) * 1000, 1),
+        'latency_p95_ms': round(percentile(tracker.request_times, 0.95) * 1000, 1),
+        'peak_rss_mb': peak_rss_mb(),
+        'errors': tracker.error_count,
+        'retries': tracker.retry_count,
+        'server': server.stats if server else None,
+    }
+    print(f"Articles:        {results['articles']} in {results['duration_seconds']}s "
+          f"({results['articles_per_minute']} articles/min)")
+    print(f"Request latency: p50 {results['latency_p50_ms']} ms, p95 {results['latency_p95_ms']} ms "
+          f"over {results['requests']} requests")
+    print(f"Peak RSS:        {results['peak_rss_mb']} MB (includes the in-process server)" if server
+          else f"Peak RSS:        {results['peak_rss_mb']} MB")
+    print(f"BENCHMARK: {json.dumps(results)}")
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+def main():
+    asyncio.run(async_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+from pathlib import Path
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import logging_config
+import logging
+
+logger = logging.getLogger(__name__)
+import argparse
+
+from newspapers_scrap.data_manager.storage import SqliteStorage, copy_storage, get_storage, json_storage
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Copy the stored articles, their versions and topics to a JSON tree or a SQLite database')
+    parser.add_argument('output', type=str,
+                        help='Directory receiving raw/, processed/, by_topic/ and blobs/ (json), or database file (sqlite)')
+    parser.add_argument('--format', type=str, choices=['json', 'sqlite'], default='json',
+                        help='Format of the copy (default: json)')
+    parser.add_argument('--source', type=str, choices=['configured', 'json'], default='configured',
+                        help="Storage to read: the configured STORE backend, or the JSON tree in the "
+                             "PATHS directories (to import it into a database)")
+    args = parser.parse_args()
+
+    source = get_storage() if args.source == 'configured' else json_storage()
+    target = json_storage(args.output) if args.format == 'json' else SqliteStorage(args.output)
+    copied = copy_storage(source, target)
+    logger.info(f"Copied {copied} articles to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
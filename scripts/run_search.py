@@ -14,6 +14,7 @@ if not logger.handlers:
     handler.setFormatter(formatter)
     logger.addHandler(handler)
 import argparse
+import json
 import os
 import time
 import asyncio
@@ -21,6 +22,7 @@ import asyncio
 from newspapers_scrap import scraper
 from newspapers_scrap.scraper import NewspaperScraper
 from newspapers_scrap.config.config import env
+from newspapers_scrap.planner import ORDERS, SearchPlanner
 from newspapers_scrap.security import ProxyManager
 
 # Variable globale pour stocker le scraper
@@ -80,9 +82,23 @@ async def async_main():
                         help='Disable spell correction')
     parser.add_argument('--all_time', action='store_true', help='Search all time')
     parser.add_argument('--start_from', type=int, default=0,
-                        help='Result number to start from (skip earlier results)')
+                        help='Result number to start from (skip earlier results); with --date_range, '
+                             'only the first period starts there')
+    parser.add_argument('--resume', action='store_true',
+                        help='Continue each period from its checkpoint (completed periods are skipped)')
+    parser.add_argument('--parallel_periods', type=int, default=None,
+                        help='Number of years or decades of --date_range searched concurrently '
+                             '(default: CONCURRENCY.parallel_periods)')
+    parser.add_argument('--plan', action='store_true',
+                        help='Probe the result count of every period of --date_range first and skip empty periods')
+    parser.add_argument('--plan_only', action='store_true',
+                        help='Print the plan of --date_range (SEARCH_PLAN line) and exit without scraping')
+    parser.add_argument('--plan_order', choices=ORDERS, default=None,
+                        help='Order in which planned periods run (default: PLANNER.order)')
 
     args = parser.parse_args()
+    if (args.plan or args.plan_only) and not args.date_range:
+        parser.error("--plan and --plan_only need --date_range")
     logger.debug('Searching for newspaper articles')
 
     # Create a single performance tracker for the entire search period
@@ -116,7 +132,6 @@ async def async_main():
     # Initialize proxy manager if needed
     proxy_manager = None
     if args.proxies:
-        import json
         try:
             with open(args.proxies, 'r') as f:
                 proxy_list = json.load(f)
@@ -127,21 +142,23 @@ async def async_main():
 
     # Track timing
     start_time = time.time()
-    all_results = []
+    total_articles = 0
+
+    # One scraper for every period of the run: the HTTP session, the browser and its
+    # context pool are started once and closed at the end, not after each year
+    current_scraper = NewspaperScraper(
+        apply_spell_correction=not args.no_correction,
+        correction_method=args.correction,
+    )
+
+    # Use the global tracker
+    current_scraper.performance_tracker = global_tracker
 
     try:
         if args.all_time:
             # Search without date filtering
             logger.info("Searching all time")
             try:
-                current_scraper = NewspaperScraper(
-                    apply_spell_correction=not args.no_correction,
-                    correction_method=args.correction,
-                )
-
-                # Use the global tracker
-                current_scraper.performance_tracker = global_tracker
-
                 results = await current_scraper.save_articles_from_search(
                     query=args.query,
                     output_dir=args.output,
@@ -149,19 +166,13 @@ async def async_main():
                     newspapers=args.newspapers,
                     cantons=args.cantons,
                     laq=args.laq,
-                    start_from=args.start_from
+                    start_from=args.start_from,
+                    resume=args.resume,
+                    close_when_done=False
                 )
-                if results:
-                    all_results.append(results)
+                total_articles += results['count']
             except Exception as e:
                 logger.error(f"Error in search: {e}")
-            finally:
-                # Ensure resources are properly closed
-                try:
-                    if current_scraper:
-                        await current_scraper._close_playwright()
-                except Exception as e:
-                    logger.error(f"Error closing scraper: {e}")
         else:
             # Process date range
             if args.date_range:
@@ -177,108 +188,89 @@ async def async_main():
                     if args.search_by == 'decade':
                         # Search by decades
                         logger.info("Using decade-based search")
+                        periods = []
                         for decade_start in range(start_year // 10 * 10, end_year + 1, 10):
                             decade = str(decade_start)[:3]  # Format: "197" for 1970s
                             decade_end = min(decade_start + 9, end_year)
-                            logger.info(f"Searching decade {decade}0s ({decade_start}-{decade_end})")
-                            completed_years += 1
-                            print(f"YEAR_PROGRESS: current_year={completed_years} total_years={total_years}")
-
-                            try:
-                                current_scraper = NewspaperScraper(
-                                    apply_spell_correction=not args.no_correction,
-                                    correction_method=args.correction,
-                                )
-
-                                # Use the global tracker
-                                current_scraper.performance_tracker = global_tracker
-
-                                # Vérifier le signal d'arrêt avant de commencer
-                                if check_stop_signal():
-                                    logger.info("Stopping search due to stop signal")
-                                    break
-
-                                # Search for the entire decade
-                                decade_results = await current_scraper.save_articles_from_search(
-                                    query=args.query,
-                                    output_dir=args.output,
-                                    max_articles=args.max_articles,
-                                    newspapers=args.newspapers,
-                                    cantons=args.cantons,
-                                    decade=decade,
-                                    laq=args.laq,
-                                    start_from=args.start_from
-                                )
-
-                                if decade_results:
-                                    all_results.append(decade_results)
-                            except Exception as e:
-                                logger.error(f"Error searching decade {decade}0s: {e}")
-                            finally:
-                                # Ensure resources are properly closed even if an error occurs
-                                try:
-                                    if current_scraper:
-                                        await current_scraper._close_playwright()
-                                except Exception as e:
-                                    logger.error(f"Error closing scraper: {e}")
+                            periods.append((f"decade {decade}0s ({decade_start}-{decade_end})", f"{decade}0s",
+                                            {'decade': decade}))
                     else:
                         # Search by individual years
                         logger.info("Using year-based search")
-                        for year in range(start_year, end_year + 1):
-                            logger.info(f"Searching year {year}")
-                            completed_years += 1
-                            print(f"YEAR_PROGRESS: current_year={completed_years} total_years={total_years}")
+                        periods = [(f"year {year}", str(year), {'year': str(year)})
+                                   for year in range(start_year, end_year + 1)]
+
+                    # start_from applies to the first period of the range only, whatever order they run in
+                    first_period = periods[0][1] if periods else None
+
+                    if args.plan or args.plan_only:
+                        # Probe every period's hit count before committing to the crawl
+                        planner = SearchPlanner(current_scraper, env.scraping.planner.probe_concurrency)
+                        plan = await planner.plan(
+                            args.query,
+                            [(period_name, period_filter) for _, period_name, period_filter in periods],
+                            newspapers=args.newspapers,
+                            cantons=args.cantons,
+                            laq=args.laq,
+                            max_articles=args.max_articles
+                        )
+                        logger.info(f"Search plan:\n{SearchPlanner.format_plan(plan)}")
+                        print(f"SEARCH_PLAN: {json.dumps(plan, ensure_ascii=False)}")
+                        if args.plan_only:
+                            return
+
+                        labels = {period_name: label for label, period_name, _ in periods}
+                        periods = [(labels[entry['period']], entry['period'], entry['filter'])
+                                   for entry in planner.order_periods(plan, args.plan_order or env.scraping.planner.order)]
+                        total_years = len(periods)
+                        print(f"SEARCH_SCOPE: total_years={total_years}")
+
+                    # Periods run as tasks of this event loop and share the scraper: its browser,
+                    # its politeness scheduler (one budget per host) and the global tracker
+                    parallel_periods = max(1, args.parallel_periods or env.scraping.concurrency.parallel_periods)
+                    if parallel_periods > 1:
+                        logger.info(f"Searching up to {parallel_periods} periods concurrently")
+                    period_slots = asyncio.Semaphore(parallel_periods)
+
+                    async def search_period(label, period_name, period_filter):
+                        nonlocal completed_years, total_articles
+                        async with period_slots:
+                            # Vérifier le signal d'arrêt avant de commencer
+                            if check_stop_signal():
+                                logger.info(f"Skipping {label} due to stop signal")
+                                return
+
+                            logger.info(f"Searching {label}")
                             try:
-                                current_scraper = NewspaperScraper(
-                                    apply_spell_correction=not args.no_correction,
-                                    correction_method=args.correction,
-                                )
-
-                                # Use the global tracker
-                                current_scraper.performance_tracker = global_tracker
-
-                                # Vérifier le signal d'arrêt avant de commencer
-                                if check_stop_signal():
-                                    logger.info("Stopping search due to stop signal")
-                                    break
-
-                                # Search for a specific year
-                                year_results = await current_scraper.save_articles_from_search(
+                                period_results = await current_scraper.save_articles_from_search(
                                     query=args.query,
                                     output_dir=args.output,
                                     max_articles=args.max_articles,
                                     newspapers=args.newspapers,
                                     cantons=args.cantons,
-                                    year=str(year),
                                     laq=args.laq,
-                                    start_from=args.start_from
+                                    start_from=args.start_from if period_name == first_period else 0,
+                                    resume=args.resume,
+                                    close_when_done=False,
+                                    **period_filter
                                 )
-
-                                if year_results:
-                                    all_results.append(year_results)
+                                total_articles += period_results['count']
                             except Exception as e:
-                                logger.error(f"Error searching year {year}: {e}")
-                            finally:
-                                # Ensure resources are properly closed even if an error occurs
-                                try:
-                                    if current_scraper:
-                                        await current_scraper._close_playwright()
-                                except Exception as e:
-                                    logger.error(f"Error closing scraper: {e}")
+                                logger.error(f"Error searching {label}: {e}")
+
+                            # Counted once the period is done: with parallel periods, starts
+                            # would run ahead of the periods actually finished
+                            completed_years += 1
+                            print(f"YEAR_PROGRESS: current_year={completed_years} total_years={total_years} "
+                                  f"period={period_name}")
+
+                    await asyncio.gather(*(search_period(*period) for period in periods))
                 except ValueError:
                     logger.error(f"Invalid date range format: {args.date_range}. Expected YYYY-YYYY")
                     return
             else:
                 # Standard search without date filtering
                 try:
-                    current_scraper = NewspaperScraper(
-                        apply_spell_correction=not args.no_correction,
-                        correction_method=args.correction,
-                    )
-
-                    # Use the global tracker
-                    current_scraper.performance_tracker = global_tracker
-
                     # Vérifier le signal d'arrêt avant de commencer
                     if check_stop_signal():
                         logger.info("Stopping search due to stop signal")
@@ -291,45 +283,38 @@ async def async_main():
                         newspapers=args.newspapers,
                         cantons=args.cantons,
                         laq=args.laq,
-                        start_from=args.start_from
+                        start_from=args.start_from,
+                        resume=args.resume,
+                        close_when_done=False
                     )
-                    if results:
-                        all_results.append(results)
+                    total_articles += results['count']
                 except Exception as e:
                     logger.error(f"Error in search: {e}")
-                finally:
-                    # Ensure resources are properly closed
-                    try:
-                        if current_scraper:
-                            await current_scraper._close_playwright()
-                    except Exception as e:
-                        logger.error(f"Error closing scraper: {e}")
 
     except Exception as e:
         logger.error(f"Unhandled exception during search: {e}")
     finally:
+        # Ensure resources are properly closed
+        try:
+            await current_scraper.close()
+        except Exception as e:
+            logger.error(f"Error closing scraper: {e}")
+
         # Stop tracking and generate a comprehensive report
         global_tracker.stop_tracking()
         summary = global_tracker.generate_summary()
 
-        # Generate the report with aggregated data from all years
-        report_generator = ScrapingReportGenerator(output_dir=f"{output_dir}/reports" if output_dir else "reports")
-        try:
-            report_path = report_generator.generate_report(summary, query=search_query)
-            logger.info(f"Generated comprehensive report for entire search period at: {report_path}")
-        except Exception as e:
-            logger.error(f"Failed to generate report: {e}")
+        # Generate the report with aggregated data from all years (nothing was scraped when only planning)
+        if not args.plan_only:
+            report_generator = ScrapingReportGenerator(output_dir=f"{output_dir}/reports" if output_dir else "reports")
+            try:
+                report_path = report_generator.generate_report(summary, query=search_query)
+                logger.info(f"Generated comprehensive report for entire search period at: {report_path}")
+            except Exception as e:
+                logger.error(f"Failed to generate report: {e}")
 
     # Print summary
     duration = time.time() - start_time
-    total_articles = 0
-    if all_results:
-        for result in all_results:
-            if isinstance(result, dict) and 'count' in result:
-                total_articles += result['count']
-            elif isinstance(result, list):
-                # If result is a list, count its length
-                total_articles += len(result)
     logger.info(f"Processing complete. {total_articles} articles processed in {duration:.2f} seconds")
 
 